@@ -0,0 +1,54 @@
+"""
+比较 ``Bot.call_api`` 调用前后的开销：每次反射签名并使用 ``parse_obj_as``（旧方式），
+与使用导入时构建的方法注册表。
+
+运行：``python benchmarks/bench_call_api.py``
+"""
+import inspect
+from functools import partial
+
+from common import bench
+from pydantic import parse_obj_as
+
+from nonebot.adapters.telegram.api import API
+from nonebot.adapters.telegram.registry import API_METHODS
+
+result = {
+    "message_id": 1365,
+    "date": 1441645532,
+    "chat": {"id": -1001234567890, "type": "supergroup", "title": "Test Group"},
+    "text": "Hello world",
+}
+
+
+class FakeBot:
+    async def call_api(self, api: str, *args, **kargs):
+        pass
+
+
+bot = FakeBot()
+
+
+def reflection() -> None:
+    partial(bot.call_api, "send_message")
+    sign = inspect.signature(getattr(API, "send_message"))
+    args_ = [1, "Hello world"]
+    kargs = {}
+    for param in sign.parameters.values():
+        if param.name != "self" and param.name not in kargs:
+            try:
+                kargs[param.name] = args_.pop(0)
+            except IndexError:
+                kargs[param.name] = None
+    parse_obj_as(sign.return_annotation, result)
+
+
+def registry() -> None:
+    method = API_METHODS["send_message"]
+    method.bind((1, "Hello world"), {})
+    method.parse_result(result)
+
+
+if __name__ == "__main__":
+    bench("send_message: reflection", reflection, 5000)
+    bench("send_message: registry", registry, 5000)
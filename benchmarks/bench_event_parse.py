@@ -0,0 +1,35 @@
+"""
+测量 ``tests/updates.json`` 中每个更新从原始 JSON 解析为具体事件类型的耗时。
+
+运行：``python benchmarks/bench_event_parse.py``
+"""
+import json
+
+from common import bench, load_updates
+
+from nonebot.adapters.telegram.event import Event
+
+updates = load_updates()
+# 补充服务消息，覆盖通知事件的分发
+updates.append(
+    {
+        "update_id": 10000,
+        "message": {
+            "date": 1441645532,
+            "chat": {"id": -1111111, "type": "group", "title": "Test Group"},
+            "message_id": 1365,
+            "from": {"id": 1111111, "first_name": "Test Firstname", "is_bot": False},
+            "new_chat_title": "Test Title",
+        },
+    }
+)
+
+if __name__ == "__main__":
+    for i, update in enumerate(updates):
+        raw = json.dumps(update)
+        post_type = next(key for key in update if key != "update_id")
+        event_type = type(Event.parse_event(json.loads(raw))).__name__
+        bench(
+            f"{i:>2} {post_type} -> {event_type}",
+            lambda: Event.parse_event(json.loads(raw)),
+        )
@@ -0,0 +1,49 @@
+"""
+比较标准库与 orjson 解析大批量 ``getUpdates`` 响应和序列化 ``sendMediaGroup`` 参数的耗时。
+
+运行：``python benchmarks/bench_json_codec.py``
+"""
+from common import bench, load_updates
+
+from nonebot.adapters.telegram.model import MessageEntity, InputMediaPhoto
+from nonebot.adapters.telegram.codec import JSONCodec, OrjsonCodec, StdlibJSONCodec
+
+updates = load_updates()
+codecs = [StdlibJSONCodec()]
+try:
+    codecs.append(OrjsonCodec())
+except ImportError:
+    print("orjson is not installed, only the stdlib codec is measured")
+
+# 100 个更新的 getUpdates 响应
+response = StdlibJSONCodec().dumpb(
+    {"ok": True, "result": [updates[i % len(updates)] for i in range(100)]}
+)
+# 10 张图片的媒体组
+media = [
+    InputMediaPhoto(
+        media=f"AgACAgUAAxkBAAI{i:04d}",
+        caption="照片 caption " * 10,
+        caption_entities=[
+            MessageEntity(type="bold", offset=0, length=2),
+            MessageEntity(type="url", offset=3, length=7),
+        ],
+    )
+    for i in range(10)
+]
+
+
+def run(codec: JSONCodec) -> None:
+    bench(f"{codec.name}: loads getUpdates x100", lambda: codec.loads(response), 200)
+    bench(
+        f"{codec.name}: loads memoryview",
+        lambda: codec.loads(memoryview(response)),
+        200,
+    )
+    bench(f"{codec.name}: dumps sendMediaGroup x10", lambda: codec.dumps(media))
+
+
+if __name__ == "__main__":
+    print(f"getUpdates response: {len(response)} bytes")
+    for codec in codecs:
+        run(codec)
@@ -0,0 +1,68 @@
+"""
+比较填充 ``original_message`` 时深拷贝与保留原始数据（首次访问时解析）的耗时和内存，
+分别统计不访问和访问 ``original_message`` 两种情况。
+
+运行：``python benchmarks/bench_original_message.py``
+"""
+import json
+import tracemalloc
+from copy import deepcopy
+from typing import Any, List, Callable
+
+from common import bench, load_updates
+
+from nonebot.adapters.telegram.event import Event
+from nonebot.adapters.telegram.message import Message
+
+raw = json.dumps([update for update in load_updates() if "message" in update])
+objs = [update["message"] for update in json.loads(raw) for _ in range(3)]
+messages = [Message.parse_obj(dict(obj)) for obj in objs]
+
+
+def allocated(func: Callable[[], List[Any]]) -> int:
+    """返回 ``func`` 返回的对象占用的内存"""
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def parse_on_access() -> List[Message]:
+    """保留原始数据并在访问时解析，与 MessageEvent 的处理相同"""
+    return [Message.parse_obj(dict(raw_obj)) for raw_obj in [dict(o) for o in objs]]
+
+
+if __name__ == "__main__":
+    count = len(messages)
+    deep = bench(
+        f"deepcopy ({count} messages)", lambda: [deepcopy(m) for m in messages]
+    )
+    lazy = bench(f"raw dict ({count} messages)", lambda: [dict(obj) for obj in objs])
+    accessed = bench(f"raw dict + access ({count} messages)", parse_on_access)
+    print(f"time saved {(deep - lazy) / count * 1e6:.2f} us per message if not read")
+    print(f"time saved {(deep - accessed) / count * 1e6:.2f} us per message if read")
+
+    deep_mem = allocated(lambda: [deepcopy(m) for m in messages]) / count
+    lazy_mem = allocated(lambda: [dict(obj) for obj in objs]) / count
+    accessed_mem = allocated(parse_on_access) / count
+    print(
+        f"memory: deepcopy {deep_mem:.0f} B, raw dict {lazy_mem:.0f} B, "
+        f"raw dict + access {accessed_mem:.0f} B per message"
+    )
+
+    updates = json.loads(raw)
+    bench(
+        f"Event.parse_event ({len(updates)} updates)",
+        lambda: [Event.parse_event(update) for update in json.loads(raw)],
+        200,
+    )
+    bench(
+        f"parse_event + original_message ({len(updates)} updates)",
+        lambda: [
+            Event.parse_event(update).original_message  # type: ignore
+            for update in json.loads(raw)
+        ],
+        200,
+    )
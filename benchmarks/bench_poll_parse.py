@@ -0,0 +1,46 @@
+"""
+比较 long polling 中两种更新处理路径每个更新的 CPU 耗时：
+
+- ``model``: 原始 JSON -> ``List[Update]`` -> ``Update.dict()`` -> ``Event.parse_event``
+- ``raw``: 原始 JSON -> ``Event.parse_event``
+
+运行：``python benchmarks/bench_poll_parse.py``
+"""
+import json
+from typing import List
+
+from common import bench, load_updates
+from pydantic import ValidationError, parse_obj_as
+
+from nonebot.adapters.telegram.event import Event
+from nonebot.adapters.telegram.model import Update
+
+
+def _valid(update: dict) -> bool:
+    try:
+        Update.parse_obj(update)
+    except ValidationError:
+        return False
+    return True
+
+
+# 只取能通过 Update 校验的更新，模拟一批 getUpdates 的结果
+batch = json.dumps([update for update in load_updates() if _valid(update)])
+count = len(json.loads(batch))
+
+
+def model_path():
+    for update in parse_obj_as(List[Update], json.loads(batch)):
+        Event.parse_event(update.dict(by_alias=True, exclude_none=True))
+
+
+def raw_path():
+    for update in json.loads(batch):
+        Event.parse_event(update)
+
+
+if __name__ == "__main__":
+    print(f"batch of {count} updates")
+    model = bench("model", model_path, 200) / count
+    raw = bench("raw", raw_path, 200) / count
+    print(f"saved {(model - raw) * 1e6:.2f} us per update ({1 - raw / model:.0%})")
@@ -0,0 +1,68 @@
+"""
+比较回复消息在不访问和访问 ``reply_to_message`` 时的解析耗时和内存，
+访问时的开销即为解析事件时立即解析被回复消息的开销。
+
+运行：``python benchmarks/bench_reply_parse.py``
+"""
+import json
+import tracemalloc
+from typing import Any, List, Callable
+
+from common import bench
+
+from nonebot.adapters.telegram.event import Event
+
+chat = {"id": -1111111, "type": "supergroup", "title": "Test Group"}
+sender = {"id": 1111111, "first_name": "Test Firstname", "is_bot": False}
+reply = {
+    "update_id": 10000,
+    "message": {
+        "date": 1441645532,
+        "chat": chat,
+        "message_id": 1366,
+        "from": sender,
+        "text": "reply",
+        "reply_to_message": {
+            "date": 1441645000,
+            "chat": chat,
+            "message_id": 1365,
+            "from": {**sender, "id": 1111112},
+            "text": "Original " * 20,
+            "reply_to_message": {
+                "date": 1441644000,
+                "chat": chat,
+                "message_id": 1364,
+                "from": sender,
+                "text": "Earlier " * 20,
+            },
+        },
+    },
+}
+raw = json.dumps(reply)
+
+
+def parse() -> Event:
+    return Event.parse_event(json.loads(raw))
+
+
+def parse_and_access() -> Event:
+    event = parse()
+    event.reply_to_message.reply_to_message  # type: ignore
+    return event
+
+
+def allocated(func: Callable[[], Any], number: int = 100) -> float:
+    """返回 ``func`` 返回的对象平均占用的内存"""
+    tracemalloc.start()
+    results: List[Any] = [func() for _ in range(number)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size / number
+
+
+if __name__ == "__main__":
+    bench("lazy (reply not accessed)", parse)
+    bench("accessed (eager equivalent)", parse_and_access)
+    print(f"memory: lazy {allocated(parse):.0f} B per event")
+    print(f"memory: accessed {allocated(parse_and_access):.0f} B per event")
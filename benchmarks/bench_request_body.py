@@ -0,0 +1,68 @@
+"""
+比较 API 请求体的两种序列化方式：先将每个非字符串参数序列化为字符串再序列化整个请求体（旧方式），
+与一次性序列化整个请求体。
+
+运行：``python benchmarks/bench_request_body.py``
+"""
+import json
+from typing import Any, Dict
+
+from common import bench
+
+from nonebot.adapters.telegram.codec import get_json_codec
+from nonebot.adapters.telegram.model import (
+    MessageEntity,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+)
+
+codec = get_json_codec("auto")
+markup = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton(text=f"选项 {row}-{col}", callback_data=f"{row}:{col}")
+            for col in range(3)
+        ]
+        for row in range(3)
+    ]
+)
+entities = [
+    MessageEntity(type="bold", offset=0, length=5),
+    MessageEntity(type="text_link", offset=6, length=4, url="https://nonebot.dev/"),
+]
+calls: Dict[str, Dict[str, Any]] = {
+    "send_message": {
+        "chat_id": -1001234567890,
+        "text": "Hello world, this is a reply with a keyboard.",
+        "entities": entities,
+        "reply_markup": markup,
+        "disable_notification": True,
+    },
+    "edit_message_text": {
+        "chat_id": -1001234567890,
+        "message_id": 1365,
+        "text": "Edited text with entities.",
+        "entities": entities,
+        "reply_markup": markup,
+    },
+}
+
+
+def per_field(data: Dict[str, Any]) -> bytes:
+    fields = {
+        key: value if isinstance(value, str) else codec.dumps(value)
+        for key, value in data.items()
+    }
+    # 与 HTTP 客户端序列化 json= 参数的方式相同
+    return json.dumps(fields).encode()
+
+
+def single_pass(data: Dict[str, Any]) -> bytes:
+    return codec.dumpb(data)
+
+
+if __name__ == "__main__":
+    print(f"codec: {codec.name}")
+    for name, data in calls.items():
+        bench(f"{name}: per field", lambda: per_field(data), 5000)
+        bench(f"{name}: single pass", lambda: single_pass(data), 5000)
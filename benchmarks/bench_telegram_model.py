@@ -0,0 +1,63 @@
+"""
+比较 ``telegram_model`` 延迟构建（不访问）、访问（等同于立即构建）和关闭时，
+每个事件的解析耗时和保留的内存。
+
+运行：``python benchmarks/bench_telegram_model.py``
+"""
+import json
+import tracemalloc
+from typing import Any, List, Callable
+
+from common import bench, load_updates
+
+from nonebot.adapters.telegram.event import Event
+from nonebot.adapters.telegram.model import Update
+
+
+def is_valid(update: dict) -> bool:
+    # tests/updates.json 中部分更新缺少字段，无法构建 Update 模型
+    try:
+        Update.parse_obj(update)
+    except ValueError:
+        return False
+    return True
+
+
+raw = json.dumps([update for update in load_updates() if is_valid(update)])
+count = len(json.loads(raw))
+
+
+def lazy() -> List[Event]:
+    return [Event.parse_event(update) for update in json.loads(raw)]
+
+
+def accessed() -> List[Event]:
+    events = lazy()
+    for event in events:
+        event.telegram_model
+    return events
+
+
+def off() -> List[Event]:
+    events = lazy()
+    for event in events:
+        setattr(event, "telegram_model", None)
+    return events
+
+
+def retained(func: Callable[[], List[Any]], number: int = 50) -> float:
+    """返回 ``func`` 返回的事件平均保留的内存"""
+    tracemalloc.start()
+    results = [func() for _ in range(number)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size / number / count
+
+
+if __name__ == "__main__":
+    for name, func in (("lazy", lazy), ("accessed", accessed), ("off", off)):
+        elapsed = bench(f"{name} ({count} updates)", func, 200)
+        print(
+            f"{'':<4}{elapsed / count * 1e6:.2f} us, {retained(func):.0f} B per event"
+        )
@@ -0,0 +1,56 @@
+"""
+比较上传文件时生成 multipart 请求体的内存峰值：先将文件读入内存（旧方式），
+与将打开的文件对象交给 HTTP 客户端分块读取。
+
+运行：``python benchmarks/bench_upload_memory.py``
+"""
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, Callable, Awaitable
+
+import anyio
+import httpx
+from common import ROOT  # noqa: F401
+
+from nonebot.adapters.telegram.upload import UploadFiles
+
+SIZES = [1, 16, 64]  # MiB
+
+
+async def read_bytes(path: Path) -> Dict[str, Any]:
+    return {path.name: (path.name, await anyio.Path(path).read_bytes())}
+
+
+async def stream(path: Path) -> Dict[str, Any]:
+    uploads = UploadFiles()
+    await uploads.add(str(path))
+    return uploads.files
+
+
+def peak(files_of: Callable[[Path], Awaitable[Dict[str, Any]]], path: Path) -> int:
+    """生成并读取整个请求体，返回内存峰值（字节）"""
+
+    async def main() -> None:
+        files = await files_of(path)
+        request = httpx.Request("POST", "https://api.telegram.org/", files=files)
+        for _ in request.stream:  # type: ignore
+            pass
+
+    tracemalloc.start()
+    anyio.run(main)
+    _, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_size
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        for size in SIZES:
+            path = Path(directory) / f"{size}.bin"
+            path.write_bytes(b"\0" * size * 1024 * 1024)
+            for name, files_of in (("read bytes", read_bytes), ("stream", stream)):
+                print(
+                    f"{size:>3} MiB: {name:<30} "
+                    f"{peak(files_of, path) / 1024 / 1024:>8.2f} MiB peak"
+                )
@@ -0,0 +1,25 @@
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Callable
+
+import nonebot.adapters
+
+ROOT = Path(__file__).parent.parent
+
+# 与 tests/conftest.py 相同，使用仓库中的适配器而不是已安装的版本
+nonebot.adapters.__path__.append(  # type: ignore
+    str((ROOT / "nonebot" / "adapters").resolve())
+)
+
+
+def load_updates() -> List[Dict[str, Any]]:
+    with (ROOT / "tests" / "updates.json").open("r", encoding="utf8") as f:
+        return json.load(f)
+
+
+def bench(name: str, func: Callable[[], Any], number: int = 1000) -> float:
+    """运行 ``func`` 并打印单次耗时，返回单次耗时（秒）"""
+    elapsed = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<40} {elapsed * 1e6:>10.2f} us")
+    return elapsed
@@ -1,16 +1,11 @@
 from pathlib import Path
 
-import anyio
-from httpx import AsyncClient
-
 from nonebot import on_command
 from nonebot.adapters.telegram import Bot
 from nonebot.adapters.telegram.message import File
 from nonebot.adapters.telegram.event import MessageEvent
 
 DATA_PATH = Path.cwd() / "download"
-if not DATA_PATH.exists():
-    DATA_PATH.mkdir(parents=True)
 
 
 @on_command("download").handle()
@@ -20,18 +15,22 @@ async def _(bot: Bot, event: MessageEvent):
     ):
         if isinstance(seg, File):
             file_id = seg.data["file"]
-            file = await bot.get_file(file_id=file_id)
-            file_path = file.file_path
-            if not file_path:
-                return
-
-            if Path(file_path).exists():
-                # 本地搭建的 Telegram Bot API 会传给你本地的文件路径
-                data = await anyio.Path(file_path).read_bytes()
-
-            else:
-                url = f"https://api.telegram.org/file/bot{bot.bot_config.token}/{file_path}"
-                async with AsyncClient() as c:
-                    data = (await c.get(url)).content
-
-            await anyio.Path(DATA_PATH / file_path).write_bytes(data)
+            # 逐块写入文件，本地搭建的 Telegram Bot API 返回的本地文件直接复制
+            # 启用下载缓存时，传入 file_unique_id 可以在命中缓存时跳过 get_file
+            await bot.download_file(
+                file_id,
+                DATA_PATH / file_id,
+                file_unique_id=seg.data.get("file_unique_id"),
+            )
+            await bot.send(event, "已下载")
+
+
+# 逐块处理文件内容，不保存到磁盘
+@on_command("size").handle()
+async def _(bot: Bot, event: MessageEvent):
+    for seg in event.get_message():
+        if isinstance(seg, File):
+            size = 0
+            async for chunk in bot.iter_file(seg.data["file"]):
+                size += len(chunk)
+            await bot.send(event, f"{size} 字节")
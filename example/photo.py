@@ -70,3 +70,10 @@ async def _(bot: Bot, event: MessageEvent):
             ),
         ],
     )
+
+
+# 用文件对象发送文件，上传时分块读取，不会一次性读入内存
+@on_command("document").handle()
+async def _(bot: Bot, event: MessageEvent):
+    with open("./docs/logo.png", "rb") as f:
+        await bot.send(event, File.document(f))
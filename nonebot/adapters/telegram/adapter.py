@@ -1,21 +1,52 @@
-import json
+import hmac
+import time
 import asyncio
-from typing import Any, Dict, List, Tuple, Union, Iterable, Optional, cast
+from functools import partial
+from typing import Any, Set, Dict, List, Type, Union, Optional
 
-import anyio
-from pydantic.main import BaseModel
+from nonebot.rule import IsTypeRule
+from nonebot.matcher import matchers
 from nonebot.typing import overrides
-from pydantic.json import pydantic_encoder
 from nonebot.utils import escape_tag, logger_wrapper
 from nonebot.drivers import URL, Driver, Request, Response, HTTPServerSetup
 
+from nonebot.adapters import Bot as BaseBot
 from nonebot.adapters import Adapter as BaseAdapter
 
 from .bot import Bot
-from .event import Event
+from .stats import PollStats
+from .retry import RetryPolicy
+from .upload import UploadFiles
 from .config import AdapterConfig
-from .model import InputFile, InputMedia
-from .exception import ActionFailed, NetworkError, ApiNotAvailable
+from .dispatcher import Dispatcher
+from .model import ResponseParameters
+from .registry import API_METHODS, to_camel
+from .codec import JSONCodec, get_json_codec
+from .ratelimit import RateLimiter, is_limited
+from .download import DownloadCache, FileDownloader
+from .fileid import FileIdCache, get_file_id_backend
+from .dedup import UpdateDeduplicator, get_dedup_backend
+from .webhook import WebhookReply, current_webhook_reply
+from .health import BotHealth, CircuitBreaker, backoff_delay
+from .offset import OffsetStore, OffsetTracker, get_offset_store
+from .exception import (
+    BadRequest,
+    ServerError,
+    ActionFailed,
+    NetworkError,
+    ApiNotAvailable,
+    get_action_failed,
+)
+from .event import (
+    Event,
+    InlineEvent,
+    NoticeEvent,
+    MessageEvent,
+    RequestEvent,
+    EditedMessageEvent,
+    get_lazy_fields,
+    get_update_types,
+)
 
 
 def _escape_none(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -24,13 +55,96 @@ def _escape_none(data: Dict[str, Any]) -> Dict[str, Any]:
 
 log = logger_wrapper("Telegram")
 
+# 事件响应器类型对应的事件基类
+_MATCHER_EVENT_TYPES: Dict[str, Type[Event]] = {
+    "message": MessageEvent,
+    "edit_message": EditedMessageEvent,
+    "notice": NoticeEvent,
+    "request": RequestEvent,
+    "inline": InlineEvent,
+}
+
+
+def _get_allowed_updates_from_matchers() -> List[str]:
+    """根据已加载的事件响应器推断需要接收的更新类型"""
+    update_types: Set[str] = set()
+    for matcher in (m for ms in matchers.values() for m in ms):
+        type_rules = [
+            checker.call
+            for checker in matcher.rule.checkers
+            if isinstance(checker.call, IsTypeRule)
+        ]
+        if type_rules:
+            for rule in type_rules:
+                for event_type in rule.types:
+                    update_types |= get_update_types(event_type)
+        else:
+            update_types |= get_update_types(
+                _MATCHER_EVENT_TYPES.get(matcher.type, Event)
+            )
+    return sorted(update_types or get_update_types(Event))
+
 
 class Adapter(BaseAdapter):
     @overrides(BaseAdapter)
     def __init__(self, driver: Driver, **kwargs: Any):
         super().__init__(driver, **kwargs)
         self.adapter_config = AdapterConfig(**self.config.dict())
+        self.json: JSONCodec = get_json_codec(self.adapter_config.telegram_json_codec)
         self.tasks: List[asyncio.Task] = []
+        self.poll_stats: Dict[str, PollStats] = {}
+        self.bot_health: Dict[str, BotHealth] = {}
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.webhook_bots: Dict[str, Bot] = {}
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self.retry_policy = RetryPolicy(
+            self.adapter_config.telegram_retry_max,
+            self.adapter_config.telegram_retry_after_max,
+            self.adapter_config.telegram_retry_backoff_base,
+            self.adapter_config.telegram_retry_backoff_max,
+        )
+        self.offset_store: OffsetStore = get_offset_store(
+            self.adapter_config.telegram_offset_store,
+            self.adapter_config.telegram_offset_store_path,
+        )
+        self.offset_trackers: Dict[str, OffsetTracker] = {}
+        self.deduplicator: Optional[UpdateDeduplicator] = (
+            UpdateDeduplicator(
+                get_dedup_backend(
+                    self.adapter_config.telegram_dedup_backend,
+                    self.adapter_config.telegram_dedup_path,
+                    self.adapter_config.telegram_dedup_size,
+                    self.adapter_config.telegram_dedup_ttl,
+                )
+            )
+            if self.adapter_config.telegram_dedup_backend
+            else None
+        )
+        self.file_id_cache: Optional[FileIdCache] = (
+            FileIdCache(
+                get_file_id_backend(
+                    self.adapter_config.telegram_file_id_cache,
+                    self.adapter_config.telegram_file_id_cache_path,
+                    self.adapter_config.telegram_file_id_cache_size,
+                    self.adapter_config.telegram_file_id_cache_ttl,
+                )
+            )
+            if self.adapter_config.telegram_file_id_cache
+            else None
+        )
+        self.download_cache: Optional[DownloadCache] = (
+            DownloadCache(
+                self.adapter_config.telegram_download_cache_dir,
+                self.adapter_config.telegram_download_cache_size,
+            )
+            if self.adapter_config.telegram_download_cache_dir
+            else None
+        )
+        self.downloader = FileDownloader(self, self.download_cache)
+        self.dispatcher = Dispatcher(
+            self.adapter_config.telegram_dispatch_workers,
+            self.adapter_config.telegram_dispatch_queue_size,
+        )
         self.setup()
 
     @classmethod
@@ -38,21 +152,48 @@ class Adapter(BaseAdapter):
     def get_name(cls) -> str:
         return "Telegram"
 
-    async def __handle_update(self, bot: Bot, update: Dict[str, Any]):
+    def __parse_update(self, update: Dict[str, Any]) -> Optional[Event]:
         try:
             event = Event.parse_event(update)
         except Exception as e:
             log("ERROR", f"Error when parsing event {update}", e)
-            return
+            return None
+        if not self.adapter_config.telegram_update_model:
+            # 不再保留原始数据
+            setattr(event, "telegram_model", None)
 
+        # 不输出延迟解析的字段，避免每个事件都被完整解析
         log(
             "DEBUG",
-            escape_tag(str(event.dict(exclude_none=True, exclude={"telegram_model"}))),
+            escape_tag(
+                str(event.dict(exclude_none=True, exclude=get_lazy_fields(type(event))))
+            ),
         )
-        await bot.handle_event(event)
+        return event
+
+    def __get_allowed_updates(self, bot: Bot) -> Optional[List[str]]:
+        allowed_updates = bot.bot_config.allowed_updates
+        if allowed_updates == "auto":
+            return _get_allowed_updates_from_matchers()
+        return allowed_updates
+
+    def __get_rate_limiter(self, bot: Bot) -> RateLimiter:
+        if (limiter := self.rate_limiters.get(bot.self_id)) is None:
+            limiter = self.rate_limiters[bot.self_id] = RateLimiter(
+                (self.adapter_config.telegram_rate_limit_global, 1),
+                (self.adapter_config.telegram_rate_limit_private, 1),
+                (self.adapter_config.telegram_rate_limit_group, 60),
+            )
+        return limiter
 
     async def __bot_pre_setup(self, bot: Bot):
         bot.username = (await bot.get_me()).username
+        bot.allowed_updates = self.__get_allowed_updates(bot)
+        if bot.allowed_updates is not None:
+            log(
+                "INFO",
+                f"Bot {bot.self_id} receives updates: {', '.join(bot.allowed_updates)}",
+            )
         log("INFO", "Delete old webhook")
         await bot.delete_webhook()
 
@@ -63,14 +204,38 @@ class Adapter(BaseAdapter):
                 await self.__bot_pre_setup(bot)
                 log("INFO", "Set new webhook")
                 await bot.set_webhook(
-                    url=f"{self.adapter_config.telegram_webhook_url}/telegram",
+                    url=f"{self.adapter_config.telegram_webhook_url}/telegram/{bot.self_id}",
                     secret_token=bot.secret_token,
+                    allowed_updates=bot.allowed_updates,
                 )
                 self.bot_connect(bot)
+                self.webhook_bots[bot.secret_token] = bot
             except Exception as e:
                 log("ERROR", f"Setup for bot {bot.self_id} failed", e)
                 raise
 
+    async def __fetch_updates(
+        self,
+        bot: Bot,
+        offset: Optional[int],
+        received_at: Optional[float],
+    ) -> List[Dict[str, Any]]:
+        start = time.perf_counter()
+        try:
+            # 跳过 Bot.call_api 中的 Update 模型转换，直接取得原始 JSON，交给事件解析校验
+            return await BaseBot.call_api(
+                bot,
+                "get_updates",
+                offset=offset,
+                timeout=30,
+                allowed_updates=bot.allowed_updates,
+            )
+        finally:
+            self.poll_stats[bot.self_id].record_fetch(
+                time.perf_counter() - start,
+                start - received_at if received_at is not None else 0.0,
+            )
+
     async def poll(self, bot: Bot):
         try:
             await self.__bot_pre_setup(bot)
@@ -80,22 +245,128 @@ class Adapter(BaseAdapter):
             log("ERROR", f"Setup for bot {bot.self_id} failed", e)
             raise
 
-        update_offset = None
-        while True:
-            try:
-                updates = await bot.get_updates(offset=update_offset, timeout=30)
-                if update_offset is not None:
+        stats = self.poll_stats.setdefault(bot.self_id, PollStats())
+        health = self.bot_health.setdefault(bot.self_id, BotHealth())
+        breaker = self.circuit_breakers.setdefault(
+            bot.bot_config.api_server,
+            CircuitBreaker(
+                self.adapter_config.telegram_circuit_breaker_threshold,
+                self.adapter_config.telegram_circuit_breaker_timeout,
+            ),
+        )
+        try:
+            saved_offset = await self.offset_store.load(bot.self_id)
+        except Exception as e:
+            log("ERROR", f"Load update offset for bot {bot.self_id} failed", e)
+            saved_offset = None
+        tracker = self.offset_trackers[bot.self_id] = OffsetTracker(saved_offset)
+        # offset 前移后立即保存，不等待下一次 getUpdates 返回
+        saver = asyncio.create_task(self.__save_offsets(bot.self_id, tracker))
+        # 提前发起的 getUpdates 会向 Telegram 确认整个批次，
+        # 使用持久化的 offset 存储时默认等待批次处理完成后再拉取，重启后不会丢失未处理完成的更新
+        pipeline = self.adapter_config.telegram_poll_pipeline
+        if pipeline is None:
+            pipeline = self.adapter_config.telegram_offset_store == "memory"
+        update_offset = saved_offset
+        next_updates: Optional["asyncio.Task[List[Dict[str, Any]]]"] = None
+        # 上一个批次的接收时间，用于统计下一次 getUpdates 被本地处理推迟的时间
+        received_at: Optional[float] = None
+        try:
+            while True:
+                # API 服务器熔断期间不发起请求
+                if not next_updates and (wait := breaker.remaining):
+                    await asyncio.sleep(wait)
+                fetching = next_updates or asyncio.create_task(
+                    self.__fetch_updates(bot, update_offset, received_at)
+                )
+                next_updates = None
+                try:
+                    updates = await fetching
+                except Exception as e:
+                    # 失败后的退避等待不计入处理推迟的时间
+                    received_at = None
+                    health.record_failure(e)
+                    # 只有网络错误和服务器错误说明 API 服务器不可用，
+                    # 令牌失效等机器人自身的错误不应暂停同一服务器上的其他机器人
+                    if isinstance(e, NetworkError):
+                        breaker.record_failure()
+                    delay = backoff_delay(
+                        health.consecutive_failures,
+                        self.adapter_config.telegram_poll_backoff_base,
+                        self.adapter_config.telegram_poll_backoff_max,
+                    )
+                    log(
+                        "ERROR",
+                        f"Get updates for bot {bot.self_id} failed "
+                        f"{health.consecutive_failures} times, "
+                        f"retry in {max(delay, breaker.remaining):.1f}s",
+                        e,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                health.record_success()
+                breaker.record_success()
+                received_at = time.perf_counter()
+                if not updates:
+                    continue
+
+                update_offset = updates[-1]["update_id"] + 1
+                if pipeline:
+                    # 已知新的 offset，立即发起下一次 getUpdates，与本批次的处理并行
+                    next_updates = asyncio.create_task(
+                        self.__fetch_updates(bot, update_offset, received_at)
+                    )
+                try:
                     for update in updates:
-                        update_offset = update.update_id + 1
-                        asyncio.create_task(
-                            self.__handle_update(
-                                bot, update.dict(by_alias=True, exclude_none=True)
+                        update_id: int = update["update_id"]
+                        tracker.begin(update_id)
+                        event = self.__parse_update(update)
+                        if event:
+                            # 队列满时在此等待，暂停处理之后的批次
+                            await self.dispatcher.put(
+                                bot, event, callback=partial(tracker.done, update_id)
                             )
-                        )
-                elif updates:
-                    update_offset = updates[0].update_id
-            except Exception as e:
-                log("ERROR", f"Get updates for bot {bot.self_id} failed", e)
+                        else:
+                            tracker.done(update_id)
+                except Exception as e:
+                    log("ERROR", f"Dispatch updates for bot {bot.self_id} failed", e)
+                stats.record_process(time.perf_counter() - received_at, len(updates))
+                if not pipeline:
+                    await tracker.wait_idle()
+        finally:
+            saver.cancel()
+            if next_updates and not next_updates.done():
+                next_updates.cancel()
+
+    async def __save_offsets(self, bot_id: str, tracker: OffsetTracker) -> None:
+        while True:
+            await tracker.wait_changed()
+            await self.__save_offset(bot_id, tracker)
+
+    async def __save_offset(self, bot_id: str, tracker: OffsetTracker) -> None:
+        offset = tracker.offset
+        if offset is None:
+            return
+        try:
+            await self.offset_store.save(bot_id, offset)
+            tracker.saved = offset
+        except Exception as e:
+            log("ERROR", f"Save update offset for bot {bot_id} failed", e)
+
+    async def __shutdown(self) -> None:
+        # 在停止 polling 之后执行，等待已拉取的事件处理完成后保存 offset
+        await self.dispatcher.stop(
+            self.adapter_config.telegram_dispatch_shutdown_timeout
+        )
+        for bot_id, tracker in self.offset_trackers.items():
+            if tracker.dirty:
+                await self.__save_offset(bot_id, tracker)
+        await self.offset_store.close()
+        if self.deduplicator:
+            await self.deduplicator.backend.close()
+        if self.file_id_cache:
+            await self.file_id_cache.backend.close()
+        await self.downloader.close()
 
     def setup_polling(self, bot: Bot):
         @self.on_ready
@@ -109,16 +380,51 @@ class Adapter(BaseAdapter):
                     task.cancel()
             await asyncio.gather(*self.tasks, return_exceptions=True)
 
-    async def handle_http(self, request: Request) -> Response:
-        token = request.headers.get("X-Telegram-Bot-Api-Secret-Token")
-        for bot in self.bots.values():
-            bot = cast(Bot, bot)
-            if bot.secret_token == token:
-                if request.content:
-                    update: dict = json.loads(request.content)
-                    asyncio.create_task(self.__handle_update(bot, update))
-                return Response(204)
-        return Response(401)
+    async def handle_http(
+        self, request: Request, bot: Optional[Bot] = None
+    ) -> Response:
+        token = request.headers.get("X-Telegram-Bot-Api-Secret-Token") or ""
+        # 未指定机器人时（旧的 /telegram 路径）通过 secret token 查找
+        if bot is None:
+            bot = self.webhook_bots.get(token)
+        if bot is None or not hmac.compare_digest(
+            bot.secret_token.encode(), token.encode()
+        ):
+            return Response(401)
+
+        if not request.content:
+            return Response(204)
+        # 队列已满，让 Telegram 稍后重试
+        if self.dispatcher.full():
+            return Response(503, headers={"Retry-After": "1"})
+        update: dict = self.json.loads(request.content)
+        update_id: int = update["update_id"]
+        # 响应超时等情况下 Telegram 会重复推送同一个更新
+        if self.deduplicator and await self.deduplicator.is_duplicate(
+            bot.self_id, update_id
+        ):
+            log("DEBUG", f"Skip duplicate update {update_id} for bot {bot.self_id}")
+            return Response(204)
+        event = self.__parse_update(update)
+        if not event:
+            return Response(204)
+        reply = (
+            WebhookReply(bot) if self.adapter_config.telegram_webhook_reply else None
+        )
+        if not self.dispatcher.put_nowait(bot, event, reply):
+            if self.deduplicator:
+                await self.deduplicator.forget(bot.self_id, update_id)
+            return Response(503, headers={"Retry-After": "1"})
+        if reply and (
+            call := await reply.wait(self.adapter_config.telegram_webhook_reply_timeout)
+        ):
+            log("DEBUG", f"Answer API <y>{call['method']}</y> in webhook response")
+            return Response(
+                200,
+                headers={"Content-Type": "application/json"},
+                content=self.json.dumpb(call),
+            )
+        return Response(204)
 
     def setup(self) -> None:
         if list(filter(lambda b: b.is_webhook, self.adapter_config.telegram_bots)):
@@ -137,96 +443,122 @@ class Adapter(BaseAdapter):
                 config=bot_config,
             )
             if bot_config.is_webhook:
+                self.setup_http_server(
+                    HTTPServerSetup(
+                        URL(f"/telegram/{bot.self_id}"),
+                        "POST",
+                        self.get_name(),
+                        partial(self.handle_http, bot=bot),
+                    )
+                )
                 self.setup_webhook(bot)
             else:
                 self.setup_polling(bot)
+        # 在停止 polling 之后再停止分发器
+        self.driver.on_shutdown(self.__shutdown)
 
     @overrides(BaseAdapter)
     async def _call_api(self, bot: Bot, api: str, **data) -> Any:
-        # 将方法名称改为驼峰式
-        api = api.split("_", maxsplit=1)[0] + "".join(
-            s.capitalize() for s in api.split("_")[1:]
-        )
         data = _escape_none(data)
+        method = API_METHODS.get(api)
+        if not (self.file_id_cache and method and method.encode):
+            return await self.__upload_and_send(bot, api, data)
 
-        # 分离文件到 files
-        files: Dict[str, Tuple[str, bytes]] = {}
-        bytes_upload_count = 0
-
-        async def process_input_file(file: Union[InputFile, str]) -> Optional[str]:
-            """处理传过来的文件，如果文件被添加到 files 列表则返回文件名"""
-            nonlocal bytes_upload_count
-            filename = None
-
-            if isinstance(file, tuple):
-                filename = file[0]
-                files[filename] = file
-                return filename
-
-            if isinstance(file, str):
-                if await (path := anyio.Path(file)).exists():
-                    file = await path.read_bytes()
-                    filename = path.name
-                else:
-                    return None
-
-            if not filename:
-                filename = f"upload{bytes_upload_count}"
-                bytes_upload_count += 1
-            files[filename] = (filename, file)
-            return filename
-
-        # 多个文件
-        if api == "sendMediaGroup":
-            medias: Iterable[InputMedia] = data["media"]
-            for media in medias:
-                filename = await process_input_file(media.media)
-                if filename:
-                    media.media = f"attach://{filename}"
-        # 对修改消息媒体消息的处理
-        elif api == "editMessageMedia":
-            media: Iterable[InputMedia] = data["media"]
-            filename = await process_input_file(media.media)
-            if filename:
-                media.media = f"attach://{filename}"
-        # 单个文件
-        elif api in (
-            "sendPhoto",
-            "sendAudio",
-            "sendDocument",
-            "sendVideo",
-            "sendAnimation",
-            "sendVoice",
-            "sendVideoNote",
-        ):
-            type = api[4:].lower()
-            for key in (type, "thumbnail"):
-                value = cast(Optional[Union[str, bytes]], data.pop(key, None))
-                if value:
-                    filename = await process_input_file(value)
-                    data[key] = f"attach://{filename}" if filename else value
-
-        # 最后处理 data 以符合 DataTypes
-        for key in data:
-            if not isinstance(data[key], str):
-                data[key] = json.dumps(
-                    data[key],
-                    default=(
-                        lambda o: o.dict(exclude_none=True)
-                        if isinstance(o, BaseModel)
-                        else pydantic_encoder(o)
-                    ),
+        # 已上传过的文件只发送 file_id
+        cached_data = dict(data)
+        files = await self.file_id_cache.resolve(bot.self_id, api, cached_data)
+        try:
+            try:
+                result = await self.__upload_and_send(bot, api, cached_data)
+            except BadRequest as e:
+                # 如 "wrong file identifier/HTTP URL specified"
+                if "file" not in (e.description or "").lower() or not any(
+                    file.file_id for file in files
+                ):
+                    raise
+                # file_id 可能已失效，重新上传文件
+                log(
+                    "DEBUG", f"Cached file_id rejected by <y>{api}</y>, uploading again"
                 )
+                await self.file_id_cache.discard(files)
+                for file in files:
+                    file.file_id = None
+                result = await self.__upload_and_send(bot, api, data)
+            await self.file_id_cache.store(files, result)
+        finally:
+            self.file_id_cache.release(files)
+        return result
+
+    async def __upload_and_send(self, bot: Bot, api: str, data: Dict[str, Any]) -> Any:
+        # 将方法名称改为驼峰式
+        api = method.method if (method := API_METHODS.get(api)) else to_camel(api)
+        chat_id = data.get("chat_id")
+
+        # 分离文件到 files，请求结束后关闭打开的文件
+        uploads = UploadFiles()
+
+        async def upload(file: Any) -> Any:
+            """上传文件参数时返回文件的引用，否则返回原值"""
+            filename = await uploads.add(file)
+            return f"attach://{filename}" if filename else file
+
+        try:
+            # 文件参数由生成的编码函数处理
+            if method and method.encode:
+                await method.encode(data, upload)
+            return await self.__send_request(bot, api, chat_id, data, uploads)
+        finally:
+            uploads.close()
+
+    async def __send_request(
+        self,
+        bot: Bot,
+        api: str,
+        chat_id: Optional[Union[int, str]],
+        data: Dict[str, Any],
+        uploads: UploadFiles,
+    ) -> Any:
+        files = uploads.files
+        # multipart 请求的每个字段只能是字符串，JSON 请求则一次性序列化整个请求体
+        if files:
+            for key in data:
+                if not isinstance(data[key], str):
+                    data[key] = self.json.dumps(data[key])
+
+        # 处理 webhook 事件时的第一次调用可以合并到 webhook 响应中
+        if (reply := current_webhook_reply.get()) and reply.capture(
+            bot, api, None if files else data
+        ):
+            log("DEBUG", f"API <y>{api}</y> merged into webhook response, returns None")
+            return None
+
+        if self.adapter_config.telegram_rate_limit and is_limited(api):
+            await self.__get_rate_limiter(bot).acquire(chat_id)
 
         log("DEBUG", f"Calling API <y>{api}</y>")
         request = Request(
             "POST",
             f"{bot.bot_config.api_server}bot{bot.bot_config.token}/{api}",
+            headers=None if files else {"Content-Type": "application/json"},
+            content=None if files else self.json.dumpb(data),
             data=data if files else None,
-            json=data if not files else None,
-            files=files,  # type: ignore
+            files=files or None,  # type: ignore
             proxy=self.adapter_config.proxy,
         )
+        attempt = 0
+        while True:
+            try:
+                return await self.__request_api(request)
+            except (ActionFailed, NetworkError) as e:
+                attempt += 1
+                delay = self.retry_policy.get_delay(api, attempt, e)
+                if delay is None:
+                    raise
+                log("WARNING", f"API <y>{api}</y> failed: {e!r}, retry in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                uploads.rewind()
+
+    async def __request_api(self, request: Request) -> Any:
         try:
             response = await self.request(request)
         except Exception as e:
@@ -235,11 +567,22 @@ class Adapter(BaseAdapter):
         if not response.content:
             raise ValueError("Empty response")
         if 200 <= response.status_code < 300:
-            return json.loads(response.content)["result"]
-        if 400 <= response.status_code < 404:
-            raise ActionFailed(json.loads(response.content)["description"])
+            return self.json.loads(response.content)["result"]
         if response.status_code == 404:
             raise ApiNotAvailable
+        if 400 <= response.status_code < 500:
+            result = self.json.loads(response.content)
+            parameters = result.get("parameters")
+            raise get_action_failed(
+                result.get("description"),
+                result.get("error_code", response.status_code),
+                ResponseParameters.parse_obj(parameters) if parameters else None,
+            )
+        if response.status_code >= 500:
+            raise ServerError(
+                response.status_code,
+                f"HTTP request received unexpected {response.status_code} {response.content!r}",
+            )
         raise NetworkError(
             f"HTTP request received unexpected {response.status_code} {response.content}",
         )
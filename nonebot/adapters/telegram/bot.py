@@ -1,7 +1,5 @@
-import inspect
 from uuid import uuid4
-from functools import partial
-from typing import Any, List, Union, Optional, Sequence, cast
+from typing import Any, List, Union, Optional, Sequence, AsyncIterator, cast
 
 from pydantic import parse_obj_as
 from nonebot.typing import overrides
@@ -12,16 +10,12 @@ from nonebot.adapters import Bot as BaseBot
 
 from .api import API
 from .config import BotConfig
+from .registry import API_METHODS
 from .exception import ApiNotAvailable
+from .event import Event, MessageEvent, EventWithChat
+from .download import DOWNLOAD_CHUNK_SIZE, Destination
 from .model import InputMedia, MessageEntity, ReplyParameters
 from .message import File, Entity, Message, UnCombinFile, MessageSegment
-from .event import (
-    Event,
-    MessageEvent,
-    EventWithChat,
-    GroupMessageEvent,
-    PrivateMessageEvent,
-)
 
 
 class Bot(BaseBot, API):
@@ -43,6 +37,7 @@ class Bot(BaseBot, API):
         self.username: Optional[str] = None
         self.bot_config = config
         self.secret_token = uuid4().hex
+        self.allowed_updates: Optional[List[str]] = None
 
     @staticmethod
     def get_bot_id_by_token(token: str) -> str:
@@ -58,14 +53,7 @@ class Bot(BaseBot, API):
                     del message[0]
                     process_first_segment(message)
 
-        if (
-            event.reply_to_message
-            and (
-                isinstance(event.reply_to_message, GroupMessageEvent)
-                or isinstance(event.reply_to_message, PrivateMessageEvent)
-            )
-            and str(event.reply_to_message.from_.id) == self.self_id
-        ):
+        if event._is_reply_from(self.self_id):
             event._tome = True
             return
 
@@ -90,24 +78,52 @@ class Bot(BaseBot, API):
         await handle_event(self, event)
 
     async def call_api(self, api: str, *args: Any, **kargs: Any) -> Any:
-        if hasattr(API, api):
-            sign = inspect.signature(getattr(API, api))
-            args_ = list(args)
-            for param in sign.parameters.values():
-                if param.name != "self" and param.name not in kargs:
-                    try:
-                        kargs[param.name] = args_.pop(0)
-                    except IndexError:
-                        kargs[param.name] = None
-            return parse_obj_as(
-                sign.return_annotation, await super().call_api(api, **kargs)
-            )
+        if method := API_METHODS.get(api):
+            result = await super().call_api(api, **method.bind(args, kargs))
+            # 合并到 webhook 响应中的调用没有返回值，即使返回类型不是 Optional 也返回 None
+            if result is None:
+                return None
+            return method.parse_result(result)
         return await super().call_api(api, **kargs)
 
-    def __getattribute__(self, __name: str) -> Any:
-        if not __name.startswith("__") and hasattr(API, __name):
-            return partial(self.call_api, __name)
-        return object.__getattribute__(self, __name)
+    async def iter_file(
+        self,
+        file_id: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        file_unique_id: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        :说明:
+          逐块下载文件，不会将整个文件读入内存。
+
+        :参数:
+          * ``file_id``: 文件的 ``file_id``
+          * ``chunk_size``: 每块的最大字节数
+          * ``file_unique_id``: 文件的 ``file_unique_id``，启用下载缓存且已缓存时不再调用 ``get_file``
+        """
+        async for chunk in self.adapter.downloader.iter_file(  # type: ignore
+            self, file_id, chunk_size, file_unique_id
+        ):
+            yield chunk
+
+    async def download_file(
+        self,
+        file_id: str,
+        dest: Destination,
+        file_unique_id: Optional[str] = None,
+    ) -> None:
+        """
+        :说明:
+          下载文件。
+
+        :参数:
+          * ``file_id``: 文件的 ``file_id``
+          * ``dest``: 保存的路径或以二进制模式打开的文件对象
+          * ``file_unique_id``: 文件的 ``file_unique_id``，启用下载缓存且已缓存时不再调用 ``get_file``
+        """
+        await self.adapter.downloader.save_file(  # type: ignore
+            self, file_id, dest, file_unique_id
+        )
 
     def __build_entities_form_msg(
         self, message: Sequence[MessageSegment]
@@ -300,3 +316,8 @@ class Bot(BaseBot, API):
             message_thread_id=message_thread_id,
             **kwargs,
         )
+
+
+# API 方法在第一次访问时绑定并缓存到机器人实例上
+for _name, _method in API_METHODS.items():
+    setattr(Bot, _name, _method)
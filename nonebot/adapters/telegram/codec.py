@@ -0,0 +1,91 @@
+import json
+from typing import Any, Union
+from abc import ABC, abstractmethod
+
+from pydantic.main import BaseModel
+from pydantic.json import pydantic_encoder
+
+JSONInput = Union[str, bytes, bytearray, memoryview]
+
+
+def default(o: Any) -> Any:
+    """序列化模型时省略值为 ``None`` 的字段"""
+    if isinstance(o, BaseModel):
+        return o.dict(exclude_none=True)
+    return pydantic_encoder(o)
+
+
+class JSONCodec(ABC):
+    """
+    :说明:
+      webhook 请求体、API 请求和响应使用的 JSON 编解码器。
+    """
+
+    name: str
+
+    @abstractmethod
+    def loads(self, data: JSONInput) -> Any:
+        """解析 JSON，可以直接传入 ``bytes`` 或 ``memoryview``，无需先解码为 ``str``"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def dumpb(self, obj: Any) -> bytes:
+        """序列化为 UTF-8 编码的 JSON"""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumpb(obj).decode()
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "json"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=default
+        )
+
+    def loads(self, data: JSONInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode()
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "Please install orjson first to use it as JSON codec. "
+                "Install with pip: `pip install orjson`"
+            ) from e
+
+        self._orjson = orjson
+
+    def loads(self, data: JSONInput) -> Any:
+        return self._orjson.loads(data)
+
+    def dumpb(self, obj: Any) -> bytes:
+        # orjson 不支持的类型（如 pydantic 模型）交给 default 处理
+        return self._orjson.dumps(obj, default=default)
+
+
+def get_json_codec(codec: str) -> JSONCodec:
+    """``auto`` 时已安装 orjson 则使用 orjson，否则使用标准库"""
+    if codec == "json":
+        return StdlibJSONCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJSONCodec()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Union, Literal, Optional
 
 from pydantic import Field, BaseModel
 
@@ -11,12 +11,14 @@ class BotConfig(BaseModel):
       - ``token``: telegram bot token
       - ``api_server``: 自定义 API 服务器
       - ``is_webhook``: 是否使用 webhook
+      - ``allowed_updates``: 需要接收的更新类型，为 ``auto`` 时根据已加载的事件响应器推断，为空时不限制
 
     """
 
     token: str
     api_server: str = "https://api.telegram.org/"
     is_webhook: bool = False
+    allowed_updates: Optional[Union[List[str], Literal["auto"]]] = None
 
     class Config:
         extra = "ignore"
@@ -32,11 +34,75 @@ class AdapterConfig(BaseModel):
       - ``proxy``: 自定义代理
       - ``telegram_bots`` 机器人单独配置
       - ``telegram_webhook_url``: 自定义 webhook url
+      - ``telegram_dispatch_workers``: 处理事件的 worker 数量
+      - ``telegram_dispatch_queue_size``: 事件队列最大长度，队列满时暂停 polling，webhook 返回 503
+      - ``telegram_dispatch_shutdown_timeout``: 关闭时等待已接收事件处理完成的最长时间（秒）
+      - ``telegram_poll_backoff_base``: ``getUpdates`` 失败后重试的初始等待时间（秒）
+      - ``telegram_poll_backoff_max``: ``getUpdates`` 失败后重试的最长等待时间（秒）
+      - ``telegram_circuit_breaker_threshold``: API 服务器连续失败多少次后熔断
+      - ``telegram_circuit_breaker_timeout``: 熔断持续时间（秒）
+      - ``telegram_offset_store``: long polling offset 的存储方式，可选 ``memory``、``file``、``sqlite``
+      - ``telegram_offset_store_path``: ``file``、``sqlite`` 存储的文件路径
+      - ``telegram_poll_pipeline``: 是否在处理当前批次时提前拉取下一批次，为空时仅在 ``telegram_offset_store`` 为 ``memory`` 时启用
+      - ``telegram_dedup_backend``: webhook 更新去重的存储方式，可选 ``memory``、``sqlite``，为空时不去重
+      - ``telegram_dedup_path``: ``sqlite`` 存储的文件路径，多个进程使用同一文件时共享去重记录
+      - ``telegram_dedup_size``: 最多记录的更新数量
+      - ``telegram_dedup_ttl``: 更新记录的有效时间（秒）
+      - ``telegram_webhook_reply``: 是否将处理 webhook 事件时的第一次 API 调用合并到 webhook 响应中，被合并的调用返回 ``None``，不能使用其返回值
+      - ``telegram_webhook_reply_timeout``: 等待第一次 API 调用的最长时间（秒）
+      - ``telegram_update_model``: 是否提供事件的 ``telegram_model``，关闭后为 ``None``
+      - ``telegram_json_codec``: JSON 编解码器，``auto`` 时已安装 orjson 则使用 orjson
+      - ``telegram_rate_limit``: 是否限制发送消息的频率，超出限制的请求排队等待
+      - ``telegram_rate_limit_global``: 每个机器人每秒最多发送的消息数
+      - ``telegram_rate_limit_private``: 每个私聊每秒最多发送的消息数
+      - ``telegram_rate_limit_group``: 每个群组或频道每分钟最多发送的消息数
+      - ``telegram_retry_max``: API 请求失败后的最大重试次数
+      - ``telegram_retry_after_max``: 请求过于频繁时最长等待多少秒后重试，超过时不再重试
+      - ``telegram_retry_backoff_base``: 网络错误重试的初始退避时间（秒）
+      - ``telegram_retry_backoff_max``: 网络错误重试的最大退避时间（秒）
+      - ``telegram_file_id_cache``: 上传文件 ``file_id`` 缓存的存储方式，可选 ``memory``、``sqlite``，为空时不缓存
+      - ``telegram_file_id_cache_path``: ``sqlite`` 存储的文件路径
+      - ``telegram_file_id_cache_size``: 最多缓存的文件数量
+      - ``telegram_file_id_cache_ttl``: ``file_id`` 的缓存时间（秒）
+      - ``telegram_download_cache_dir``: 下载文件的缓存目录，为空时不缓存
+      - ``telegram_download_cache_size``: 下载缓存的最大字节数
     """
 
     proxy: Optional[str] = Field(default=None, alias="telegram_proxy")
     telegram_bots: List["BotConfig"] = []
     telegram_webhook_url: Optional[str] = None
+    telegram_dispatch_workers: int = 32
+    telegram_dispatch_queue_size: int = 1024
+    telegram_dispatch_shutdown_timeout: float = 10
+    telegram_poll_backoff_base: float = 1
+    telegram_poll_backoff_max: float = 60
+    telegram_circuit_breaker_threshold: int = 5
+    telegram_circuit_breaker_timeout: float = 30
+    telegram_offset_store: Literal["memory", "file", "sqlite"] = "memory"
+    telegram_offset_store_path: Optional[str] = None
+    telegram_poll_pipeline: Optional[bool] = None
+    telegram_dedup_backend: Optional[Literal["memory", "sqlite"]] = "memory"
+    telegram_dedup_path: Optional[str] = None
+    telegram_dedup_size: int = 10000
+    telegram_dedup_ttl: float = 3600
+    telegram_webhook_reply: bool = False
+    telegram_webhook_reply_timeout: float = 0.5
+    telegram_update_model: bool = True
+    telegram_json_codec: Literal["auto", "json", "orjson"] = "auto"
+    telegram_rate_limit: bool = True
+    telegram_rate_limit_global: int = 30
+    telegram_rate_limit_private: int = 1
+    telegram_rate_limit_group: int = 20
+    telegram_retry_max: int = 3
+    telegram_retry_after_max: float = 60
+    telegram_retry_backoff_base: float = 0.5
+    telegram_retry_backoff_max: float = 10
+    telegram_file_id_cache: Optional[Literal["memory", "sqlite"]] = "memory"
+    telegram_file_id_cache_path: Optional[str] = None
+    telegram_file_id_cache_size: int = 1024
+    telegram_file_id_cache_ttl: float = 86400
+    telegram_download_cache_dir: Optional[str] = None
+    telegram_download_cache_size: int = 512 * 1024 * 1024
 
     class Config:
         extra = "ignore"
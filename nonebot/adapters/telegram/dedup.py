@@ -0,0 +1,169 @@
+import time
+import sqlite3
+from pathlib import Path
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Tuple, Union, Optional
+
+import anyio
+from anyio.to_thread import run_sync
+
+
+class DedupBackend(ABC):
+    """
+    :说明:
+      已处理 ``update_id`` 的存储。多个进程使用同一个共享存储时，同一个更新只会被处理一次。
+    """
+
+    @abstractmethod
+    async def add(self, bot_id: str, update_id: int) -> bool:
+        """记录更新，更新已存在且未过期时返回 ``False``"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def discard(self, bot_id: str, update_id: int) -> None:
+        """移除记录，用于未能接收的更新"""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryDedupBackend(DedupBackend):
+    """进程内的 LRU 缓存，超过 ``max_size`` 时淘汰最久未出现的更新"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, int], float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def add(self, bot_id: str, update_id: int) -> bool:
+        key = (bot_id, update_id)
+        now = time.monotonic()
+        expires = self._entries.get(key)
+        self._entries[key] = now + self.ttl
+        self._entries.move_to_end(key)
+        if expires is not None and expires > now:
+            return False
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return True
+
+    async def discard(self, bot_id: str, update_id: int) -> None:
+        self._entries.pop((bot_id, update_id), None)
+
+
+class SQLiteDedupBackend(DedupBackend):
+    """使用 SQLite 文件共享记录，适用于同一主机上的多个 worker 进程"""
+
+    def __init__(self, path: Union[str, Path], max_size: int, ttl: float):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = anyio.Lock()
+        self._inserts = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.path, timeout=5, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS telegram_update "
+                "(bot_id TEXT, update_id INTEGER, expires_at REAL, "
+                "PRIMARY KEY (bot_id, update_id))"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _add(self, bot_id: str, update_id: int) -> bool:
+        connection = self._connect()
+        now = time.time()
+        with connection:
+            # 过期的记录视为不存在
+            connection.execute(
+                "DELETE FROM telegram_update "
+                "WHERE bot_id = ? AND update_id = ? AND expires_at <= ?",
+                (bot_id, update_id, now),
+            )
+            added = connection.execute(
+                "INSERT OR IGNORE INTO telegram_update VALUES (?, ?, ?)",
+                (bot_id, update_id, now + self.ttl),
+            ).rowcount
+            self._inserts += added
+            # 定期清理过期和超出数量的记录
+            if self._inserts >= max(self.max_size // 10, 1):
+                self._inserts = 0
+                connection.execute(
+                    "DELETE FROM telegram_update WHERE expires_at <= ?", (now,)
+                )
+                connection.execute(
+                    "DELETE FROM telegram_update WHERE rowid NOT IN "
+                    "(SELECT rowid FROM telegram_update "
+                    "ORDER BY expires_at DESC LIMIT ?)",
+                    (self.max_size,),
+                )
+        return bool(added)
+
+    def _discard(self, bot_id: str, update_id: int) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM telegram_update WHERE bot_id = ? AND update_id = ?",
+                (bot_id, update_id),
+            )
+
+    async def add(self, bot_id: str, update_id: int) -> bool:
+        async with self._lock:
+            return await run_sync(self._add, bot_id, update_id)
+
+    async def discard(self, bot_id: str, update_id: int) -> None:
+        async with self._lock:
+            await run_sync(self._discard, bot_id, update_id)
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class UpdateDeduplicator:
+    """
+    :说明:
+      过滤 Telegram 重复推送的 webhook 更新，并统计命中率。
+    """
+
+    def __init__(self, backend: DedupBackend):
+        self.backend = backend
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    async def is_duplicate(self, bot_id: str, update_id: int) -> bool:
+        if await self.backend.add(bot_id, update_id):
+            self.misses[bot_id] = self.misses.get(bot_id, 0) + 1
+            return False
+        self.hits[bot_id] = self.hits.get(bot_id, 0) + 1
+        return True
+
+    async def forget(self, bot_id: str, update_id: int) -> None:
+        await self.backend.discard(bot_id, update_id)
+
+    def hit_rate(self, bot_id: Optional[str] = None) -> float:
+        if bot_id is None:
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        else:
+            hits, misses = self.hits.get(bot_id, 0), self.misses.get(bot_id, 0)
+        return hits / (hits + misses) if hits + misses else 0.0
+
+
+def get_dedup_backend(
+    backend: str, path: Optional[str], max_size: int, ttl: float
+) -> DedupBackend:
+    if backend == "sqlite":
+        return SQLiteDedupBackend(path or "telegram_update.db", max_size, ttl)
+    return MemoryDedupBackend(max_size, ttl)
@@ -0,0 +1,190 @@
+import asyncio
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Deque,
+    Callable,
+    Hashable,
+    Optional,
+    NamedTuple,
+)
+
+from nonebot.utils import logger_wrapper
+
+from .event import EventWithChat, CallbackQueryEvent
+from .webhook import WebhookReply, current_webhook_reply
+
+if TYPE_CHECKING:
+    from .bot import Bot
+    from .event import Event
+
+log = logger_wrapper("Telegram")
+
+
+class _Job(NamedTuple):
+    bot: "Bot"
+    event: "Event"
+    reply: Optional[WebhookReply]
+    callback: Optional[Callable[[], None]]
+
+
+class Dispatcher:
+    """
+    :说明:
+      事件分发器。事件先进入有界队列，再由固定数量的 worker 交给 ``Bot.handle_event`` 处理。
+
+      事件按会话分组：同一聊天（论坛话题按 ``message_thread_id`` 再细分）内的事件严格按收到的顺序处理，
+      不同会话的事件并行处理。会话没有待处理事件时，其队列会被立即回收。
+
+      事件处理完成后调用 ``put`` 时传入的 ``callback``，用于记录 long polling 的 offset。
+
+    :参数:
+      * ``workers``: worker 数量
+      * ``max_size``: 队列最大长度，队列满时 ``put`` 会等待，``put_nowait`` 会返回 ``False``
+    """
+
+    def __init__(self, workers: int, max_size: int):
+        self.workers = max(workers, 1)
+        self.max_size = max(max_size, 1)
+        self._size = 0
+        self._pending: Dict[Hashable, Deque[_Job]] = {}
+        self._ready: Optional["asyncio.Queue[Hashable]"] = None
+        self._space: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def qsize(self) -> int:
+        """当前排队中（包括正在处理）的事件数量"""
+        return self._size
+
+    @property
+    def active_keys(self) -> int:
+        """当前有待处理事件的会话数量"""
+        return len(self._pending)
+
+    def full(self) -> bool:
+        return self._size >= self.max_size
+
+    @staticmethod
+    def get_key(bot: "Bot", event: "Event") -> Hashable:
+        """获取事件所属的会话，同一会话内的事件按顺序处理"""
+        if isinstance(event, EventWithChat):
+            return (
+                bot.self_id,
+                event.chat.id,
+                getattr(event, "message_thread_id", None),
+            )
+        if isinstance(event, CallbackQueryEvent):
+            # 按钮所在消息的会话，与该会话的消息按顺序处理
+            if message := event.message:
+                thread_id = (
+                    getattr(message, "message_thread_id", None)
+                    if getattr(message, "is_topic_message", None)
+                    else None
+                )
+                return (bot.self_id, message.chat.id, thread_id)
+            # 内联消息的按钮没有所属聊天，按用户排序，与私聊消息属于同一会话
+            return (bot.self_id, event.from_.id, None)
+        # 没有聊天的事件不需要保证顺序
+        return object()
+
+    def start(self) -> None:
+        if self._ready is not None:
+            return
+        # 在事件循环内创建队列，避免 Python 3.8/3.9 绑定到错误的事件循环
+        self._ready = asyncio.Queue()
+        self._space = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def join(self) -> None:
+        """等待所有事件处理完成"""
+        while self._size and self._space:
+            self._space.clear()
+            await self._space.wait()
+
+    async def stop(self, timeout: float = 0) -> None:
+        """停止分发器，最多等待 ``timeout`` 秒让已接收的事件处理完成"""
+        if timeout > 0:
+            try:
+                await asyncio.wait_for(self.join(), timeout)
+            except asyncio.TimeoutError:
+                log("WARNING", f"{self._size} events are dropped on shutdown")
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._pending.clear()
+        self._size = 0
+        self._ready = None
+        self._space = None
+
+    async def put(
+        self,
+        bot: "Bot",
+        event: "Event",
+        reply: Optional[WebhookReply] = None,
+        callback: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """放入事件，队列满时等待，用于对 long polling 施加背压"""
+        self.start()
+        assert self._space is not None
+        if self.full():
+            log("DEBUG", "Dispatch queue is full, waiting for workers")
+        while self.full():
+            self._space.clear()
+            await self._space.wait()
+        self._enqueue(_Job(bot, event, reply, callback))
+
+    def put_nowait(
+        self,
+        bot: "Bot",
+        event: "Event",
+        reply: Optional[WebhookReply] = None,
+        callback: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """放入事件，队列满时返回 ``False``"""
+        self.start()
+        if self.full():
+            return False
+        self._enqueue(_Job(bot, event, reply, callback))
+        return True
+
+    def _enqueue(self, job: _Job) -> None:
+        assert self._ready is not None
+        key = self.get_key(job.bot, job.event)
+        self._size += 1
+        if queue := self._pending.get(key):
+            queue.append(job)
+        else:
+            self._pending[key] = deque((job,))
+            self._ready.put_nowait(key)
+
+    async def _worker(self) -> None:
+        assert self._ready is not None and self._space is not None
+        ready, space = self._ready, self._space
+        while True:
+            key = await ready.get()
+            # 处理期间事件仍留在会话队列中，保证同一会话同时只有一个 worker
+            queue = self._pending[key]
+            bot, event, reply, callback = queue[0]
+            token = current_webhook_reply.set(reply)
+            try:
+                await bot.handle_event(event)
+            except Exception as e:
+                log("ERROR", f"Error when handling event {event.get_event_name()}", e)
+            finally:
+                current_webhook_reply.reset(token)
+                if reply:
+                    reply.close()
+                if callback:
+                    callback()
+                queue.popleft()
+                self._size -= 1
+                space.set()
+                if queue:
+                    ready.put_nowait(key)
+                else:
+                    self._pending.pop(key, None)
@@ -0,0 +1,318 @@
+import os
+import re
+import shutil
+from uuid import uuid4
+from pathlib import Path
+from functools import partial
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Union,
+    Callable,
+    Optional,
+    Awaitable,
+    AsyncIterator,
+)
+
+import anyio
+from nonebot.drivers import Request
+from anyio.to_thread import run_sync
+
+from .exception import NetworkError
+
+if TYPE_CHECKING:
+    from .bot import Bot
+    from .model import File
+    from .adapter import Adapter
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+
+# file_unique_id 只包含 base64url 字符，可以直接作为文件名
+_CACHE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+# 写入缓存时的临时文件
+_TEMP_FILE = re.compile(r"\.[A-Za-z0-9_-]+\.[0-9a-f]{32}\.part")
+
+
+def get_local_path(file_path: str) -> Optional[Path]:
+    """本地模式的 Bot API 服务器返回文件的绝对路径，可以直接读取"""
+    path = Path(file_path)
+    return path if path.is_absolute() and path.is_file() else None
+
+
+class DownloadCache:
+    """
+    :说明:
+      下载文件的磁盘缓存，以 ``file_unique_id`` 作为文件名，同一适配器的所有机器人共享。
+
+      缓存文件保存在 ``directory`` 下的 ``files`` 子目录中，只管理文件名符合缓存格式的文件，
+      不会删除目录中的其他文件。
+
+      缓存文件的总大小超过 ``max_bytes`` 时删除最久未使用的文件，单个文件超过 ``max_bytes`` 时保留到下一次写入，
+      正在读取的文件不会被删除。文件先写入临时文件再替换，下载中断不会留下不完整的缓存。
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int):
+        self.directory = Path(directory).absolute() / "files"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # 缓存文件的总字节数
+        self.size = 0
+        self._entries: "Optional[OrderedDict[str, int]]" = None
+        self._downloading: Dict[str, anyio.Event] = {}
+        # 正在读取的文件及读取者的数量，淘汰时跳过
+        self._using: Dict[str, int] = {}
+
+    def _load(self) -> "OrderedDict[str, int]":
+        """读取已有的缓存文件，按修改时间排序，清理上次中断留下的临时文件"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        files = []
+        for path in self.directory.iterdir():
+            if _TEMP_FILE.fullmatch(path.name):
+                path.unlink(missing_ok=True)
+            elif _CACHE_KEY.fullmatch(path.name) and path.is_file():
+                stat = path.stat()
+                files.append((stat.st_mtime, path.name, stat.st_size))
+        return OrderedDict((name, size) for _, name, size in sorted(files))
+
+    async def _get_entries(self) -> "OrderedDict[str, int]":
+        if self._entries is None:
+            self._entries = await run_sync(self._load)
+            self.size = sum(self._entries.values())
+        return self._entries
+
+    @asynccontextmanager
+    async def fetch(
+        self, key: str, download: Callable[[Path], Awaitable[None]]
+    ) -> AsyncIterator[Path]:
+        """
+        :说明:
+          返回缓存文件的路径，未缓存时调用 ``download`` 写入临时文件后加入缓存。
+
+          同时请求同一文件时只下载一次。退出上下文前文件不会被淘汰。
+        """
+        if not _CACHE_KEY.fullmatch(key):
+            raise ValueError(f"Invalid file_unique_id: {key!r}")
+        self._using[key] = self._using.get(key, 0) + 1
+        try:
+            yield await self._fetch(key, download)
+        finally:
+            self._using[key] -= 1
+            if not self._using[key]:
+                del self._using[key]
+
+    async def _fetch(
+        self, key: str, download: Callable[[Path], Awaitable[None]]
+    ) -> Path:
+        entries = await self._get_entries()
+        path = self.directory / key
+        while True:
+            if key in entries:
+                try:
+                    # 记录使用时间，重启后仍按最近使用的顺序淘汰
+                    await run_sync(os.utime, path)
+                except FileNotFoundError:
+                    self.size -= entries.pop(key)
+                else:
+                    self.hits += 1
+                    entries.move_to_end(key)
+                    return path
+            if (downloading := self._downloading.get(key)) is None:
+                break
+            await downloading.wait()
+
+        self.misses += 1
+        self._downloading[key] = anyio.Event()
+        temp = self.directory / f".{key}.{uuid4().hex}.part"
+        try:
+            await download(temp)
+            size = (await anyio.Path(temp).stat()).st_size
+            await run_sync(os.replace, temp, path)
+            entries[key] = size
+            self.size += size
+        except BaseException:
+            with anyio.CancelScope(shield=True):
+                await run_sync(partial(temp.unlink, missing_ok=True))
+            raise
+        finally:
+            self._downloading.pop(key).set()
+        await self._evict()
+        return path
+
+    async def _evict(self) -> None:
+        entries = await self._get_entries()
+        # 保留最近使用的文件和正在读取的文件
+        for key in list(entries)[:-1]:
+            if self.size <= self.max_bytes:
+                break
+            if key in self._using or key not in entries:
+                continue
+            self.size -= entries.pop(key)
+            self.evictions += 1
+            await run_sync(partial((self.directory / key).unlink, missing_ok=True))
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class FileDownloader:
+    """
+    :说明:
+      下载机器人收到的文件。
+
+      已安装 httpx 时复用同一个连接池逐块下载，否则通过驱动器下载，
+      驱动器不支持流式响应，文件会被完整读入内存。
+
+      设置了 ``cache`` 时先下载到缓存，再从缓存读取。
+    """
+
+    def __init__(self, adapter: "Adapter", cache: Optional[DownloadCache] = None):
+        self.adapter = adapter
+        self.cache = cache
+        self._client: Any = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            try:
+                import httpx
+            except ImportError:
+                return None
+
+            proxy = self.adapter.adapter_config.proxy
+            try:
+                self._client = httpx.AsyncClient(proxy=proxy)
+            except TypeError:
+                # httpx < 0.26
+                self._client = httpx.AsyncClient(proxies=proxy)
+        return self._client
+
+    async def _get_file(self, bot: "Bot", file_id: str) -> "File":
+        file = await bot.get_file(file_id=file_id)
+        if not file.file_path:
+            raise ValueError(f"File {file_id} is not available for download")
+        return file
+
+    @asynccontextmanager
+    async def _get_file_path(
+        self, bot: "Bot", file_id: str, file_unique_id: Optional[str]
+    ) -> AsyncIterator[str]:
+        """返回 ``get_file`` 的 ``file_path``，使用缓存时返回缓存文件的本地路径"""
+        if self.cache is None:
+            yield (await self._get_file(bot, file_id)).file_path  # type: ignore
+            return
+        file = None
+        if not file_unique_id:
+            file = await self._get_file(bot, file_id)
+            file_unique_id = file.file_unique_id
+
+        async def download(temp: Path) -> None:
+            file_path = (file or await self._get_file(bot, file_id)).file_path
+            await self._write(bot, file_path, temp)  # type: ignore
+
+        async with self.cache.fetch(file_unique_id, download) as path:
+            yield str(path)
+
+    async def iter_file(
+        self,
+        bot: "Bot",
+        file_id: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        file_unique_id: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """逐块读取文件"""
+        async with self._get_file_path(bot, file_id, file_unique_id) as file_path:
+            async for chunk in self._iter_path(bot, file_path, chunk_size):
+                yield chunk
+
+    async def _iter_path(
+        self, bot: "Bot", file_path: str, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        """逐块读取 ``get_file`` 返回的 ``file_path``"""
+        if local_path := get_local_path(file_path):
+            async with await anyio.open_file(local_path, "rb") as f:
+                while chunk := await f.read(chunk_size):
+                    yield chunk
+            return
+
+        url = f"{bot.bot_config.api_server}file/bot{bot.bot_config.token}/{file_path}"
+        if (client := self._get_client()) is None:
+            response = await self.adapter.request(
+                Request("GET", url, proxy=self.adapter.adapter_config.proxy)
+            )
+            if response.status_code != 200:
+                raise NetworkError(
+                    f"Download file failed with status {response.status_code}"
+                )
+            content = response.content or b""
+            if isinstance(content, str):
+                content = content.encode()
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size]
+            return
+
+        try:
+            async with client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    raise NetworkError(
+                        f"Download file failed with status {response.status_code}"
+                    )
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+        except NetworkError:
+            raise
+        except Exception as e:
+            raise NetworkError("Download file failed") from e
+
+    async def save_file(
+        self,
+        bot: "Bot",
+        file_id: str,
+        dest: Destination,
+        file_unique_id: Optional[str] = None,
+    ) -> None:
+        """
+        :说明:
+          将文件保存到 ``dest``。
+
+          ``dest`` 为路径时先写入同一目录下的临时文件再替换，下载失败不会留下不完整的文件；
+          本地模式的文件和缓存的文件直接复制，Linux 上由内核完成，不经过 Python。
+        """
+        async with self._get_file_path(bot, file_id, file_unique_id) as file_path:
+            if not isinstance(dest, (str, os.PathLike)):
+                async for chunk in self._iter_path(bot, file_path, DOWNLOAD_CHUNK_SIZE):
+                    dest.write(chunk)
+                return
+
+            dest = Path(dest)
+            await anyio.Path(dest.parent).mkdir(parents=True, exist_ok=True)
+            temp = dest.with_name(f".{dest.name}.{uuid4().hex}.part")
+            try:
+                await self._write(bot, file_path, temp)
+                await run_sync(os.replace, temp, dest)
+            except BaseException:
+                with anyio.CancelScope(shield=True):
+                    await run_sync(partial(temp.unlink, missing_ok=True))
+                raise
+
+    async def _write(self, bot: "Bot", file_path: str, target: Path) -> None:
+        """将文件写入新文件 ``target``"""
+        if local_path := get_local_path(file_path):
+            await run_sync(shutil.copyfile, local_path, target)
+            return
+        async with await anyio.open_file(target, "xb") as f:
+            async for chunk in self._iter_path(bot, file_path, DOWNLOAD_CHUNK_SIZE):
+                await f.write(chunk)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -1,6 +1,17 @@
-from copy import deepcopy
-from typing import List, Literal, Optional
+from functools import lru_cache
 from typing_extensions import Protocol, runtime_checkable
+from typing import (
+    Any,
+    Set,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Literal,
+    Callable,
+    Optional,
+    FrozenSet,
+)
 
 from pydantic import Field
 from nonebot.typing import overrides
@@ -42,36 +53,16 @@ class Event(BaseEvent):
 
     @classmethod
     def __parse_event(cls, obj: dict) -> "Event":
-        post_type: str = list(obj.keys())[1]
-        event_map = {
-            "message": MessageEvent,
-            "edited_message": EditedMessageEvent,
-            "channel_post": MessageEvent,
-            "edited_channel_post": EditedMessageEvent,
-            "inline_query": InlineQueryEvent,
-            "chosen_inline_result": ChosenInlineResultEvent,
-            "callback_query": CallbackQueryEvent,
-            "shipping_query": ShippingQueryEvent,
-            "pre_checkout_query": PreCheckoutQueryEvent,
-            "poll": PollEvent,
-            "poll_answer": PollAnswerEvent,
-            "chat_member": ChatMemberUpdatedEvent,
-            "my_chat_member": ChatMemberUpdatedEvent,
-            "chat_join_request": ChatJoinRequestEvent,
-        }
-
-        event = event_map[post_type].parse_event(obj[post_type])
-        setattr(event, "telegram_model", Update.parse_obj(obj))
+        # 第一个不是 update_id 的字段即为更新类型
+        post_type = next(key for key in obj if key != "update_id")
+        # 解析会修改传入的字典，复制一份以保留原始数据
+        event = UPDATE_EVENTS[post_type].parse_event(dict(obj[post_type]))
+        # Update 模型在首次访问 telegram_model 时才构建
+        setattr(event, "telegram_model", obj)
         return event
 
     @classmethod
-    def _parse_event(cls, obj: dict, failed: set = set()) -> "Event":
-        for subclass in cls.__subclasses__():
-            if subclass not in failed:
-                try:
-                    return subclass.parse_event(obj)
-                except:
-                    pass
+    def _parse_event(cls, obj: dict) -> "Event":
         return cls.parse_obj(obj)
 
     @classmethod
@@ -81,6 +72,18 @@ class Event(BaseEvent):
         else:
             return cls._parse_event(obj)
 
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        # dict()、json() 和 copy() 直接读取 __dict__，导出前先解析未被完全排除的延迟解析字段
+        exclude = kwargs.get("exclude") or ()
+        for name in get_lazy_fields(type(self)):
+            if isinstance(exclude, dict):
+                excluded = exclude.get(name) in (..., True)
+            else:
+                excluded = name in exclude
+            if not excluded:
+                getattr(self, name)
+        return super()._iter(*args, **kwargs)
+
     @overrides(BaseEvent)
     def get_type(self) -> str:
         return ""
@@ -143,25 +146,35 @@ class MessageEvent(Event):
 
     @classmethod
     def __parse_event(cls, obj: dict) -> "Event":
+        # Message.parse_obj 会删除消息内容的字段，保留一份用于解析 original_message
+        raw = dict(obj)
         message = Message.parse_obj(obj)
         if not message:
             return NoticeEvent.parse_event(obj)
         else:
             reply_to_message = obj.pop("reply_to_message", None)
-            message_type = obj["chat"]["type"]
-            event_map = {
-                "private": PrivateMessageEvent,
-                "group": GroupMessageEvent,
-                "supergroup": GroupMessageEvent,
-                "channel": ChannelPostEvent,
-            }
-            event = event_map[message_type].parse_event(obj)
+            event = MESSAGE_EVENTS[obj["chat"]["type"]].parse_event(obj)
             setattr(event, "message", message)
-            setattr(event, "original_message", deepcopy(message))
+            # original_message 在首次访问时才从原始数据解析，与 message 不共享消息段
+            setattr(event, "original_message", raw)
+            # 被回复的消息在首次访问时才解析
             if reply_to_message:
-                setattr(event, "reply_to_message", cls.parse_event(reply_to_message))
+                setattr(event, "reply_to_message", reply_to_message)
             return event
 
+    def _is_reply_from(self, user_id: str) -> bool:
+        """是否回复了 ``user_id`` 发送的消息，发送者不同时不会解析被回复的消息"""
+        reply_to_message = self.__dict__.get("reply_to_message")
+        if isinstance(reply_to_message, dict):
+            sender = reply_to_message.get("from") or {}
+            if str(sender.get("id")) != user_id:
+                return False
+        reply_to_message = self.reply_to_message
+        return (
+            isinstance(reply_to_message, (GroupMessageEvent, PrivateMessageEvent))
+            and str(reply_to_message.from_.id) == user_id
+        )
+
     @overrides(Event)
     def get_type(self) -> str:
         return "message"
@@ -279,19 +292,10 @@ class EditedMessageEvent(Event):
     @classmethod
     def __parse_event(cls, obj: dict):
         reply_to_message = obj.pop("reply_to_message", None)
-        message_type = obj["chat"]["type"]
-        event_map = {
-            "private": PrivateEditedMessageEvent,
-            "group": GroupEditedMessageEvent,
-            "supergroup": GroupEditedMessageEvent,
-            "channel": EditedChannelPostEvent,
-        }
-        event = event_map[message_type].parse_event(obj)
+        event = EDITED_MESSAGE_EVENTS[obj["chat"]["type"]].parse_event(obj)
         setattr(event, "message", Message.parse_obj(obj))
         if reply_to_message:
-            setattr(
-                event, "reply_to_message", MessageEvent.parse_event(reply_to_message)
-            )
+            setattr(event, "reply_to_message", reply_to_message)
         return event
 
     @overrides(Event)
@@ -401,32 +405,10 @@ class EditedChannelPostEvent(EditedMessageEvent):
 class NoticeEvent(Event):
     @classmethod
     def __parse_event(cls, obj: dict) -> "Event":
-        if "pinned_message" in obj:
-            return PinnedMessageEvent.parse_event(obj)
-        elif "new_chat_members" in obj:
-            return NewChatMemberEvent.parse_event(obj)
-        elif "left_chat_member" in obj:
-            return LeftChatMemberEvent.parse_event(obj)
-        elif "new_chat_title" in obj:
-            return NewChatTitleEvent.parse_event(obj)
-        elif "new_chat_photo" in obj:
-            return NewChatPhotoEvent.parse_event(obj)
-        elif "delete_chat_photo" in obj:
-            return DeleteChatPhotoEvent.parse_event(obj)
-        elif "forum_topic_created" in obj:
-            return ForumTopicCreatedEvent.parse_event(obj)
-        elif "forum_topic_edited" in obj:
-            return ForumTopicEditedEvent.parse_event(obj)
-        elif "forum_topic_closed" in obj:
-            return ForumTopicClosedEvent.parse_event(obj)
-        elif "forum_topic_reopened" in obj:
-            return ForumTopicReopenedEvent.parse_event(obj)
-        elif "general_forum_topic_hidden" in obj:
-            return GeneralForumTopicHiddenEvent.parse_event(obj)
-        elif "general_forum_topic_unhidden" in obj:
-            return GeneralForumTopicUnhiddenEvent.parse_event(obj)
-        else:
-            return cls._parse_event(obj)
+        for key, event_type in SERVICE_MESSAGE_EVENTS.items():
+            if key in obj:
+                return event_type.parse_event(obj)
+        return cls._parse_event(obj)
 
     @overrides(Event)
     def get_type(self) -> str:
@@ -449,7 +431,7 @@ class PinnedMessageEvent(NoticeEvent):
     def __parse_event(cls, obj: dict):
         pinned_message = obj.pop("pinned_message")
         event = cls.parse_obj(obj)
-        setattr(event, "pinned_message", MessageEvent.parse_event(pinned_message))
+        setattr(event, "pinned_message", pinned_message)
         return event
 
     @overrides(NoticeEvent)
@@ -686,3 +668,153 @@ class ShippingQueryEvent(Event, ShippingQuery):
 # TODO DELAY
 class PreCheckoutQueryEvent(Event, PreCheckoutQuery):
     pass
+
+
+class LazyField:
+    """
+    :说明:
+      延迟解析的字段。
+
+      解析事件时只保存原始数据，首次访问时才调用 ``parse`` 解析并缓存结果。
+    """
+
+    def __init__(self, name: str, parse: Callable[[dict], Any]):
+        self.name = name
+        self.parse = parse
+
+    def __get__(self, instance: Optional[Event], owner: Type[Event]):
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.name)
+        if isinstance(value, dict):
+            value = instance.__dict__[self.name] = self.parse(value)
+        return value
+
+    def __set__(self, instance: Event, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+@lru_cache(maxsize=None)
+def get_lazy_fields(cls: Type[Event]) -> FrozenSet[str]:
+    """``cls`` 中延迟解析的字段名，导出时排除这些字段可以避免解析"""
+    return frozenset(
+        name
+        for name in cls.__fields__
+        if isinstance(getattr(cls, name, None), LazyField)
+    )
+
+
+def _parse_message_event(obj: dict) -> "Event":
+    # 解析会修改传入的字典，复制一份以保留 telegram_model 的原始数据
+    return MessageEvent.parse_event(dict(obj))
+
+
+def _parse_message(obj: dict) -> Message:
+    return Message.parse_obj(dict(obj))
+
+
+# pydantic 将字段值保存在实例的 __dict__ 中，数据描述符会优先于其被访问
+setattr(Event, "telegram_model", LazyField("telegram_model", Update.parse_obj))
+setattr(
+    MessageEvent,
+    "reply_to_message",
+    LazyField("reply_to_message", _parse_message_event),
+)
+setattr(MessageEvent, "original_message", LazyField("original_message", _parse_message))
+setattr(
+    EditedMessageEvent,
+    "reply_to_message",
+    LazyField("reply_to_message", _parse_message_event),
+)
+setattr(
+    PinnedMessageEvent,
+    "pinned_message",
+    LazyField("pinned_message", _parse_message_event),
+)
+
+# 以下分发表在导入时构建，解析事件时直接查表得到具体的事件类型
+
+# 更新类型 -> 事件类型
+UPDATE_EVENTS: Dict[str, Type[Event]] = {
+    "message": MessageEvent,
+    "edited_message": EditedMessageEvent,
+    "channel_post": MessageEvent,
+    "edited_channel_post": EditedMessageEvent,
+    "inline_query": InlineQueryEvent,
+    "chosen_inline_result": ChosenInlineResultEvent,
+    "callback_query": CallbackQueryEvent,
+    "shipping_query": ShippingQueryEvent,
+    "pre_checkout_query": PreCheckoutQueryEvent,
+    "poll": PollEvent,
+    "poll_answer": PollAnswerEvent,
+    "chat_member": ChatMemberUpdatedEvent,
+    "my_chat_member": ChatMemberUpdatedEvent,
+    "chat_join_request": ChatJoinRequestEvent,
+}
+
+# 聊天类型 -> 消息事件类型
+MESSAGE_EVENTS: Dict[str, Type[MessageEvent]] = {
+    "private": PrivateMessageEvent,
+    "group": GroupMessageEvent,
+    "supergroup": GroupMessageEvent,
+    "channel": ChannelPostEvent,
+}
+
+# 聊天类型 -> 编辑消息事件类型
+EDITED_MESSAGE_EVENTS: Dict[str, Type[EditedMessageEvent]] = {
+    "private": PrivateEditedMessageEvent,
+    "group": GroupEditedMessageEvent,
+    "supergroup": GroupEditedMessageEvent,
+    "channel": EditedChannelPostEvent,
+}
+
+# 服务消息字段 -> 通知事件类型
+SERVICE_MESSAGE_EVENTS: Dict[str, Type[NoticeEvent]] = {
+    "pinned_message": PinnedMessageEvent,
+    "new_chat_members": NewChatMemberEvent,
+    "left_chat_member": LeftChatMemberEvent,
+    "new_chat_title": NewChatTitleEvent,
+    "new_chat_photo": NewChatPhotoEvent,
+    "delete_chat_photo": DeleteChatPhotoEvent,
+    "forum_topic_created": ForumTopicCreatedEvent,
+    "forum_topic_edited": ForumTopicEditedEvent,
+    "forum_topic_closed": ForumTopicClosedEvent,
+    "forum_topic_reopened": ForumTopicReopenedEvent,
+    "general_forum_topic_hidden": GeneralForumTopicHiddenEvent,
+    "general_forum_topic_unhidden": GeneralForumTopicUnhiddenEvent,
+}
+
+# 事件类型对应的 Telegram 更新类型，用于生成 allowed_updates
+UPDATE_TYPES: Dict[Type[Event], Tuple[str, ...]] = {
+    MessageEvent: ("message",),
+    ChannelPostEvent: ("channel_post",),
+    EditedMessageEvent: ("edited_message",),
+    EditedChannelPostEvent: ("edited_channel_post",),
+    NoticeEvent: ("message", "channel_post"),
+    ChatMemberUpdatedEvent: ("chat_member", "my_chat_member"),
+    PollEvent: ("poll",),
+    PollAnswerEvent: ("poll_answer",),
+    ChatJoinRequestEvent: ("chat_join_request",),
+    InlineQueryEvent: ("inline_query",),
+    ChosenInlineResultEvent: ("chosen_inline_result",),
+    CallbackQueryEvent: ("callback_query",),
+    ShippingQueryEvent: ("shipping_query",),
+    PreCheckoutQueryEvent: ("pre_checkout_query",),
+}
+
+
+def get_update_types(event_type: Type[BaseEvent]) -> Set[str]:
+    """获取事件类型及其子类可能来自的所有 Telegram 更新类型"""
+    update_types = {
+        update_type
+        for cls, types in UPDATE_TYPES.items()
+        if issubclass(cls, event_type)
+        for update_type in types
+    }
+    if update_types:
+        return update_types
+    # 更具体的事件类型，如 PrivateMessageEvent，使用最近的父类
+    for cls in event_type.__mro__:
+        if cls in UPDATE_TYPES:
+            return set(UPDATE_TYPES[cls])
+    return set()
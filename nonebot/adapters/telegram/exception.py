@@ -6,6 +6,8 @@ from nonebot.exception import NetworkError as BaseNetworkError
 from nonebot.exception import NoLogException as BaseNoLogException
 from nonebot.exception import ApiNotAvailable as BaseApiNotAvailable
 
+from .model import ResponseParameters
+
 
 class TelegramAdapterException(AdapterException):
     def __init__(self):
@@ -20,19 +22,59 @@ class ActionFailed(BaseActionFailed, TelegramAdapterException):
     """
     :说明:
       API 请求返回错误信息。
+
+    :参数:
+      * ``description``: 错误描述
+      * ``error_code``: 错误码，通常与 HTTP 状态码相同
+      * ``parameters``: 错误的附加信息，如 ``retry_after`` 和 ``migrate_to_chat_id``
     """
 
-    def __init__(self, description: Optional[str] = None):
+    def __init__(
+        self,
+        description: Optional[str] = None,
+        error_code: Optional[int] = None,
+        parameters: Optional[ResponseParameters] = None,
+    ):
         super().__init__()
         self.description = description
+        self.error_code = error_code
+        self.parameters = parameters or ResponseParameters()
+
+    @property
+    def retry_after(self) -> Optional[int]:
+        return self.parameters.retry_after
+
+    @property
+    def migrate_to_chat_id(self) -> Optional[int]:
+        return self.parameters.migrate_to_chat_id
 
     def __repr__(self):
-        return f"<ActionFailed {self.description}>"
+        return f"<{type(self).__name__} [{self.error_code}] {self.description}>"
 
     def __str__(self):
         return self.__repr__()
 
 
+class BadRequest(ActionFailed):
+    """请求参数错误（400）"""
+
+
+class ChatMigrated(BadRequest):
+    """群组已升级为超级群组，新的聊天 ID 为 ``migrate_to_chat_id``"""
+
+
+class Unauthorized(ActionFailed):
+    """机器人 token 无效（401）"""
+
+
+class Forbidden(ActionFailed):
+    """机器人没有权限，如被用户屏蔽或被移出群组（403）"""
+
+
+class RetryAfter(ActionFailed):
+    """请求过于频繁，需要等待 ``retry_after`` 秒后重试（429）"""
+
+
 class NetworkError(BaseNetworkError, TelegramAdapterException):
     """
     :说明:
@@ -50,5 +92,32 @@ class NetworkError(BaseNetworkError, TelegramAdapterException):
         return self.__repr__()
 
 
+class ServerError(NetworkError):
+    """
+    :说明:
+      Telegram 服务器错误（5xx）。
+    """
+
+    def __init__(self, status_code: int, msg: Optional[str] = None):
+        super().__init__(msg)
+        self.status_code = status_code
+
+
 class ApiNotAvailable(BaseApiNotAvailable, TelegramAdapterException):
     pass
+
+
+def get_action_failed(
+    description: Optional[str],
+    error_code: Optional[int],
+    parameters: Optional[ResponseParameters],
+) -> ActionFailed:
+    """根据错误码选择异常类型"""
+    if parameters and parameters.migrate_to_chat_id:
+        return ChatMigrated(description, error_code, parameters)
+    if error_code == 429 or (parameters and parameters.retry_after):
+        return RetryAfter(description, error_code, parameters)
+    exception = {400: BadRequest, 401: Unauthorized, 403: Forbidden}.get(
+        error_code or 0, ActionFailed
+    )
+    return exception(description, error_code, parameters)
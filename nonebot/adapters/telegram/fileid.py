@@ -0,0 +1,362 @@
+import os
+import stat
+import time
+import hashlib
+import sqlite3
+from pathlib import Path
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple, Union, Optional
+
+import anyio
+from pydantic import BaseModel
+from anyio.to_thread import run_sync
+
+# 发送后可以通过 file_id 再次发送的文件类型，send_{type} 的文件参数与返回消息中的字段同名
+MEDIA_TYPES = (
+    "photo",
+    "audio",
+    "document",
+    "video",
+    "animation",
+    "voice",
+    "video_note",
+    "sticker",
+)
+
+# 超过此大小的 bytes 在线程中计算哈希
+HASH_IN_THREAD_SIZE = 1024 * 1024
+
+
+class FileIdBackend(ABC):
+    """
+    :说明:
+      已上传文件的 ``file_id`` 存储。
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, file_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def discard(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryFileIdBackend(FileIdBackend):
+    """进程内的 LRU 缓存，超过 ``max_size`` 时淘汰最久未使用的文件"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        file_id, expires = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return file_id
+
+    async def set(self, key: str, file_id: str) -> None:
+        self._entries[key] = (file_id, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class SQLiteFileIdBackend(FileIdBackend):
+    """使用 SQLite 文件保存 ``file_id``，重启后仍然有效，也可以在多个进程间共享"""
+
+    def __init__(self, path: Union[str, Path], max_size: int, ttl: float):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = anyio.Lock()
+        self._inserts = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.path, timeout=5, check_same_thread=False
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS telegram_file_id "
+                "(key TEXT PRIMARY KEY, file_id TEXT, expires_at REAL, used_at REAL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _get(self, key: str) -> Optional[str]:
+        connection = self._connect()
+        now = time.time()
+        with connection:
+            row = connection.execute(
+                "SELECT file_id FROM telegram_file_id "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE telegram_file_id SET used_at = ? WHERE key = ?",
+                    (now, key),
+                )
+        return row[0] if row else None
+
+    def _set(self, key: str, file_id: str) -> None:
+        connection = self._connect()
+        now = time.time()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO telegram_file_id VALUES (?, ?, ?, ?)",
+                (key, file_id, now + self.ttl, now),
+            )
+            self._inserts += 1
+            # 定期清理过期和最久未使用的记录
+            if self._inserts >= max(self.max_size // 10, 1):
+                self._inserts = 0
+                connection.execute(
+                    "DELETE FROM telegram_file_id WHERE expires_at <= ?", (now,)
+                )
+                connection.execute(
+                    "DELETE FROM telegram_file_id WHERE rowid NOT IN "
+                    "(SELECT rowid FROM telegram_file_id "
+                    "ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_size,),
+                )
+
+    def _discard(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM telegram_file_id WHERE key = ?", (key,))
+
+    async def get(self, key: str) -> Optional[str]:
+        async with self._lock:
+            return await run_sync(self._get, key)
+
+    async def set(self, key: str, file_id: str) -> None:
+        async with self._lock:
+            await run_sync(self._set, key, file_id)
+
+    async def discard(self, key: str) -> None:
+        async with self._lock:
+            await run_sync(self._discard, key)
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+async def get_content_key(file: Any) -> Optional[str]:
+    """
+    :说明:
+      文件内容的缓存键。``bytes`` 使用内容的哈希，路径使用绝对路径、修改时间和大小。
+
+      ``file_id``、URL、文件对象和异步迭代器不缓存。
+    """
+    if isinstance(file, tuple):
+        filename, content = file
+        key = await get_content_key(content) if isinstance(content, bytes) else None
+        return f"{filename}:{key}" if key else None
+    if isinstance(file, bytes):
+        if len(file) > HASH_IN_THREAD_SIZE:
+            digest = await run_sync(hashlib.sha256, file)
+        else:
+            digest = hashlib.sha256(file)
+        return f"sha256:{digest.hexdigest()}"
+    if isinstance(file, (str, os.PathLike)):
+        try:
+            result = await anyio.Path(file).stat()
+        except (OSError, ValueError):
+            return None
+        if not stat.S_ISREG(result.st_mode):
+            return None
+        return f"path:{os.path.abspath(file)}:{result.st_mtime_ns}:{result.st_size}"
+    return None
+
+
+def _get_file_id(message: Any, type_: str) -> Optional[str]:
+    """返回消息中指定类型文件的 ``file_id``，图片使用最大的尺寸"""
+    if not isinstance(message, dict) or not (file := message.get(type_)):
+        return None
+    if isinstance(file, list):
+        file = file[-1]
+    return file.get("file_id")
+
+
+class CachedFile:
+    """一次请求中可以缓存的文件参数"""
+
+    def __init__(self, key: str, type_: str, index: Optional[int]):
+        self.key = key
+        self.type = type_
+        # 在 sendMediaGroup 返回的消息列表中的位置
+        self.index = index
+        self.file_id: Optional[str] = None
+        # 是否由本次请求上传，其他相同文件的请求等待上传完成
+        self.leading = False
+
+    def get_file_id(self, result: Any) -> Optional[str]:
+        if self.index is not None:
+            if not isinstance(result, list) or self.index >= len(result):
+                return None
+            result = result[self.index]
+        return _get_file_id(result, self.type)
+
+
+class FileIdCache:
+    """
+    :说明:
+      缓存上传文件后 Telegram 返回的 ``file_id``，再次发送相同的文件时只发送 ``file_id``。
+
+      ``file_id`` 只对获得它的机器人有效，且不能用于发送其他类型的文件，缓存键包含机器人和文件类型。
+
+      同时发送相同的文件时只有一个请求上传，其他请求等待上传完成后使用返回的 ``file_id``。
+    """
+
+    def __init__(self, backend: FileIdBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        # 等待其他请求上传后命中的次数
+        self.shared = 0
+        self._uploading: Dict[str, anyio.Event] = {}
+
+    async def resolve(
+        self, bot_id: str, api: str, data: Dict[str, Any]
+    ) -> List[CachedFile]:
+        """
+        :说明:
+          将 ``data`` 中已上传过的文件替换为 ``file_id``，返回可以缓存的文件参数。
+
+          ``InputMedia`` 会被复制后再修改，不会修改调用者传入的对象。
+          返回的文件参数需要在请求结束后调用 ``release``。
+        """
+        files: List[CachedFile] = []
+        try:
+            await self._resolve_data(bot_id, api, data, files)
+        except BaseException:
+            self.release(files)
+            raise
+        return files
+
+    async def _resolve_data(
+        self, bot_id: str, api: str, data: Dict[str, Any], files: List[CachedFile]
+    ) -> None:
+        if api.startswith("send_") and api[5:] in MEDIA_TYPES:
+            type_ = api[5:]
+            file = await self._resolve(bot_id, type_, data.get(type_), None, files)
+            if file:
+                files.append(file)
+                if file.file_id:
+                    data[type_] = file.file_id
+                    # 使用 file_id 发送时缩略图会被忽略
+                    data.pop("thumbnail", None)
+        elif api in ("send_media_group", "edit_message_media"):
+            media = data.get("media")
+            if isinstance(media, list):
+                data["media"] = items = [
+                    item.copy() if isinstance(item, BaseModel) else item
+                    for item in media
+                ]
+                indexes: List[Optional[int]] = list(range(len(items)))
+            elif isinstance(media, BaseModel):
+                data["media"] = media.copy()
+                items, indexes = [data["media"]], [None]
+            else:
+                items, indexes = [], []
+            for item, index in zip(items, indexes):
+                if not isinstance(item, BaseModel):
+                    continue
+                file = await self._resolve(
+                    bot_id, getattr(item, "type", ""), item.media, index, files  # type: ignore
+                )
+                if file:
+                    files.append(file)
+                    if file.file_id:
+                        item.media = file.file_id  # type: ignore
+                        if getattr(item, "thumbnail", None) is not None:
+                            item.thumbnail = None  # type: ignore
+
+    async def _resolve(
+        self,
+        bot_id: str,
+        type_: str,
+        file: Any,
+        index: Optional[int],
+        files: List[CachedFile],
+    ) -> Optional[CachedFile]:
+        if type_ not in MEDIA_TYPES or not (key := await get_content_key(file)):
+            return None
+        cached = CachedFile(f"{bot_id}:{type_}:{key}", type_, index)
+        waited = False
+        while not (file_id := await self.backend.get(cached.key)):
+            # 已经负责上传其他文件的请求不再等待，避免相互等待
+            if any(f.leading for f in files):
+                break
+            if (uploading := self._uploading.get(cached.key)) is None:
+                self._uploading[cached.key] = anyio.Event()
+                cached.leading = True
+                break
+            # 上传失败时由下一个请求重新上传
+            await uploading.wait()
+            waited = True
+        cached.file_id = file_id
+        if file_id:
+            self.hits += 1
+            self.shared += waited
+        else:
+            self.misses += 1
+        return cached
+
+    async def store(self, files: List[CachedFile], result: Any) -> None:
+        """保存请求返回的 ``file_id``"""
+        for file in files:
+            if not file.file_id and (file_id := file.get_file_id(result)):
+                await self.backend.set(file.key, file_id)
+
+    def release(self, files: List[CachedFile]) -> None:
+        """请求结束后唤醒等待相同文件上传的请求，无论上传是否成功"""
+        for file in files:
+            if file.leading:
+                file.leading = False
+                self._uploading.pop(file.key).set()
+
+    async def discard(self, files: List[CachedFile]) -> None:
+        """移除已失效的 ``file_id``"""
+        for file in files:
+            if file.file_id:
+                await self.backend.discard(file.key)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def get_file_id_backend(
+    backend: str, path: Optional[str], max_size: int, ttl: float
+) -> FileIdBackend:
+    if backend == "sqlite":
+        return SQLiteFileIdBackend(path or "telegram_file_id.db", max_size, ttl)
+    return MemoryFileIdBackend(max_size, ttl)
@@ -0,0 +1,80 @@
+import time
+import random
+from typing import Optional
+
+
+def backoff_delay(failures: int, base: float, maximum: float) -> float:
+    """指数退避，使用 full jitter 避免多个机器人同时重试"""
+    if failures <= 0:
+        return 0.0
+    return random.uniform(0, min(maximum, base * 2 ** (failures - 1)))
+
+
+class CircuitBreaker:
+    """
+    :说明:
+      API 服务器的熔断器。连续失败 ``threshold`` 次后熔断 ``timeout`` 秒，
+      期间不再发起请求；之后允许一次试探请求，成功则恢复，失败则再次熔断。
+
+      只记录网络错误和服务器错误，机器人自身的错误（如令牌失效）由 ``BotHealth`` 记录。
+    """
+
+    def __init__(self, threshold: int, timeout: float):
+        self.threshold = max(threshold, 1)
+        self.timeout = timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "open" if self.remaining > 0 else "half_open"
+
+    @property
+    def remaining(self) -> float:
+        """距离允许试探请求的剩余时间"""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.opened_at + self.timeout - time.monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+class BotHealth:
+    """
+    :说明:
+      机器人 long polling 的健康状态，可用于告警。
+    """
+
+    def __init__(self):
+        self.consecutive_failures = 0
+        self.last_success: Optional[float] = None
+        self.last_failure: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.consecutive_failures == 0
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self.last_success = time.time()
+
+    def record_failure(self, error: BaseException) -> None:
+        self.consecutive_failures += 1
+        self.last_failure = time.time()
+        self.last_error = repr(error)
+
+    def __repr__(self) -> str:
+        return (
+            f"<BotHealth failures={self.consecutive_failures} "
+            f"last_success={self.last_success} last_error={self.last_error}>"
+        )
@@ -1,11 +1,11 @@
-from typing import Any, Dict, List, Type, Tuple, Union, Literal, Iterable, Optional
+from typing import Any, Dict, List, Type, Union, Literal, Iterable, Optional
 
 from nonebot.typing import overrides
 
 from nonebot.adapters import Message as BaseMessage
 from nonebot.adapters import MessageSegment as BaseMessageSegment
 
-from .model import User, LabeledPrice
+from .model import User, InputFile, LabeledPrice
 
 
 class MessageSegment(BaseMessageSegment):
@@ -206,18 +206,18 @@ class Entity(MessageSegment):
 class File(MessageSegment):
     @staticmethod
     def photo(
-        file: Union[str, bytes, Tuple[str, bytes]], has_spoiler: Optional[bool] = None
+        file: Union[str, InputFile], has_spoiler: Optional[bool] = None
     ) -> "MessageSegment":
         return File("photo", {"file": file, "has_spoiler": has_spoiler})
 
     @staticmethod
-    def voice(file: Union[str, bytes, Tuple[str, bytes]]) -> "MessageSegment":
+    def voice(file: Union[str, InputFile]) -> "MessageSegment":
         return File("voice", {"file": file})
 
     @staticmethod
     def animation(
-        file: Union[str, bytes, Tuple[str, bytes]],
-        thumbnail: Union[None, str, bytes] = None,
+        file: Union[str, InputFile],
+        thumbnail: Union[None, str, InputFile] = None,
         has_spoiler: Optional[bool] = None,
     ) -> "MessageSegment":
         return File(
@@ -227,22 +227,22 @@ class File(MessageSegment):
 
     @staticmethod
     def audio(
-        file: Union[str, bytes, Tuple[str, bytes]],
-        thumbnail: Union[None, str, bytes] = None,
+        file: Union[str, InputFile],
+        thumbnail: Union[None, str, InputFile] = None,
     ) -> "MessageSegment":
         return File("audio", {"file": file, "thumbnail": thumbnail})
 
     @staticmethod
     def document(
-        file: Union[str, bytes, Tuple[str, bytes]],
-        thumbnail: Union[None, str, bytes] = None,
+        file: Union[str, InputFile],
+        thumbnail: Union[None, str, InputFile] = None,
     ) -> "MessageSegment":
         return File("document", {"file": file, "thumbnail": thumbnail})
 
     @staticmethod
     def video(
-        file: Union[str, bytes, Tuple[str, bytes]],
-        thumbnail: Union[None, str, bytes] = None,
+        file: Union[str, InputFile],
+        thumbnail: Union[None, str, InputFile] = None,
         has_spoiler: Optional[bool] = None,
     ) -> "MessageSegment":
         return File(
@@ -253,17 +253,22 @@ class File(MessageSegment):
 
 class UnCombinFile(File):
     @staticmethod
-    def sticker(file: Union[str, bytes, Tuple[str, bytes]]) -> "MessageSegment":
+    def sticker(file: Union[str, InputFile]) -> "MessageSegment":
         return File("sticker", {"file": file})
 
     @staticmethod
     def video_note(
-        file: Union[str, bytes, Tuple[str, bytes]],
-        thumbnail: Union[None, str, bytes] = None,
+        file: Union[str, InputFile],
+        thumbnail: Union[None, str, InputFile] = None,
     ) -> "MessageSegment":
         return File("video_note", {"file": file, "thumbnail": thumbnail})
 
 
+def _file_data(file: Dict[str, Any]) -> Dict[str, Any]:
+    """收到的文件消息段，``file_unique_id`` 用于下载缓存"""
+    return {"file": file["file_id"], "file_unique_id": file.get("file_unique_id")}
+
+
 class Message(BaseMessage[MessageSegment]):
     def __repr__(self) -> str:
         return "".join(repr(seg) for seg in self)
@@ -323,11 +328,11 @@ class Message(BaseMessage[MessageSegment]):
             del obj["document"]
         for key in tuple(obj.keys()):
             if key == "photo":
-                seg = File("photo", {"file": obj[key][-1]["file_id"], **kargs})
+                seg = File("photo", {**_file_data(obj[key][-1]), **kargs})
             elif key in ("voice", "audio", "animation", "document", "video"):
-                seg = File(key, {"file": obj[key]["file_id"]})
+                seg = File(key, _file_data(obj[key]))
             elif key in ("sticker", "video_note"):
-                seg = UnCombinFile(key, {"file": obj[key]["file_id"]})
+                seg = UnCombinFile(key, _file_data(obj[key]))
             elif key == "dice":
                 seg = MessageSegment(
                     key, {"emoji": obj[key]["emoji"], "value": obj[key]["value"]}
@@ -0,0 +1,1700 @@
+# 此文件由 scripts/generate_api_methods.py 根据 api.py 生成，请勿手动修改
+"""
+:说明:
+  API 方法的请求编码和响应解码函数。
+
+  编码函数将文件参数交给 ``upload`` 处理，``upload`` 返回文件的引用（如 ``attach://upload0``）。
+"""
+from typing import Any, Dict, List, Tuple, Union, Literal, Callable, Optional, Awaitable
+
+from pydantic import parse_obj_as
+
+from .model import (
+    Chat,
+    File,
+    Poll,
+    User,
+    Update,
+    BotName,
+    Message,
+    Sticker,
+    MessageId,
+    BotCommand,
+    ChatMember,
+    ForumTopic,
+    MenuButton,
+    StickerSet,
+    WebhookInfo,
+    GameHighScore,
+    BotDescription,
+    ChatInviteLink,
+    UserChatBoosts,
+    SentWebAppMessage,
+    UserProfilePhotos,
+    BotShortDescription,
+    ChatAdministratorRights,
+)
+
+Upload = Callable[[Any], Awaitable[Any]]
+Encoder = Callable[[Dict[str, Any], Upload], Awaitable[None]]
+Decoder = Callable[[Any], Any]
+
+
+def decode_get_updates(result: Any) -> List[Update]:
+    return [Update.parse_obj(item) for item in result]
+
+
+async def encode_set_webhook(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("certificate") is not None:
+        data["certificate"] = await upload(data["certificate"])
+
+
+def decode_set_webhook(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_webhook(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_webhook_info(result: Any) -> WebhookInfo:
+    return WebhookInfo.parse_obj(result)
+
+
+def decode_get_me(result: Any) -> User:
+    return User.parse_obj(result)
+
+
+def decode_log_out(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_close(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_send_message(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_forward_message(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_forward_messages(result: Any) -> List[MessageId]:
+    return [MessageId.parse_obj(item) for item in result]
+
+
+def decode_copy_message(result: Any) -> MessageId:
+    return MessageId.parse_obj(result)
+
+
+def decode_copy_messages(result: Any) -> List[MessageId]:
+    return [MessageId.parse_obj(item) for item in result]
+
+
+async def encode_send_photo(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("photo") is not None:
+        data["photo"] = await upload(data["photo"])
+
+
+def decode_send_photo(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+async def encode_send_audio(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("audio") is not None:
+        data["audio"] = await upload(data["audio"])
+    if data.get("thumbnail") is not None:
+        data["thumbnail"] = await upload(data["thumbnail"])
+
+
+def decode_send_audio(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+async def encode_send_document(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("document") is not None:
+        data["document"] = await upload(data["document"])
+    if data.get("thumbnail") is not None:
+        data["thumbnail"] = await upload(data["thumbnail"])
+
+
+def decode_send_document(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+async def encode_send_video(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("video") is not None:
+        data["video"] = await upload(data["video"])
+    if data.get("thumbnail") is not None:
+        data["thumbnail"] = await upload(data["thumbnail"])
+
+
+def decode_send_video(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+async def encode_send_animation(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("animation") is not None:
+        data["animation"] = await upload(data["animation"])
+    if data.get("thumbnail") is not None:
+        data["thumbnail"] = await upload(data["thumbnail"])
+
+
+def decode_send_animation(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+async def encode_send_voice(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("voice") is not None:
+        data["voice"] = await upload(data["voice"])
+
+
+def decode_send_voice(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+async def encode_send_video_note(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("video_note") is not None:
+        data["video_note"] = await upload(data["video_note"])
+    if data.get("thumbnail") is not None:
+        data["thumbnail"] = await upload(data["thumbnail"])
+
+
+def decode_send_video_note(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+async def encode_send_media_group(data: Dict[str, Any], upload: Upload) -> None:
+    for item in data.get("media") or ():
+        item.media = await upload(item.media)
+        if getattr(item, "thumbnail", None) is not None:
+            item.thumbnail = await upload(item.thumbnail)
+
+
+def decode_send_media_group(result: Any) -> List[Message]:
+    return [Message.parse_obj(item) for item in result]
+
+
+def decode_send_location(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_send_venue(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_send_contact(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_send_poll(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_send_dice(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_send_chat_action(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_message_reaction(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_user_profile_photos(result: Any) -> UserProfilePhotos:
+    return UserProfilePhotos.parse_obj(result)
+
+
+def decode_get_file(result: Any) -> File:
+    return File.parse_obj(result)
+
+
+def decode_ban_chat_member(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_unban_chat_member(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_restrict_chat_member(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_promote_chat_member(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_chat_administrator_custom_title(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_ban_chat_sender_chat(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_unban_chat_sender_chat(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_chat_permissions(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_export_chat_invite_link(result: Any) -> str:
+    return result
+
+
+def decode_create_chat_invite_link(result: Any) -> ChatInviteLink:
+    return ChatInviteLink.parse_obj(result)
+
+
+def decode_edit_chat_invite_link(result: Any) -> ChatInviteLink:
+    return ChatInviteLink.parse_obj(result)
+
+
+def decode_revoke_chat_invite_link(result: Any) -> ChatInviteLink:
+    return ChatInviteLink.parse_obj(result)
+
+
+def decode_approve_chat_join_request(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_decline_chat_join_request(result: Any) -> Literal[True]:
+    return result
+
+
+async def encode_set_chat_photo(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("photo") is not None:
+        data["photo"] = await upload(data["photo"])
+
+
+def decode_set_chat_photo(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_chat_photo(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_chat_title(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_chat_description(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_pin_chat_message(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_unpin_chat_message(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_unpin_all_chat_messages(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_leave_chat(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_chat(result: Any) -> Chat:
+    return Chat.parse_obj(result)
+
+
+def decode_get_chat_administrators(result: Any) -> List[ChatMember]:
+    return parse_obj_as(List[ChatMember], result)
+
+
+def decode_get_chat_member_count(result: Any) -> int:
+    return result
+
+
+def decode_get_chat_member(result: Any) -> ChatMember:
+    return parse_obj_as(ChatMember, result)
+
+
+def decode_set_chat_sticker_set(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_chat_sticker_set(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_forum_topic_icon_stickers(result: Any) -> List[Sticker]:
+    return [Sticker.parse_obj(item) for item in result]
+
+
+def decode_create_forum_topic(result: Any) -> ForumTopic:
+    return ForumTopic.parse_obj(result)
+
+
+def decode_edit_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_close_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_reopen_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_unpin_all_forum_topic_messages(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_edit_general_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_close_general_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_reopen_general_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_hide_general_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_unhide_general_forum_topic(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_unpin_all_general_forum_topic_messages(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_answer_callback_query(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_user_chat_boosts(result: Any) -> UserChatBoosts:
+    return UserChatBoosts.parse_obj(result)
+
+
+def decode_set_my_commands(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_my_commands(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_my_commands(result: Any) -> List[BotCommand]:
+    return [BotCommand.parse_obj(item) for item in result]
+
+
+def decode_set_my_name(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_my_name(result: Any) -> BotName:
+    return BotName.parse_obj(result)
+
+
+def decode_set_my_description(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_my_description(result: Any) -> BotDescription:
+    return BotDescription.parse_obj(result)
+
+
+def decode_set_my_short_description(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_my_short_description(result: Any) -> BotShortDescription:
+    return BotShortDescription.parse_obj(result)
+
+
+def decode_set_chat_menu_button(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_chat_menu_button(result: Any) -> MenuButton:
+    return parse_obj_as(MenuButton, result)
+
+
+def decode_set_my_default_administrator_rights(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_get_my_default_administrator_rights(result: Any) -> ChatAdministratorRights:
+    return ChatAdministratorRights.parse_obj(result)
+
+
+def decode_edit_message_text(result: Any) -> Union[Message, Literal[True]]:
+    return parse_obj_as(Union[Message, Literal[True]], result)
+
+
+def decode_edit_message_caption(result: Any) -> Union[Message, Literal[True]]:
+    return parse_obj_as(Union[Message, Literal[True]], result)
+
+
+async def encode_edit_message_media(data: Dict[str, Any], upload: Upload) -> None:
+    if (item := data.get("media")) is not None:
+        item.media = await upload(item.media)
+        if getattr(item, "thumbnail", None) is not None:
+            item.thumbnail = await upload(item.thumbnail)
+
+
+def decode_edit_message_media(result: Any) -> Union[Message, Literal[True]]:
+    return parse_obj_as(Union[Message, Literal[True]], result)
+
+
+def decode_edit_message_live_location(result: Any) -> Union[Message, Literal[True]]:
+    return parse_obj_as(Union[Message, Literal[True]], result)
+
+
+def decode_stop_message_live_location(result: Any) -> Union[Message, Literal[True]]:
+    return parse_obj_as(Union[Message, Literal[True]], result)
+
+
+def decode_edit_message_reply_markup(result: Any) -> Union[Message, Literal[True]]:
+    return parse_obj_as(Union[Message, Literal[True]], result)
+
+
+def decode_stop_poll(result: Any) -> Poll:
+    return Poll.parse_obj(result)
+
+
+def decode_delete_message(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_messages(result: Any) -> Literal[True]:
+    return result
+
+
+async def encode_send_sticker(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("sticker") is not None:
+        data["sticker"] = await upload(data["sticker"])
+
+
+def decode_send_sticker(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_get_sticker_set(result: Any) -> StickerSet:
+    return StickerSet.parse_obj(result)
+
+
+def decode_get_custom_emoji_stickers(result: Any) -> List[Sticker]:
+    return [Sticker.parse_obj(item) for item in result]
+
+
+async def encode_upload_sticker_file(data: Dict[str, Any], upload: Upload) -> None:
+    if data.get("sticker") is not None:
+        data["sticker"] = await upload(data["sticker"])
+
+
+def decode_upload_sticker_file(result: Any) -> File:
+    return File.parse_obj(result)
+
+
+async def encode_create_new_sticker_set(data: Dict[str, Any], upload: Upload) -> None:
+    for item in data.get("stickers") or ():
+        item.sticker = await upload(item.sticker)
+
+
+def decode_create_new_sticker_set(result: Any) -> Literal[True]:
+    return result
+
+
+async def encode_add_sticker_to_set(data: Dict[str, Any], upload: Upload) -> None:
+    if (item := data.get("sticker")) is not None:
+        item.sticker = await upload(item.sticker)
+
+
+def decode_add_sticker_to_set(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_sticker_position_in_set(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_sticker_from_set(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_sticker_emoji_list(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_sticker_keywords(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_sticker_mask_position(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_sticker_set_title(result: Any) -> Literal[True]:
+    return result
+
+
+async def encode_set_sticker_set_thumbnail(
+    data: Dict[str, Any], upload: Upload
+) -> None:
+    if data.get("thumbnail") is not None:
+        data["thumbnail"] = await upload(data["thumbnail"])
+
+
+def decode_set_sticker_set_thumbnail(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_custom_emoji_sticker_set_thumbnail(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_delete_sticker_set(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_answer_inline_query(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_answer_web_app_query(result: Any) -> SentWebAppMessage:
+    return SentWebAppMessage.parse_obj(result)
+
+
+def decode_send_invoice(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_create_invoice_link(result: Any) -> str:
+    return result
+
+
+def decode_answer_shipping_query(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_answer_pre_checkout_query(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_set_passport_data_errors(result: Any) -> Literal[True]:
+    return result
+
+
+def decode_send_game(result: Any) -> Message:
+    return Message.parse_obj(result)
+
+
+def decode_set_game_score(result: Any) -> Union[Message, Literal[True]]:
+    return parse_obj_as(Union[Message, Literal[True]], result)
+
+
+def decode_get_game_high_scores(result: Any) -> List[GameHighScore]:
+    return [GameHighScore.parse_obj(item) for item in result]
+
+
+# 方法名称 -> (Telegram 方法名称, 参数, 编码函数, 解码函数)
+METHODS: Dict[str, Tuple[str, Tuple[str, ...], Optional[Encoder], Decoder]] = {
+    "get_updates": (
+        "getUpdates",
+        ("offset", "limit", "timeout", "allowed_updates"),
+        None,
+        decode_get_updates,
+    ),
+    "set_webhook": (
+        "setWebhook",
+        (
+            "url",
+            "certificate",
+            "ip_address",
+            "max_connections",
+            "allowed_updates",
+            "drop_pending_updates",
+            "secret_token",
+        ),
+        encode_set_webhook,
+        decode_set_webhook,
+    ),
+    "delete_webhook": (
+        "deleteWebhook",
+        ("drop_pending_updates",),
+        None,
+        decode_delete_webhook,
+    ),
+    "get_webhook_info": (
+        "getWebhookInfo",
+        (),
+        None,
+        decode_get_webhook_info,
+    ),
+    "get_me": (
+        "getMe",
+        (),
+        None,
+        decode_get_me,
+    ),
+    "log_out": (
+        "logOut",
+        (),
+        None,
+        decode_log_out,
+    ),
+    "close": (
+        "close",
+        (),
+        None,
+        decode_close,
+    ),
+    "send_message": (
+        "sendMessage",
+        (
+            "chat_id",
+            "text",
+            "message_thread_id",
+            "parse_mode",
+            "entities",
+            "link_preview_options",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_message,
+    ),
+    "forward_message": (
+        "forwardMessage",
+        (
+            "chat_id",
+            "from_chat_id",
+            "message_id",
+            "message_thread_id",
+            "disable_notification",
+            "protect_content",
+        ),
+        None,
+        decode_forward_message,
+    ),
+    "forward_messages": (
+        "forwardMessages",
+        (
+            "chat_id",
+            "from_chat_id",
+            "message_ids",
+            "message_thread_id",
+            "disable_notification",
+            "protect_content",
+        ),
+        None,
+        decode_forward_messages,
+    ),
+    "copy_message": (
+        "copyMessage",
+        (
+            "chat_id",
+            "from_chat_id",
+            "message_id",
+            "message_thread_id",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_copy_message,
+    ),
+    "copy_messages": (
+        "copyMessages",
+        (
+            "chat_id",
+            "from_chat_id",
+            "message_ids",
+            "message_thread_id",
+            "disable_notification",
+            "protect_content",
+            "remove_caption",
+        ),
+        None,
+        decode_copy_messages,
+    ),
+    "send_photo": (
+        "sendPhoto",
+        (
+            "chat_id",
+            "photo",
+            "message_thread_id",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "has_spoiler",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_photo,
+        decode_send_photo,
+    ),
+    "send_audio": (
+        "sendAudio",
+        (
+            "chat_id",
+            "audio",
+            "message_thread_id",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "duration",
+            "performer",
+            "title",
+            "thumbnail",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_audio,
+        decode_send_audio,
+    ),
+    "send_document": (
+        "sendDocument",
+        (
+            "chat_id",
+            "document",
+            "message_thread_id",
+            "thumbnail",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "disable_content_type_detection",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_document,
+        decode_send_document,
+    ),
+    "send_video": (
+        "sendVideo",
+        (
+            "chat_id",
+            "video",
+            "message_thread_id",
+            "duration",
+            "width",
+            "height",
+            "thumbnail",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "has_spoiler",
+            "supports_streaming",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_video,
+        decode_send_video,
+    ),
+    "send_animation": (
+        "sendAnimation",
+        (
+            "chat_id",
+            "animation",
+            "message_thread_id",
+            "duration",
+            "width",
+            "height",
+            "thumbnail",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "has_spoiler",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_animation,
+        decode_send_animation,
+    ),
+    "send_voice": (
+        "sendVoice",
+        (
+            "chat_id",
+            "voice",
+            "message_thread_id",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "duration",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_voice,
+        decode_send_voice,
+    ),
+    "send_video_note": (
+        "sendVideoNote",
+        (
+            "chat_id",
+            "video_note",
+            "message_thread_id",
+            "duration",
+            "length",
+            "thumbnail",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_video_note,
+        decode_send_video_note,
+    ),
+    "send_media_group": (
+        "sendMediaGroup",
+        (
+            "chat_id",
+            "media",
+            "message_thread_id",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+        ),
+        encode_send_media_group,
+        decode_send_media_group,
+    ),
+    "send_location": (
+        "sendLocation",
+        (
+            "chat_id",
+            "latitude",
+            "longitude",
+            "message_thread_id",
+            "horizontal_accuracy",
+            "live_period",
+            "heading",
+            "proximity_alert_radius",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_location,
+    ),
+    "send_venue": (
+        "sendVenue",
+        (
+            "chat_id",
+            "latitude",
+            "longitude",
+            "title",
+            "address",
+            "message_thread_id",
+            "foursquare_id",
+            "foursquare_type",
+            "google_place_id",
+            "google_place_type",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_venue,
+    ),
+    "send_contact": (
+        "sendContact",
+        (
+            "chat_id",
+            "phone_number",
+            "first_name",
+            "message_thread_id",
+            "last_name",
+            "vcard",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_contact,
+    ),
+    "send_poll": (
+        "sendPoll",
+        (
+            "chat_id",
+            "question",
+            "options",
+            "message_thread_id",
+            "is_anonymous",
+            "type",
+            "allows_multiple_answers",
+            "correct_option_id",
+            "explanation",
+            "explanation_parse_mode",
+            "explanation_entities",
+            "open_period",
+            "close_date",
+            "is_closed",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_poll,
+    ),
+    "send_dice": (
+        "sendDice",
+        (
+            "chat_id",
+            "message_thread_id",
+            "emoji",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_dice,
+    ),
+    "send_chat_action": (
+        "sendChatAction",
+        ("chat_id", "action", "message_thread_id"),
+        None,
+        decode_send_chat_action,
+    ),
+    "set_message_reaction": (
+        "setMessageReaction",
+        ("chat_id", "message_id", "reaction", "is_big"),
+        None,
+        decode_set_message_reaction,
+    ),
+    "get_user_profile_photos": (
+        "getUserProfilePhotos",
+        ("user_id", "offset", "limit"),
+        None,
+        decode_get_user_profile_photos,
+    ),
+    "get_file": (
+        "getFile",
+        ("file_id",),
+        None,
+        decode_get_file,
+    ),
+    "ban_chat_member": (
+        "banChatMember",
+        ("chat_id", "user_id", "until_date", "revoke_messages"),
+        None,
+        decode_ban_chat_member,
+    ),
+    "unban_chat_member": (
+        "unbanChatMember",
+        ("chat_id", "user_id", "only_if_banned"),
+        None,
+        decode_unban_chat_member,
+    ),
+    "restrict_chat_member": (
+        "restrictChatMember",
+        (
+            "chat_id",
+            "user_id",
+            "permissions",
+            "use_independent_chat_permissions",
+            "until_date",
+        ),
+        None,
+        decode_restrict_chat_member,
+    ),
+    "promote_chat_member": (
+        "promoteChatMember",
+        (
+            "chat_id",
+            "user_id",
+            "is_anonymous",
+            "can_manage_chat",
+            "can_delete_messages",
+            "can_manage_video_chats",
+            "can_restrict_members",
+            "can_promote_members",
+            "can_change_info",
+            "can_invite_users",
+            "can_post_messages",
+            "can_edit_messages",
+            "can_pin_messages",
+            "can_post_stories",
+            "can_edit_stories",
+            "can_delete_stories",
+            "can_manage_topics",
+        ),
+        None,
+        decode_promote_chat_member,
+    ),
+    "set_chat_administrator_custom_title": (
+        "setChatAdministratorCustomTitle",
+        ("chat_id", "user_id", "custom_title"),
+        None,
+        decode_set_chat_administrator_custom_title,
+    ),
+    "ban_chat_sender_chat": (
+        "banChatSenderChat",
+        ("chat_id", "sender_chat_id"),
+        None,
+        decode_ban_chat_sender_chat,
+    ),
+    "unban_chat_sender_chat": (
+        "unbanChatSenderChat",
+        ("chat_id", "sender_chat_id"),
+        None,
+        decode_unban_chat_sender_chat,
+    ),
+    "set_chat_permissions": (
+        "setChatPermissions",
+        ("chat_id", "permissions", "use_independent_chat_permissions"),
+        None,
+        decode_set_chat_permissions,
+    ),
+    "export_chat_invite_link": (
+        "exportChatInviteLink",
+        ("chat_id",),
+        None,
+        decode_export_chat_invite_link,
+    ),
+    "create_chat_invite_link": (
+        "createChatInviteLink",
+        ("chat_id", "name", "expire_date", "member_limit", "creates_join_request"),
+        None,
+        decode_create_chat_invite_link,
+    ),
+    "edit_chat_invite_link": (
+        "editChatInviteLink",
+        (
+            "chat_id",
+            "invite_link",
+            "name",
+            "expire_date",
+            "member_limit",
+            "creates_join_request",
+        ),
+        None,
+        decode_edit_chat_invite_link,
+    ),
+    "revoke_chat_invite_link": (
+        "revokeChatInviteLink",
+        ("chat_id", "invite_link"),
+        None,
+        decode_revoke_chat_invite_link,
+    ),
+    "approve_chat_join_request": (
+        "approveChatJoinRequest",
+        ("chat_id", "user_id"),
+        None,
+        decode_approve_chat_join_request,
+    ),
+    "decline_chat_join_request": (
+        "declineChatJoinRequest",
+        ("chat_id", "user_id"),
+        None,
+        decode_decline_chat_join_request,
+    ),
+    "set_chat_photo": (
+        "setChatPhoto",
+        ("chat_id", "photo"),
+        encode_set_chat_photo,
+        decode_set_chat_photo,
+    ),
+    "delete_chat_photo": (
+        "deleteChatPhoto",
+        ("chat_id",),
+        None,
+        decode_delete_chat_photo,
+    ),
+    "set_chat_title": (
+        "setChatTitle",
+        ("chat_id", "title"),
+        None,
+        decode_set_chat_title,
+    ),
+    "set_chat_description": (
+        "setChatDescription",
+        ("chat_id", "description"),
+        None,
+        decode_set_chat_description,
+    ),
+    "pin_chat_message": (
+        "pinChatMessage",
+        ("chat_id", "message_id", "disable_notification"),
+        None,
+        decode_pin_chat_message,
+    ),
+    "unpin_chat_message": (
+        "unpinChatMessage",
+        ("chat_id", "message_id"),
+        None,
+        decode_unpin_chat_message,
+    ),
+    "unpin_all_chat_messages": (
+        "unpinAllChatMessages",
+        ("chat_id",),
+        None,
+        decode_unpin_all_chat_messages,
+    ),
+    "leave_chat": (
+        "leaveChat",
+        ("chat_id",),
+        None,
+        decode_leave_chat,
+    ),
+    "get_chat": (
+        "getChat",
+        ("chat_id",),
+        None,
+        decode_get_chat,
+    ),
+    "get_chat_administrators": (
+        "getChatAdministrators",
+        ("chat_id",),
+        None,
+        decode_get_chat_administrators,
+    ),
+    "get_chat_member_count": (
+        "getChatMemberCount",
+        ("chat_id",),
+        None,
+        decode_get_chat_member_count,
+    ),
+    "get_chat_member": (
+        "getChatMember",
+        ("chat_id", "user_id"),
+        None,
+        decode_get_chat_member,
+    ),
+    "set_chat_sticker_set": (
+        "setChatStickerSet",
+        ("chat_id", "sticker_set_name"),
+        None,
+        decode_set_chat_sticker_set,
+    ),
+    "delete_chat_sticker_set": (
+        "deleteChatStickerSet",
+        ("chat_id",),
+        None,
+        decode_delete_chat_sticker_set,
+    ),
+    "get_forum_topic_icon_stickers": (
+        "getForumTopicIconStickers",
+        (),
+        None,
+        decode_get_forum_topic_icon_stickers,
+    ),
+    "create_forum_topic": (
+        "createForumTopic",
+        ("chat_id", "name", "icon_color", "icon_custom_emoji_id"),
+        None,
+        decode_create_forum_topic,
+    ),
+    "edit_forum_topic": (
+        "editForumTopic",
+        ("chat_id", "message_thread_id", "name", "icon_custom_emoji_id"),
+        None,
+        decode_edit_forum_topic,
+    ),
+    "close_forum_topic": (
+        "closeForumTopic",
+        ("chat_id", "message_thread_id"),
+        None,
+        decode_close_forum_topic,
+    ),
+    "reopen_forum_topic": (
+        "reopenForumTopic",
+        ("chat_id", "message_thread_id"),
+        None,
+        decode_reopen_forum_topic,
+    ),
+    "delete_forum_topic": (
+        "deleteForumTopic",
+        ("chat_id", "message_thread_id"),
+        None,
+        decode_delete_forum_topic,
+    ),
+    "unpin_all_forum_topic_messages": (
+        "unpinAllForumTopicMessages",
+        ("chat_id", "message_thread_id"),
+        None,
+        decode_unpin_all_forum_topic_messages,
+    ),
+    "edit_general_forum_topic": (
+        "editGeneralForumTopic",
+        ("chat_id", "name"),
+        None,
+        decode_edit_general_forum_topic,
+    ),
+    "close_general_forum_topic": (
+        "closeGeneralForumTopic",
+        ("chat_id",),
+        None,
+        decode_close_general_forum_topic,
+    ),
+    "reopen_general_forum_topic": (
+        "reopenGeneralForumTopic",
+        ("chat_id",),
+        None,
+        decode_reopen_general_forum_topic,
+    ),
+    "hide_general_forum_topic": (
+        "hideGeneralForumTopic",
+        ("chat_id",),
+        None,
+        decode_hide_general_forum_topic,
+    ),
+    "unhide_general_forum_topic": (
+        "unhideGeneralForumTopic",
+        ("chat_id",),
+        None,
+        decode_unhide_general_forum_topic,
+    ),
+    "unpin_all_general_forum_topic_messages": (
+        "unpinAllGeneralForumTopicMessages",
+        ("chat_id",),
+        None,
+        decode_unpin_all_general_forum_topic_messages,
+    ),
+    "answer_callback_query": (
+        "answerCallbackQuery",
+        ("callback_query_id", "text", "show_alert", "url", "cache_time"),
+        None,
+        decode_answer_callback_query,
+    ),
+    "get_user_chat_boosts": (
+        "getUserChatBoosts",
+        ("chat_id", "user_id"),
+        None,
+        decode_get_user_chat_boosts,
+    ),
+    "set_my_commands": (
+        "setMyCommands",
+        ("commands", "scope", "language_code"),
+        None,
+        decode_set_my_commands,
+    ),
+    "delete_my_commands": (
+        "deleteMyCommands",
+        ("scope", "language_code"),
+        None,
+        decode_delete_my_commands,
+    ),
+    "get_my_commands": (
+        "getMyCommands",
+        ("scope", "language_code"),
+        None,
+        decode_get_my_commands,
+    ),
+    "set_my_name": (
+        "setMyName",
+        ("name", "language_code"),
+        None,
+        decode_set_my_name,
+    ),
+    "get_my_name": (
+        "getMyName",
+        ("language_code",),
+        None,
+        decode_get_my_name,
+    ),
+    "set_my_description": (
+        "setMyDescription",
+        ("description", "language_code"),
+        None,
+        decode_set_my_description,
+    ),
+    "get_my_description": (
+        "getMyDescription",
+        ("language_code",),
+        None,
+        decode_get_my_description,
+    ),
+    "set_my_short_description": (
+        "setMyShortDescription",
+        ("short_description", "language_code"),
+        None,
+        decode_set_my_short_description,
+    ),
+    "get_my_short_description": (
+        "getMyShortDescription",
+        ("language_code",),
+        None,
+        decode_get_my_short_description,
+    ),
+    "set_chat_menu_button": (
+        "setChatMenuButton",
+        ("chat_id", "menu_button"),
+        None,
+        decode_set_chat_menu_button,
+    ),
+    "get_chat_menu_button": (
+        "getChatMenuButton",
+        ("chat_id",),
+        None,
+        decode_get_chat_menu_button,
+    ),
+    "set_my_default_administrator_rights": (
+        "setMyDefaultAdministratorRights",
+        ("rights", "for_channels"),
+        None,
+        decode_set_my_default_administrator_rights,
+    ),
+    "get_my_default_administrator_rights": (
+        "getMyDefaultAdministratorRights",
+        ("for_channels",),
+        None,
+        decode_get_my_default_administrator_rights,
+    ),
+    "edit_message_text": (
+        "editMessageText",
+        (
+            "text",
+            "chat_id",
+            "message_id",
+            "inline_message_id",
+            "parse_mode",
+            "entities",
+            "link_preview_options",
+            "reply_markup",
+        ),
+        None,
+        decode_edit_message_text,
+    ),
+    "edit_message_caption": (
+        "editMessageCaption",
+        (
+            "chat_id",
+            "message_id",
+            "inline_message_id",
+            "caption",
+            "parse_mode",
+            "caption_entities",
+            "reply_markup",
+        ),
+        None,
+        decode_edit_message_caption,
+    ),
+    "edit_message_media": (
+        "editMessageMedia",
+        ("media", "chat_id", "message_id", "inline_message_id", "reply_markup"),
+        encode_edit_message_media,
+        decode_edit_message_media,
+    ),
+    "edit_message_live_location": (
+        "editMessageLiveLocation",
+        (
+            "latitude",
+            "longitude",
+            "chat_id",
+            "message_id",
+            "inline_message_id",
+            "horizontal_accuracy",
+            "heading",
+            "proximity_alert_radius",
+            "reply_markup",
+        ),
+        None,
+        decode_edit_message_live_location,
+    ),
+    "stop_message_live_location": (
+        "stopMessageLiveLocation",
+        ("chat_id", "message_id", "inline_message_id", "reply_markup"),
+        None,
+        decode_stop_message_live_location,
+    ),
+    "edit_message_reply_markup": (
+        "editMessageReplyMarkup",
+        ("chat_id", "message_id", "inline_message_id", "reply_markup"),
+        None,
+        decode_edit_message_reply_markup,
+    ),
+    "stop_poll": (
+        "stopPoll",
+        ("chat_id", "message_id", "reply_markup"),
+        None,
+        decode_stop_poll,
+    ),
+    "delete_message": (
+        "deleteMessage",
+        ("chat_id", "message_id"),
+        None,
+        decode_delete_message,
+    ),
+    "delete_messages": (
+        "deleteMessages",
+        ("chat_id", "message_ids"),
+        None,
+        decode_delete_messages,
+    ),
+    "send_sticker": (
+        "sendSticker",
+        (
+            "chat_id",
+            "sticker",
+            "message_thread_id",
+            "emoji",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        encode_send_sticker,
+        decode_send_sticker,
+    ),
+    "get_sticker_set": (
+        "getStickerSet",
+        ("name",),
+        None,
+        decode_get_sticker_set,
+    ),
+    "get_custom_emoji_stickers": (
+        "getCustomEmojiStickers",
+        ("custom_emoji_ids",),
+        None,
+        decode_get_custom_emoji_stickers,
+    ),
+    "upload_sticker_file": (
+        "uploadStickerFile",
+        ("user_id", "sticker", "sticker_format"),
+        encode_upload_sticker_file,
+        decode_upload_sticker_file,
+    ),
+    "create_new_sticker_set": (
+        "createNewStickerSet",
+        (
+            "user_id",
+            "name",
+            "title",
+            "stickers",
+            "sticker_format",
+            "sticker_type",
+            "needs_repainting",
+        ),
+        encode_create_new_sticker_set,
+        decode_create_new_sticker_set,
+    ),
+    "add_sticker_to_set": (
+        "addStickerToSet",
+        ("user_id", "name", "sticker"),
+        encode_add_sticker_to_set,
+        decode_add_sticker_to_set,
+    ),
+    "set_sticker_position_in_set": (
+        "setStickerPositionInSet",
+        ("sticker", "position"),
+        None,
+        decode_set_sticker_position_in_set,
+    ),
+    "delete_sticker_from_set": (
+        "deleteStickerFromSet",
+        ("sticker",),
+        None,
+        decode_delete_sticker_from_set,
+    ),
+    "set_sticker_emoji_list": (
+        "setStickerEmojiList",
+        ("sticker", "emoji_list"),
+        None,
+        decode_set_sticker_emoji_list,
+    ),
+    "set_sticker_keywords": (
+        "setStickerKeywords",
+        ("sticker", "keywords"),
+        None,
+        decode_set_sticker_keywords,
+    ),
+    "set_sticker_mask_position": (
+        "setStickerMaskPosition",
+        ("sticker", "mask_position"),
+        None,
+        decode_set_sticker_mask_position,
+    ),
+    "set_sticker_set_title": (
+        "setStickerSetTitle",
+        ("name", "title"),
+        None,
+        decode_set_sticker_set_title,
+    ),
+    "set_sticker_set_thumbnail": (
+        "setStickerSetThumbnail",
+        ("name", "user_id", "thumbnail"),
+        encode_set_sticker_set_thumbnail,
+        decode_set_sticker_set_thumbnail,
+    ),
+    "set_custom_emoji_sticker_set_thumbnail": (
+        "setCustomEmojiStickerSetThumbnail",
+        ("name", "custom_emoji_id"),
+        None,
+        decode_set_custom_emoji_sticker_set_thumbnail,
+    ),
+    "delete_sticker_set": (
+        "deleteStickerSet",
+        ("name",),
+        None,
+        decode_delete_sticker_set,
+    ),
+    "answer_inline_query": (
+        "answerInlineQuery",
+        (
+            "inline_query_id",
+            "results",
+            "cache_time",
+            "is_personal",
+            "next_offset",
+            "button",
+        ),
+        None,
+        decode_answer_inline_query,
+    ),
+    "answer_web_app_query": (
+        "answerWebAppQuery",
+        ("web_app_query_id", "result"),
+        None,
+        decode_answer_web_app_query,
+    ),
+    "send_invoice": (
+        "sendInvoice",
+        (
+            "chat_id",
+            "title",
+            "description",
+            "payload",
+            "provider_token",
+            "currency",
+            "prices",
+            "message_thread_id",
+            "max_tip_amount",
+            "suggested_tip_amounts",
+            "start_parameter",
+            "provider_data",
+            "photo_url",
+            "photo_size",
+            "photo_width",
+            "photo_height",
+            "need_name",
+            "need_phone_number",
+            "need_email",
+            "need_shipping_address",
+            "send_phone_number_to_provider",
+            "send_email_to_provider",
+            "is_flexible",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_invoice,
+    ),
+    "create_invoice_link": (
+        "createInvoiceLink",
+        (
+            "title",
+            "description",
+            "payload",
+            "provider_token",
+            "currency",
+            "prices",
+            "max_tip_amount",
+            "suggested_tip_amounts",
+            "provider_data",
+            "photo_url",
+            "photo_size",
+            "photo_width",
+            "photo_height",
+            "need_name",
+            "need_phone_number",
+            "need_email",
+            "need_shipping_address",
+            "send_phone_number_to_provider",
+            "send_email_to_provider",
+            "is_flexible",
+        ),
+        None,
+        decode_create_invoice_link,
+    ),
+    "answer_shipping_query": (
+        "answerShippingQuery",
+        ("shipping_query_id", "ok", "shipping_options", "error_message"),
+        None,
+        decode_answer_shipping_query,
+    ),
+    "answer_pre_checkout_query": (
+        "answerPreCheckoutQuery",
+        ("pre_checkout_query_id", "ok", "error_message"),
+        None,
+        decode_answer_pre_checkout_query,
+    ),
+    "set_passport_data_errors": (
+        "setPassportDataErrors",
+        ("user_id", "errors"),
+        None,
+        decode_set_passport_data_errors,
+    ),
+    "send_game": (
+        "sendGame",
+        (
+            "chat_id",
+            "game_short_name",
+            "message_thread_id",
+            "disable_notification",
+            "protect_content",
+            "reply_parameters",
+            "reply_markup",
+        ),
+        None,
+        decode_send_game,
+    ),
+    "set_game_score": (
+        "setGameScore",
+        (
+            "user_id",
+            "score",
+            "force",
+            "disable_edit_message",
+            "chat_id",
+            "message_id",
+            "inline_message_id",
+        ),
+        None,
+        decode_set_game_score,
+    ),
+    "get_game_high_scores": (
+        "getGameHighScores",
+        ("user_id", "chat_id", "message_id", "inline_message_id"),
+        None,
+        decode_get_game_high_scores,
+    ),
+}
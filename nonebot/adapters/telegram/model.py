@@ -1,4 +1,17 @@
-from typing import List, Tuple, Union, Literal, Optional
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    List,
+    Tuple,
+    Union,
+    Literal,
+    Callable,
+    Iterator,
+    Optional,
+    AsyncIterable,
+)
 
 from pydantic import Field, BaseModel
 
@@ -1120,12 +1133,36 @@ class ResponseParameters(BaseModel):
     retry_after: Optional[int] = None
 
 
-InputFile = Union[bytes, Tuple[str, bytes]]
+if TYPE_CHECKING:
+    InputFileStream = Union[IO[bytes], AsyncIterable[bytes]]
+else:
+
+    class InputFileStream:
+        """
+        :说明:
+          上传时分块读取的文件内容，可以是以二进制模式打开的文件对象或产生 ``bytes`` 的异步迭代器。
+        """
+
+        @classmethod
+        def __get_validators__(cls) -> Iterator[Callable[[Any], Any]]:
+            yield cls.validate
+
+        @classmethod
+        def validate(cls, value: Any) -> Any:
+            if hasattr(value, "read") or hasattr(value, "__aiter__"):
+                return value
+            raise TypeError("file object or async iterable required")
+
+
+# 包含 InputFile 的模型需要设置 smart_union，否则 file_id 会被转换为 bytes
+InputFile = Union[
+    bytes, Tuple[str, bytes], InputFileStream, Tuple[str, InputFileStream], Path
+]
 
 
 class InputMediaAnimation(BaseModel):
     type: Literal["animation"] = "animation"
-    media: str
+    media: Union[str, InputFile]
     thumbnail: Optional[Union[InputFile, str]] = None
     caption: Optional[str] = None
     parse_mode: Optional[Literal["MarkdownV2", "Markdown" "HTML"]] = None
@@ -1135,20 +1172,26 @@ class InputMediaAnimation(BaseModel):
     duration: Optional[int] = None
     has_spoiler: Optional[bool] = None
 
+    class Config:
+        smart_union = True
+
 
 class InputMediaDocument(BaseModel):
     type: Literal["document"] = "document"
-    media: str
+    media: Union[str, InputFile]
     thumbnail: Optional[Union[InputFile, str]] = None
     caption: Optional[str] = None
     parse_mode: Optional[Literal["MarkdownV2", "Markdown" "HTML"]] = None
     caption_entities: Optional[List[MessageEntity]] = None
     disable_content_type_detection: Optional[bool] = None
 
+    class Config:
+        smart_union = True
+
 
 class InputMediaAudio(BaseModel):
     type: Literal["audio"] = "audio"
-    media: str
+    media: Union[str, InputFile]
     thumbnail: Optional[Union[InputFile, str]] = None
     caption: Optional[str] = None
     parse_mode: Optional[Literal["MarkdownV2", "Markdown" "HTML"]] = None
@@ -1157,19 +1200,25 @@ class InputMediaAudio(BaseModel):
     performer: Optional[str] = None
     title: Optional[str] = None
 
+    class Config:
+        smart_union = True
+
 
 class InputMediaPhoto(BaseModel):
     type: Literal["photo"] = "photo"
-    media: str
+    media: Union[str, InputFile]
     caption: Optional[str] = None
     parse_mode: Optional[Literal["MarkdownV2", "Markdown" "HTML"]] = None
     caption_entities: Optional[List[MessageEntity]] = None
     has_spoiler: Optional[bool] = None
 
+    class Config:
+        smart_union = True
+
 
 class InputMediaVideo(BaseModel):
     type: Literal["video"] = "video"
-    media: str
+    media: Union[str, InputFile]
     thumbnail: Optional[Union[InputFile, str]] = None
     caption: Optional[str] = None
     parse_mode: Optional[Literal["MarkdownV2", "Markdown" "HTML"]] = None
@@ -1180,6 +1229,9 @@ class InputMediaVideo(BaseModel):
     supports_streaming: Optional[bool] = None
     has_spoiler: Optional[bool] = None
 
+    class Config:
+        smart_union = True
+
 
 InputMedia = Union[
     InputMediaAnimation,
@@ -1206,6 +1258,9 @@ class InputSticker(BaseModel):
     mask_position: Optional[MaskPosition] = None
     keywords: Optional[List[str]] = None
 
+    class Config:
+        smart_union = True
+
 
 class InlineQueryResultsButton(BaseModel):
     text: str
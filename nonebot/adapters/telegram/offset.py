@@ -0,0 +1,182 @@
+import os
+import json
+import asyncio
+import sqlite3
+from pathlib import Path
+from collections import deque
+from abc import ABC, abstractmethod
+from typing import Set, Dict, Deque, Union, Optional
+
+import anyio
+from anyio.to_thread import run_sync
+
+
+class OffsetStore(ABC):
+    """
+    :说明:
+      long polling 的 update offset 存储，用于重启后从上次处理完成的位置继续拉取更新。
+    """
+
+    @abstractmethod
+    async def load(self, bot_id: str) -> Optional[int]:
+        """读取机器人下一次需要拉取的 offset"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, bot_id: str, offset: int) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryOffsetStore(OffsetStore):
+    def __init__(self):
+        self._offsets: Dict[str, int] = {}
+
+    async def load(self, bot_id: str) -> Optional[int]:
+        return self._offsets.get(bot_id)
+
+    async def save(self, bot_id: str, offset: int) -> None:
+        self._offsets[bot_id] = offset
+
+
+class FileOffsetStore(OffsetStore):
+    """将所有机器人的 offset 保存在一个 JSON 文件中，写入时先写临时文件再替换"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._offsets: Optional[Dict[str, int]] = None
+        self._lock = anyio.Lock()
+
+    async def _read(self) -> Dict[str, int]:
+        if self._offsets is None:
+            path = anyio.Path(self.path)
+            self._offsets = (
+                json.loads(await path.read_text()) if await path.exists() else {}
+            )
+        return self._offsets
+
+    def _write(self, offsets: Dict[str, int]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f".{self.path.name}.tmp")
+        temp.write_text(json.dumps(offsets))
+        os.replace(temp, self.path)
+
+    async def load(self, bot_id: str) -> Optional[int]:
+        async with self._lock:
+            return (await self._read()).get(bot_id)
+
+    async def save(self, bot_id: str, offset: int) -> None:
+        async with self._lock:
+            offsets = await self._read()
+            if offsets.get(bot_id) == offset:
+                return
+            offsets[bot_id] = offset
+            await run_sync(self._write, dict(offsets))
+
+
+class SQLiteOffsetStore(OffsetStore):
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = anyio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS telegram_offset "
+                "(bot_id TEXT PRIMARY KEY, update_offset INTEGER NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _load(self, bot_id: str) -> Optional[int]:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT update_offset FROM telegram_offset WHERE bot_id = ?", (bot_id,)
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def _save(self, bot_id: str, offset: int) -> None:
+        connection = self._connect()
+        connection.execute(
+            "INSERT INTO telegram_offset (bot_id, update_offset) VALUES (?, ?) "
+            "ON CONFLICT(bot_id) DO UPDATE SET update_offset = excluded.update_offset",
+            (bot_id, offset),
+        )
+        connection.commit()
+
+    async def load(self, bot_id: str) -> Optional[int]:
+        async with self._lock:
+            return await run_sync(self._load, bot_id)
+
+    async def save(self, bot_id: str, offset: int) -> None:
+        async with self._lock:
+            await run_sync(self._save, bot_id, offset)
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class OffsetTracker:
+    """
+    :说明:
+      记录一个机器人已拉取但尚未处理完成的更新。
+
+      事件在不同会话中并行处理，完成顺序与 ``update_id`` 顺序不同，
+      ``offset`` 始终是第一个未处理完成的更新，保证重启后不会跳过任何更新。
+    """
+
+    def __init__(self, offset: Optional[int] = None):
+        self.offset = offset
+        self.saved = offset
+        self._pending: Deque[int] = deque()
+        self._done: Set[int] = set()
+        self._changed = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def dirty(self) -> bool:
+        return self.offset is not None and self.offset != self.saved
+
+    def begin(self, update_id: int) -> None:
+        if not self._pending and self.offset is None:
+            self.offset = update_id
+        self._pending.append(update_id)
+        self._idle.clear()
+
+    def done(self, update_id: int) -> None:
+        self._done.add(update_id)
+        while self._pending and self._pending[0] in self._done:
+            self._done.remove(finished := self._pending.popleft())
+            self.offset = finished + 1
+            self._changed.set()
+        if not self._pending:
+            self._idle.set()
+
+    async def wait_changed(self) -> None:
+        """等待 ``offset`` 前移"""
+        await self._changed.wait()
+        self._changed.clear()
+
+    async def wait_idle(self) -> None:
+        """等待所有已拉取的更新处理完成"""
+        await self._idle.wait()
+
+
+def get_offset_store(store: str, path: Optional[str]) -> OffsetStore:
+    if store == "file":
+        return FileOffsetStore(path or "telegram_offset.json")
+    if store == "sqlite":
+        return SQLiteOffsetStore(path or "telegram_offset.db")
+    return MemoryOffsetStore()
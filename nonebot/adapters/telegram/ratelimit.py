@@ -0,0 +1,132 @@
+import time
+import asyncio
+from typing import Dict, Tuple, Union, Optional
+
+# 会发送消息的方法受发送频率限制
+LIMITED_METHOD_PREFIXES = ("send", "forward", "copy")
+# 不发送消息的方法，不占用发送额度，避免延迟随后发送的消息
+UNLIMITED_METHODS = ("sendChatAction",)
+
+
+def is_limited(api: str) -> bool:
+    """``api`` 是否受发送频率限制"""
+    return api.startswith(LIMITED_METHOD_PREFIXES) and api not in UNLIMITED_METHODS
+
+
+class TokenBucket:
+    """
+    :说明:
+      令牌桶，每 ``period`` 秒最多 ``limit`` 个请求。
+
+      调用 ``reserve`` 时按调用顺序预约令牌，先调用的请求先发送。
+    """
+
+    def __init__(self, limit: int, period: float):
+        self.interval = period / max(limit, 1)
+        # 允许连续发送 limit 个请求
+        self.tolerance = self.interval * (max(limit, 1) - 1)
+        self._next = 0.0
+
+    def reserve(self) -> float:
+        """预约一个令牌，返回需要等待的时间"""
+        now = time.monotonic()
+        self._next = max(self._next, now)
+        wait = max(self._next - self.tolerance - now, 0.0)
+        self._next += self.interval
+        return wait
+
+    @property
+    def idle(self) -> bool:
+        return self._next <= time.monotonic()
+
+
+class RateLimitStats:
+    """
+    :说明:
+      发送频率限制的排队统计，单位为秒。
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.delayed = 0
+        self.waiting = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self.total_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.requests += 1
+        self.last_wait = wait
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if wait > 0:
+            self.delayed += 1
+
+    @property
+    def avg_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<RateLimitStats requests={self.requests} delayed={self.delayed} "
+            f"waiting={self.waiting} avg_wait={self.avg_wait:.3f}s "
+            f"max_wait={self.max_wait:.3f}s>"
+        )
+
+
+class RateLimiter:
+    """
+    :说明:
+      一个机器人的发送频率限制。请求超出限制时排队等待而不是被拒绝。
+
+      请求先在所属聊天的令牌桶排队，再在全局令牌桶排队，
+      消息较多的聊天只会在自己的队列中等待，不会占用其他聊天的全局额度。
+    """
+
+    def __init__(
+        self,
+        global_limit: Tuple[int, float],
+        private_limit: Tuple[int, float],
+        group_limit: Tuple[int, float],
+    ):
+        self.global_bucket = TokenBucket(*global_limit)
+        self.private_limit = private_limit
+        self.group_limit = group_limit
+        self.chat_buckets: Dict[Union[int, str], TokenBucket] = {}
+        self.stats = RateLimitStats()
+
+    def _get_chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        if isinstance(chat_id, str) and chat_id.lstrip("-").isdigit():
+            chat_id = int(chat_id)
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            # 清理空闲的令牌桶，避免记录过多聊天
+            if len(self.chat_buckets) >= 1024:
+                self.chat_buckets = {
+                    key: value
+                    for key, value in self.chat_buckets.items()
+                    if not value.idle
+                }
+            # 用户 ID 为正数，群组和频道 ID 为负数或 @username
+            private = isinstance(chat_id, int) and chat_id > 0
+            bucket = self.chat_buckets[chat_id] = TokenBucket(
+                *(self.private_limit if private else self.group_limit)
+            )
+        return bucket
+
+    async def acquire(self, chat_id: Optional[Union[int, str]]) -> float:
+        """等待发送额度，返回排队时间"""
+        waited = 0.0
+        self.stats.waiting += 1
+        try:
+            if chat_id is not None:
+                if wait := self._get_chat_bucket(chat_id).reserve():
+                    await asyncio.sleep(wait)
+                    waited += wait
+            if wait := self.global_bucket.reserve():
+                await asyncio.sleep(wait)
+                waited += wait
+        finally:
+            self.stats.waiting -= 1
+        self.stats.record(waited)
+        return waited
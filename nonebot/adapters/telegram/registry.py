@@ -0,0 +1,59 @@
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Type, Tuple, Optional
+
+from .methods import METHODS, Decoder, Encoder
+
+if TYPE_CHECKING:
+    from .bot import Bot
+
+
+def to_camel(name: str) -> str:
+    """将方法名称改为驼峰式"""
+    first, *rest = name.split("_")
+    return first + "".join(s.capitalize() for s in rest)
+
+
+class APIMethod:
+    """
+    :说明:
+      ``API`` 中一个方法的元数据，由 ``methods.py`` 中生成的代码构建，调用时不再反射。
+
+      同时作为 ``Bot`` 上的描述符，第一次访问时将绑定的调用缓存到机器人实例上。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        params: Tuple[str, ...],
+        encode: Optional[Encoder],
+        decode: Decoder,
+    ):
+        self.name = name
+        self.method = method
+        self.params = params
+        self.encode = encode
+        self.decode = decode
+
+    def bind(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """按参数顺序将位置参数转为关键字参数，未提供的参数为 ``None``"""
+        args_ = iter(args)
+        for param in self.params:
+            if param not in kwargs:
+                kwargs[param] = next(args_, None)
+        return kwargs
+
+    def parse_result(self, result: Any) -> Any:
+        """将 API 返回的数据转为返回值类型"""
+        return self.decode(result)
+
+    def __get__(self, bot: Optional["Bot"], owner: Type["Bot"]) -> Any:
+        if bot is None:
+            return self
+        call = bot.__dict__[self.name] = partial(bot.call_api, self.name)
+        return call
+
+
+API_METHODS: Dict[str, APIMethod] = {
+    name: APIMethod(name, *metadata) for name, metadata in METHODS.items()
+}
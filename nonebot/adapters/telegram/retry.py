@@ -0,0 +1,67 @@
+from typing import Optional
+
+from .health import backoff_delay
+from .exception import RetryAfter, NetworkError
+
+# 重复调用不会产生额外影响的方法，网络错误时请求可能已被执行，只有这些方法可以重试
+IDEMPOTENT_METHOD_PREFIXES = (
+    "get",
+    "set",
+    "delete",
+    "edit",
+    "pin",
+    "unpin",
+    "ban",
+    "unban",
+    "restrict",
+    "promote",
+    "approve",
+    "decline",
+    "close",
+    "reopen",
+    "hide",
+    "unhide",
+    "leave",
+    "stop",
+    "log",
+)
+# 由调用者负责重试的方法，long polling 的 getUpdates 失败后由 poll 退避并计入健康状态和熔断
+UNRETRIED_METHODS = ("getUpdates",)
+
+
+class RetryPolicy:
+    """
+    :说明:
+      API 请求的重试策略。
+
+      * ``RetryAfter``: 请求未被执行，等待 ``retry_after`` 秒后重试，超过 ``max_retry_after`` 时不重试
+      * ``ServerError`` 和 ``NetworkError``: 请求可能已被执行，
+        仅重试幂等的方法（见 ``IDEMPOTENT_METHOD_PREFIXES``），使用指数退避
+      * ``UNRETRIED_METHODS`` 中的方法不重试
+    """
+
+    def __init__(
+        self,
+        max_retries: int,
+        max_retry_after: float,
+        backoff_base: float,
+        backoff_max: float,
+    ):
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def get_delay(self, method: str, attempt: int, error: Exception) -> Optional[float]:
+        """第 ``attempt`` 次请求失败后的重试等待时间，不应重试时返回 ``None``"""
+        if attempt > self.max_retries or method in UNRETRIED_METHODS:
+            return None
+        if isinstance(error, RetryAfter):
+            retry_after = error.retry_after or 0
+            return retry_after if retry_after <= self.max_retry_after else None
+        # ServerError 是 NetworkError 的子类
+        if isinstance(error, NetworkError) and method.startswith(
+            IDEMPOTENT_METHOD_PREFIXES
+        ):
+            return backoff_delay(attempt, self.backoff_base, self.backoff_max)
+        return None
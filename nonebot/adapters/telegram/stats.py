@@ -0,0 +1,52 @@
+class PollStats:
+    """
+    :说明:
+      long polling 的批次延迟统计，单位为秒。
+
+      * ``fetch``: 从发出 ``getUpdates`` 到收到响应的耗时
+      * ``process``: 解析并分发一个批次的耗时
+      * ``fetch_delay``: 从收到批次到发出下一次 ``getUpdates`` 的间隔，即拉取被本地处理阻塞的时间
+    """
+
+    def __init__(self):
+        self.fetches = 0
+        self.batches = 0
+        self.updates = 0
+        self.last_fetch = 0.0
+        self.last_process = 0.0
+        self.last_fetch_delay = 0.0
+        self.total_fetch = 0.0
+        self.total_process = 0.0
+        self.total_fetch_delay = 0.0
+
+    def record_fetch(self, elapsed: float, delay: float) -> None:
+        self.fetches += 1
+        self.last_fetch = elapsed
+        self.last_fetch_delay = delay
+        self.total_fetch += elapsed
+        self.total_fetch_delay += delay
+
+    def record_process(self, elapsed: float, updates: int) -> None:
+        self.batches += 1
+        self.updates += updates
+        self.last_process = elapsed
+        self.total_process += elapsed
+
+    @property
+    def avg_fetch(self) -> float:
+        return self.total_fetch / self.fetches if self.fetches else 0.0
+
+    @property
+    def avg_process(self) -> float:
+        return self.total_process / self.batches if self.batches else 0.0
+
+    @property
+    def avg_fetch_delay(self) -> float:
+        return self.total_fetch_delay / self.fetches if self.fetches else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<PollStats batches={self.batches} updates={self.updates} "
+            f"fetch={self.last_fetch:.3f}s process={self.last_process:.3f}s "
+            f"fetch_delay={self.last_fetch_delay:.3f}s>"
+        )
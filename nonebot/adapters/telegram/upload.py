@@ -0,0 +1,79 @@
+import os
+import tempfile
+from typing import IO, Dict, List, Tuple, Union, Optional, AsyncIterable
+
+import anyio
+
+from .model import InputFile
+
+FileContent = Union[bytes, IO[bytes]]
+
+
+class UploadFiles:
+    """
+    :说明:
+      一次 API 请求中上传的文件，作为 multipart 请求的 ``files`` 发送。
+
+      路径在请求时才打开，文件对象直接交给驱动器分块读取，
+      异步迭代器逐块写入临时文件，上传的文件不会一次性读入内存。
+    """
+
+    def __init__(self):
+        self.files: Dict[str, Tuple[str, FileContent]] = {}
+        self._count = 0
+        # 由这里打开的文件，请求结束后关闭
+        self._owned: List[IO[bytes]] = []
+        # 可以 seek 的文件及其起始位置，重试前回到起始位置
+        self._positions: List[Tuple[IO[bytes], int]] = []
+
+    async def add(self, file: Union[InputFile, str]) -> Optional[str]:
+        """添加上传的文件并返回 ``attach://`` 使用的名称，``file_id`` 和 URL 返回 ``None``"""
+        filename: Optional[str] = None
+        if isinstance(file, tuple):
+            filename, file = file
+        elif isinstance(file, str) and not await anyio.Path(file).is_file():
+            return None
+
+        content: FileContent
+        if isinstance(file, (str, os.PathLike)):
+            content = await anyio.to_thread.run_sync(open, file, "rb")
+            self._owned.append(content)
+            filename = filename or os.path.basename(file)
+        elif hasattr(file, "__aiter__"):
+            content = await self._spool(file)  # type: ignore
+        elif hasattr(file, "read"):
+            content = file  # type: ignore
+            name = getattr(file, "name", None)
+            if not filename and isinstance(name, str):
+                filename = os.path.basename(name)
+        else:
+            content = file  # type: ignore
+
+        if hasattr(content, "seekable") and content.seekable():  # type: ignore
+            self._positions.append((content, content.tell()))  # type: ignore
+
+        key = filename
+        if not key or key in self.files:
+            key = f"upload{self._count}"
+            self._count += 1
+        self.files[key] = (filename or key, content)
+        return key
+
+    async def _spool(self, stream: AsyncIterable[bytes]) -> IO[bytes]:
+        """将异步迭代器写入临时文件，驱动器只接受文件对象"""
+        file = anyio.wrap_file(await anyio.to_thread.run_sync(tempfile.TemporaryFile))
+        self._owned.append(file.wrapped)
+        async for chunk in stream:
+            await file.write(chunk)
+        await file.seek(0)
+        return file.wrapped
+
+    def rewind(self) -> None:
+        """重试请求前将文件回到起始位置"""
+        for file, position in self._positions:
+            file.seek(position)
+
+    def close(self) -> None:
+        for file in self._owned:
+            file.close()
+        self._owned.clear()
@@ -0,0 +1,67 @@
+import asyncio
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from .bot import Bot
+
+# 结果不被需要的 API 才能合并到 webhook 响应中，Telegram 不会返回其结果
+REPLY_METHOD_PREFIXES = (
+    "send",
+    "answer",
+    "edit",
+    "delete",
+    "pin",
+    "unpin",
+    "set",
+    "ban",
+    "unban",
+    "restrict",
+    "promote",
+    "approve",
+    "decline",
+    "leave",
+    "stop",
+)
+
+
+class WebhookReply:
+    """
+    :说明:
+      将处理 webhook 事件时的第一次 API 调用合并到 webhook 响应中。
+
+      第一次调用如果不是可合并的 API（见 ``REPLY_METHOD_PREFIXES``）或包含文件，则不再合并任何调用。
+    """
+
+    def __init__(self, bot: "Bot"):
+        self.bot = bot
+        self._future: "asyncio.Future[Optional[Dict[str, Any]]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def capture(self, bot: "Bot", method: str, data: Optional[Dict[str, Any]]) -> bool:
+        """尝试合并调用，成功时返回 ``True``，此时不应再发送请求"""
+        if bot is not self.bot or self._future.done():
+            return False
+        if data is None or not method.startswith(REPLY_METHOD_PREFIXES):
+            self.close()
+            return False
+        self._future.set_result({"method": method, **data})
+        return True
+
+    def close(self) -> None:
+        if not self._future.done():
+            self._future.set_result(None)
+
+    async def wait(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """等待被合并的调用，超时或事件处理完成时返回 ``None``"""
+        try:
+            return await asyncio.wait_for(asyncio.shield(self._future), timeout)
+        except asyncio.TimeoutError:
+            self.close()
+            return self._future.result()
+
+
+current_webhook_reply: ContextVar[Optional[WebhookReply]] = ContextVar(
+    "telegram_webhook_reply", default=None
+)
@@ -0,0 +1,245 @@
+"""
+根据 ``nonebot/adapters/telegram/api.py`` 中 ``API`` 的方法签名生成 ``methods.py``，
+为每个 API 方法生成请求编码函数（上传文件参数）和响应解码函数。
+
+修改 ``api.py`` 后运行：``python scripts/generate_api_methods.py``
+"""
+import sys
+import inspect
+from pathlib import Path
+from typing import (
+    Any,
+    Set,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    Literal,
+    get_args,
+    get_origin,
+)
+
+ROOT = Path(__file__).parent.parent
+TARGET = ROOT / "nonebot" / "adapters" / "telegram" / "methods.py"
+
+import nonebot.adapters
+
+# 使用仓库中的适配器而不是已安装的版本
+nonebot.adapters.__path__.append(  # type: ignore
+    str((ROOT / "nonebot" / "adapters").resolve())
+)
+
+from pydantic import BaseModel
+
+from nonebot.adapters.telegram import model
+from nonebot.adapters.telegram.api import API
+
+HEADER = '''\
+# 此文件由 scripts/generate_api_methods.py 根据 api.py 生成，请勿手动修改
+"""
+:说明:
+  API 方法的请求编码和响应解码函数。
+
+  编码函数将文件参数交给 ``upload`` 处理，``upload`` 返回文件的引用（如 ``attach://upload0``）。
+"""
+from typing import Any, Dict, List, Tuple, Union, Literal, Callable, Optional, Awaitable
+
+from pydantic import parse_obj_as
+
+from .model import (
+{imports}
+)
+
+Upload = Callable[[Any], Awaitable[Any]]
+Encoder = Callable[[Dict[str, Any], Upload], Awaitable[None]]
+Decoder = Callable[[Any], Any]
+'''
+
+
+class Generator:
+    def __init__(self):
+        self.imports: Set[str] = set()
+        # model.py 中定义的联合类型别名，如 ChatMember
+        self.aliases: Dict[Any, str] = {
+            value: name
+            for name, value in vars(model).items()
+            if get_origin(value) is Union
+        }
+
+    def render(self, type_: Any) -> str:
+        """将类型注解转为源代码"""
+        if type_ is type(None):
+            return "None"
+        if type_ in self.aliases:
+            self.imports.add(self.aliases[type_])
+            return self.aliases[type_]
+        origin, args = get_origin(type_), get_args(type_)
+        if origin is Union:
+            if len(args) == 2 and type(None) in args:
+                (arg,) = (arg for arg in args if arg is not type(None))
+                return f"Optional[{self.render(arg)}]"
+            return f"Union[{', '.join(self.render(arg) for arg in args)}]"
+        if origin is Literal:
+            return f"Literal[{', '.join(repr(arg) for arg in args)}]"
+        if origin is list:
+            return f"List[{self.render(args[0])}]"
+        if origin is tuple:
+            return f"Tuple[{', '.join(self.render(arg) for arg in args)}]"
+        if getattr(model, type_.__name__, None) is type_:
+            self.imports.add(type_.__name__)
+        return type_.__name__
+
+    def decoder(self, name: str, type_: Any) -> List[str]:
+        """根据返回值类型生成解码函数，模型直接使用 ``parse_obj``"""
+        annotation = self.render(type_)
+        origin, args = get_origin(type_), get_args(type_)
+        if type_ in (bool, int, str) or origin is Literal:
+            body = "return result"
+        elif _is_model(type_):
+            body = f"return {annotation}.parse_obj(result)"
+        elif origin is list and _is_model(args[0]):
+            body = f"return [{self.render(args[0])}.parse_obj(item) for item in result]"
+        else:
+            body = f"return parse_obj_as({annotation}, result)"
+        return [
+            f"def decode_{name}(result: Any) -> {annotation}:",
+            f"    {body}",
+        ]
+
+    def encoder(self, name: str, params: Dict[str, Any]) -> List[str]:
+        """为包含文件的参数生成编码函数，没有文件参数时返回空列表"""
+        body: List[str] = []
+        for param, type_ in params.items():
+            if _has_file(type_):
+                body += [
+                    f'    if data.get("{param}") is not None:',
+                    f'        data["{param}"] = await upload(data["{param}"])',
+                ]
+                continue
+            models, is_list = _file_models(type_)
+            if not models:
+                continue
+            if is_list:
+                body.append(f'    for item in data.get("{param}") or ():')
+            else:
+                body.append(f'    if (item := data.get("{param}")) is not None:')
+            for field, required in _model_file_fields(models):
+                if required:
+                    body.append(f"        item.{field} = await upload(item.{field})")
+                else:
+                    body += [
+                        f'        if getattr(item, "{field}", None) is not None:',
+                        f"            item.{field} = await upload(item.{field})",
+                    ]
+        if not body:
+            return []
+        signature = (
+            f"async def encode_{name}(data: Dict[str, Any], upload: Upload) -> None:"
+        )
+        if len(signature) > 88:
+            signature = "\n".join(
+                [
+                    f"async def encode_{name}(",
+                    "    data: Dict[str, Any], upload: Upload",
+                    ") -> None:",
+                ]
+            )
+        return [signature, *body]
+
+    def generate(self) -> str:
+        functions: List[List[str]] = []
+        table: List[str] = []
+        for name, func in vars(API).items():
+            if name.startswith("_") or not inspect.iscoroutinefunction(func):
+                continue
+            signature = inspect.signature(func)
+            params = {
+                param.name: param.annotation
+                for param in signature.parameters.values()
+                if param.name != "self"
+            }
+            encoder = self.encoder(name, params)
+            if encoder:
+                functions.append(encoder)
+            functions.append(self.decoder(name, signature.return_annotation))
+            table += [
+                f'    "{name}": (',
+                f'        "{_to_camel(name)}",',
+                *_render_params(params),
+                f"        encode_{name}," if encoder else "        None,",
+                f"        decode_{name},",
+                "    ),",
+            ]
+        imports = "\n".join(
+            f"    {name}," for name in sorted(self.imports, key=lambda s: (len(s), s))
+        )
+        return "\n\n\n".join(
+            [
+                HEADER.format(imports=imports).rstrip("\n"),
+                *("\n".join(lines) for lines in functions),
+                "# 方法名称 -> (Telegram 方法名称, 参数, 编码函数, 解码函数)\n"
+                "METHODS: Dict[str, Tuple[str, Tuple[str, ...], Optional[Encoder], Decoder]] = {\n"
+                + "\n".join(table)
+                + "\n}\n",
+            ]
+        )
+
+
+def _to_camel(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(s.capitalize() for s in rest)
+
+
+def _render_params(params: Dict[str, Any]) -> List[str]:
+    """参数名称元组，过长时每行一个"""
+    names = [f'"{name}"' for name in params]
+    line = f"        ({', '.join(names)}{',' if len(names) == 1 else ''}),"
+    if len(line) <= 88:
+        return [line]
+    return ["        (", *(f"            {name}," for name in names), "        ),"]
+
+
+def _flatten(type_: Any) -> Tuple[Any, ...]:
+    if get_origin(type_) is Union:
+        return tuple(t for arg in get_args(type_) for t in _flatten(arg))
+    return (type_,)
+
+
+def _is_model(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, BaseModel)
+
+
+def _has_file(type_: Any) -> bool:
+    return bytes in _flatten(type_)
+
+
+def _file_models(type_: Any) -> Tuple[List[Type[BaseModel]], bool]:
+    """包含文件字段的模型参数，返回模型类型和参数是否为列表"""
+    is_list = False
+    types = _flatten(type_)
+    if len(types) == 2 and type(None) in types:
+        types = tuple(t for t in types if t is not type(None))
+    if len(types) == 1 and get_origin(types[0]) is list:
+        is_list = True
+        types = _flatten(get_args(types[0])[0])
+    models = [t for t in types if _is_model(t) and _model_file_fields([t])]
+    return models, is_list
+
+
+def _model_file_fields(models: List[Type[BaseModel]]) -> List[Tuple[str, bool]]:
+    """模型中的文件字段，以及是否所有模型都有该字段
+
+    ``InputMedia`` 的 ``media`` 字段类型为 ``str``，但同样可以传入文件。
+    """
+    fields: Dict[str, int] = {}
+    for model_ in models:
+        for field in model_.__fields__.values():
+            if field.name == "media" or _has_file(field.annotation):
+                fields[field.name] = fields.get(field.name, 0) + 1
+    return [(name, count == len(models)) for name, count in fields.items()]
+
+
+if __name__ == "__main__":
+    TARGET.write_text(Generator().generate(), encoding="utf-8")
+    print(f"Generated {TARGET.relative_to(ROOT)}", file=sys.stderr)
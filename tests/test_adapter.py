@@ -0,0 +1,781 @@
+import json
+import asyncio
+from pathlib import Path
+from copy import deepcopy
+from functools import partial
+
+import pytest
+from nonebug import App
+
+from nonebot.adapters.telegram import Adapter
+from nonebot.adapters.telegram.config import BotConfig
+
+bot_config = BotConfig(token="1234567890:ABCDEFGHIJKLMNOPQRSTUVWXYZABCDEFGHI")
+
+
+@pytest.mark.asyncio
+async def test_poll_pipeline(app: App):
+    from nonebot.adapters.telegram.bot import Bot
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+    for i, update in enumerate(test_updates[:2]):
+        update["update_id"] = i + 1
+
+    records = []
+    blocked = asyncio.Event()
+
+    async def call_api(bot, api: str, **data):
+        if api == "get_me":
+            return {"id": 1, "is_bot": True, "first_name": "test", "username": "test"}
+        if api == "get_updates":
+            records.append(("get", data["offset"]))
+            if data["offset"] == 3:
+                await blocked.wait()
+                return []
+            return deepcopy(test_updates[:2])
+        return True
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        adapter._call_api = call_api  # type: ignore
+
+        async def put(bot, event, callback):
+            records.append(("put", event.message_id))
+            await asyncio.sleep(0)
+            callback()
+
+        adapter.dispatcher.put = put  # type: ignore
+        task = asyncio.create_task(adapter.poll(bot))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        adapter.bot_disconnect(bot)
+
+    # 下一次 getUpdates 在本批次处理完成之前就已发出
+    assert records == [("get", None), ("put", 1365), ("get", 3), ("put", 1365)]
+    assert adapter.offset_trackers[bot.self_id].offset == 3
+    stats = adapter.poll_stats[bot.self_id]
+    assert stats.batches == 1
+    assert stats.updates == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_durable_offset(app: App):
+    from nonebot.adapters.telegram.bot import Bot
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+    for i, update in enumerate(test_updates[:2]):
+        update["update_id"] = i + 1
+
+    records = []
+    callbacks = []
+    blocked = asyncio.Event()
+
+    async def call_api(bot, api: str, **data):
+        if api == "get_me":
+            return {"id": 1, "is_bot": True, "first_name": "test", "username": "test"}
+        if api == "get_updates":
+            records.append(("get", data["offset"]))
+            if data["offset"] == 3:
+                await blocked.wait()
+                return []
+            return deepcopy(test_updates[:2])
+        return True
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_offset_store = "sqlite"
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        adapter._call_api = call_api  # type: ignore
+
+        async def put(bot, event, callback):
+            records.append(("put", event.message_id))
+            callbacks.append(callback)
+
+        adapter.dispatcher.put = put  # type: ignore
+        task = asyncio.create_task(adapter.poll(bot))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # 批次处理完成前不会确认
+        assert records == [("get", None), ("put", 1365), ("put", 1365)]
+
+        callbacks.pop(0)()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # offset 前移后立即保存
+        assert await adapter.offset_store.load(bot.self_id) == 2
+        assert records[-1] == ("put", 1365)
+
+        callbacks.pop(0)()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert records[-1] == ("get", 3)
+        assert await adapter.offset_store.load(bot.self_id) == 3
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        adapter.bot_disconnect(bot)
+
+
+@pytest.mark.asyncio
+async def test_poll_fetch_delay(app: App):
+    from nonebot.adapters.telegram.bot import Bot
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+    for i, update in enumerate(test_updates[:2]):
+        update["update_id"] = i + 1
+
+    fetched = asyncio.Event()
+
+    async def call_api(bot, api: str, **data):
+        if api == "get_me":
+            return {"id": 1, "is_bot": True, "first_name": "test", "username": "test"}
+        if api == "get_updates":
+            if data["offset"] is None:
+                return deepcopy(test_updates[:2])
+            fetched.set()
+            await asyncio.Event().wait()
+        return True
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_poll_pipeline = False
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        adapter._call_api = call_api  # type: ignore
+
+        async def put(bot, event, callback):
+            await asyncio.sleep(0.05)
+            callback()
+
+        adapter.dispatcher.put = put  # type: ignore
+        task = asyncio.create_task(adapter.poll(bot))
+        await asyncio.wait_for(fetched.wait(), 1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        adapter.bot_disconnect(bot)
+
+    # 不提前拉取时，下一次 getUpdates 被批次处理推迟的时间同样计入统计
+    stats = adapter.poll_stats[bot.self_id]
+    assert stats.fetches == 2
+    assert stats.last_fetch_delay >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_poll_circuit_breaker(app: App):
+    from nonebot.drivers import Request, Response
+
+    from nonebot.adapters.telegram.bot import Bot
+
+    me = {"id": 1, "is_bot": True, "first_name": "test", "username": "test"}
+    failures = []
+    fetches = []
+
+    async def request(setup: Request) -> Response:
+        api = setup.url.path.rsplit("/", 1)[-1]
+        if api == "getMe":
+            return Response(200, content=json.dumps({"ok": True, "result": me}))
+        if api == "getUpdates":
+            fetches.append(setup)
+            if failures:
+                failure = failures.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            await asyncio.Event().wait()
+        return Response(200, content=b'{"ok":true,"result":true}')
+
+    async def run_poll(bot: Bot) -> None:
+        task = asyncio.create_task(adapter.poll(bot))
+        for _ in range(20):
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        adapter.bot_disconnect(bot)
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_poll_backoff_base = 0
+        adapter.adapter_config.telegram_circuit_breaker_threshold = 3
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        # 经过 __send_request 的重试，直接替换驱动器的请求
+        adapter._call_api = partial(Adapter._call_api, adapter)  # type: ignore
+        adapter.request = request  # type: ignore
+
+        # 机器人自身的错误不会使 API 服务器熔断
+        unauthorized = Response(
+            401,
+            content=b'{"ok":false,"error_code":401,"description":"Unauthorized"}',
+        )
+        failures[:] = [unauthorized for _ in range(3)]
+        await run_poll(bot)
+        breaker = adapter.circuit_breakers[bot.bot_config.api_server]
+        assert adapter.bot_health[bot.self_id].consecutive_failures == 3
+        assert breaker.state == "closed"
+        # 最后一次为挂起的请求
+        assert len(fetches) == 4
+
+        # 每次失败只发出一个请求，连续失败达到阈值后熔断，不再发出请求
+        adapter.bot_health.clear()
+        fetches.clear()
+        failures[:] = [OSError("Connection refused") for _ in range(5)]
+        await run_poll(bot)
+        assert len(fetches) == 3
+        assert adapter.bot_health[bot.self_id].consecutive_failures == 3
+        assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_ingest_keeps_lazy_fields(app: App):
+    from nonebot.drivers import Request
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.event import PinnedMessageEvent, get_lazy_fields
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+    pinned = deepcopy(test_updates[0])
+    del pinned["message"]["text"]
+    pinned["message"]["pinned_message"] = test_updates[3]["message"]["reply_to_message"]
+    updates = [test_updates[3], pinned]
+    for i, update in enumerate(updates):
+        update["update_id"] = i + 1
+
+    events = []
+
+    async def call_api(bot, api: str, **data):
+        if api == "get_me":
+            return {"id": 1, "is_bot": True, "first_name": "test", "username": "test"}
+        if api == "get_updates":
+            if data["offset"] is None:
+                return deepcopy(updates)
+            await asyncio.Event().wait()
+        return True
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        adapter._call_api = call_api  # type: ignore
+
+        async def put(bot, event, callback):
+            events.append(event)
+            callback()
+
+        adapter.dispatcher.put = put  # type: ignore
+        adapter.dispatcher.put_nowait = lambda bot, event, *_: events.append(event) or True  # type: ignore
+        task = asyncio.create_task(adapter.poll(bot))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        adapter.bot_disconnect(bot)
+
+        adapter.webhook_bots[bot.secret_token] = bot
+        for update in updates:
+            response = await adapter.handle_http(
+                Request(
+                    "POST",
+                    f"/telegram/{bot.self_id}",
+                    headers={"X-Telegram-Bot-Api-Secret-Token": bot.secret_token},
+                    content=json.dumps(
+                        {**update, "update_id": update["update_id"] + 2}
+                    ),
+                ),
+                bot=bot,
+            )
+            assert response.status_code == 204
+
+    # 接收更新时不会解析延迟解析的字段
+    assert len(events) == 4
+    assert isinstance(events[1], PinnedMessageEvent)
+    for event in events:
+        fields = get_lazy_fields(type(event))
+        assert fields - {"telegram_model"}
+        for name in fields:
+            assert isinstance(event.__dict__[name], dict)
+
+
+@pytest.mark.asyncio
+async def test_webhook_routing(app: App):
+    from nonebot.drivers import Request
+
+    from nonebot.adapters.telegram.bot import Bot
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_update = json.load(f)[0]
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        adapter.webhook_bots[bot.secret_token] = bot
+        received = []
+        adapter.dispatcher.put_nowait = lambda bot, *_: received.append(bot) or True  # type: ignore
+
+        def request(token: str, update_id: int = 1) -> Request:
+            return Request(
+                "POST",
+                f"/telegram/{bot.self_id}",
+                headers={"X-Telegram-Bot-Api-Secret-Token": token},
+                content=json.dumps({**test_update, "update_id": update_id}),
+            )
+
+        assert (await adapter.handle_http(request("wrong"), bot=bot)).status_code == 401
+        assert (await adapter.handle_http(request("wrong"))).status_code == 401
+        assert (await adapter.handle_http(request(bot.secret_token))).status_code == 204
+        assert (
+            await adapter.handle_http(request(bot.secret_token, 2), bot=bot)
+        ).status_code == 204
+        assert received == [bot, bot]
+
+        # 重复推送的更新不会再次分发
+        assert (
+            await adapter.handle_http(request(bot.secret_token, 2), bot=bot)
+        ).status_code == 204
+        assert received == [bot, bot]
+        assert adapter.deduplicator
+        assert adapter.deduplicator.hit_rate(bot.self_id) == 1 / 3
+
+
+@pytest.mark.asyncio
+async def test_webhook_reply(app: App):
+    from nonebot.drivers import Request
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.webhook import current_webhook_reply
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_update = json.load(f)[0]
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_webhook_reply = True
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+
+        async def handle(reply):
+            current_webhook_reply.set(reply)
+            # 调用真正的 _call_api，第一次调用被合并到 webhook 响应中
+            assert (
+                await Adapter._call_api(
+                    adapter, bot, "send_message", chat_id=1, text="hi"
+                )
+                is None
+            )
+
+        adapter.dispatcher.put_nowait = lambda bot, event, reply: bool(  # type: ignore
+            asyncio.create_task(handle(reply))
+        )
+        response = await adapter.handle_http(
+            Request(
+                "POST",
+                f"/telegram/{bot.self_id}",
+                headers={"X-Telegram-Bot-Api-Secret-Token": bot.secret_token},
+                content=json.dumps(test_update),
+            ),
+            bot=bot,
+        )
+        assert response.status_code == 200
+        assert json.loads(response.content) == {  # type: ignore
+            "method": "sendMessage",
+            "chat_id": 1,
+            "text": "hi",
+        }
+
+
+@pytest.mark.asyncio
+async def test_call_api_body(app: App):
+    from nonebot.drivers import Request, Response
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.model import (
+        InlineKeyboardButton,
+        InlineKeyboardMarkup,
+    )
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        requests = []
+
+        async def request(setup: Request) -> Response:
+            requests.append(setup)
+            return Response(200, content=b'{"ok":true,"result":true}')
+
+        adapter.request = request  # type: ignore
+        adapter.adapter_config.telegram_rate_limit = False
+        markup = InlineKeyboardMarkup(
+            inline_keyboard=[[InlineKeyboardButton(text="a", callback_data="1")]]
+        )
+
+        # JSON 请求一次性序列化，嵌套对象不再编码为字符串
+        assert await Adapter._call_api(
+            adapter, bot, "send_message", chat_id=1, text="hi", reply_markup=markup
+        )
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert json.loads(requests[0].content) == {  # type: ignore
+            "chat_id": 1,
+            "text": "hi",
+            "reply_markup": {
+                "inline_keyboard": [[{"text": "a", "callback_data": "1"}]]
+            },
+        }
+
+        # multipart 请求的字段仍为字符串
+        assert await Adapter._call_api(
+            adapter, bot, "send_photo", chat_id=1, photo=b"photo", reply_markup=markup
+        )
+        assert requests[1].files
+        assert requests[1].data == {
+            "chat_id": "1",
+            "photo": "attach://upload0",
+            "reply_markup": '{"inline_keyboard":[[{"text":"a","callback_data":"1"}]]}',
+        }
+
+
+@pytest.mark.asyncio
+async def test_call_api_retry(app: App):
+    from nonebot.drivers import Request, Response
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.exception import (
+        Forbidden,
+        RetryAfter,
+        ServerError,
+        ChatMigrated,
+    )
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_rate_limit = False
+        adapter.retry_policy.backoff_base = 0
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        responses = []
+        calls = []
+
+        async def request(setup: Request) -> Response:
+            calls.append(setup)
+            return responses.pop(0)
+
+        adapter.request = request  # type: ignore
+
+        def error(status: int, **parameters) -> Response:
+            return Response(
+                status,
+                content=json.dumps(
+                    {
+                        "ok": False,
+                        "error_code": status,
+                        "description": "error",
+                        "parameters": parameters,
+                    }
+                ),
+            )
+
+        ok = Response(200, content=b'{"ok":true,"result":true}')
+
+        # 请求过于频繁时等待后重试，非幂等的方法同样重试
+        responses[:] = [error(429, retry_after=0), ok]
+        assert await Adapter._call_api(adapter, bot, "send_message", chat_id=1)
+        assert len(calls) == 2
+
+        # 服务器错误只重试幂等的方法
+        calls.clear()
+        responses[:] = [error(502), ok]
+        assert await Adapter._call_api(adapter, bot, "get_me")
+        assert len(calls) == 2
+
+        calls.clear()
+        responses[:] = [error(502), ok]
+        with pytest.raises(ServerError):
+            await Adapter._call_api(adapter, bot, "send_message", chat_id=1)
+        assert len(calls) == 1
+
+        # 超过重试次数
+        calls.clear()
+        responses[:] = [error(429, retry_after=0) for _ in range(4)]
+        with pytest.raises(RetryAfter) as exc_info:
+            await Adapter._call_api(adapter, bot, "send_message", chat_id=1)
+        assert exc_info.value.error_code == 429
+        assert len(calls) == 4
+
+        responses[:] = [error(400, migrate_to_chat_id=-100123)]
+        with pytest.raises(ChatMigrated) as exc_info:
+            await Adapter._call_api(adapter, bot, "send_message", chat_id=1)
+        assert exc_info.value.migrate_to_chat_id == -100123
+
+        responses[:] = [error(403)]
+        with pytest.raises(Forbidden):
+            await Adapter._call_api(adapter, bot, "send_message", chat_id=1)
+
+
+@pytest.mark.asyncio
+async def test_call_api_upload(app: App, tmp_path: Path):
+    from nonebot.drivers import Request, Response
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.model import InputMediaPhoto, InputMediaDocument
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_rate_limit = False
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        responses = []
+        contents = []
+        opened = []
+
+        async def request(setup: Request) -> Response:
+            # 文件以文件对象传给驱动器，由驱动器读取
+            assert setup.files
+            opened.extend(file for _, (_, file, _) in setup.files)  # type: ignore
+            contents.append(
+                {name: file.read() for name, (_, file, _) in setup.files}  # type: ignore
+            )
+            return responses.pop(0)
+
+        adapter.request = request  # type: ignore
+
+        async def chunks():
+            yield b"chunk0"
+            yield b"chunk1"
+
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"path")
+        stream = open(path, "rb")
+        ok = Response(200, content=b'{"ok":true,"result":[]}')
+        retry = Response(
+            429,
+            content=b'{"ok":false,"error_code":429,"description":"error",'
+            b'"parameters":{"retry_after":0}}',
+        )
+
+        # 重试时从头读取文件
+        responses[:] = [retry, ok]
+        media = [
+            InputMediaDocument(media=str(path)),
+            InputMediaDocument(media=stream, thumbnail=chunks()),
+            InputMediaPhoto(media=("b.jpg", chunks())),
+            InputMediaPhoto(media="file_id"),
+        ]
+        assert media[3].media == "file_id"
+        await Adapter._call_api(
+            adapter, bot, "send_media_group", chat_id=1, media=media
+        )
+        expected = {
+            "a.txt": b"path",
+            "upload0": b"path",
+            "upload1": b"chunk0chunk1",
+            "b.jpg": b"chunk0chunk1",
+        }
+        assert contents == [expected, expected]
+
+        # 适配器打开的文件在请求后关闭，传入的文件对象不会被关闭
+        assert all(file.closed for file in opened if file is not stream)
+        assert not stream.closed
+        stream.close()
+
+
+@pytest.mark.asyncio
+async def test_call_api_file_id_cache(app: App, tmp_path: Path):
+    from nonebot.drivers import Request, Response
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.model import InputMediaPhoto
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_rate_limit = False
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        responses = []
+        calls = []
+
+        async def request(setup: Request) -> Response:
+            calls.append(setup)
+            return responses.pop(0)
+
+        adapter.request = request  # type: ignore
+
+        def message(file_id: str) -> Response:
+            photo = [{"file_id": f"{file_id}_small"}, {"file_id": file_id}]
+            return Response(
+                200, content=json.dumps({"ok": True, "result": {"photo": photo}})
+            )
+
+        # 第一次上传文件，之后只发送最大尺寸的 file_id
+        responses[:] = [message("id1"), message("id1")]
+        for _ in range(2):
+            await Adapter._call_api(
+                adapter, bot, "send_photo", chat_id=1, photo=b"photo", thumbnail=b"t"
+            )
+        assert calls[0].files
+        assert not calls[1].files
+        assert json.loads(calls[1].content) == {  # type: ignore
+            "chat_id": 1,
+            "photo": "id1",
+        }
+
+        # 相同的内容作为文档发送时重新上传
+        calls.clear()
+        responses[:] = [message("id2")]
+        await Adapter._call_api(
+            adapter, bot, "send_document", chat_id=1, document=b"photo"
+        )
+        assert calls[0].files
+
+        # file_id 失效时重新上传
+        calls.clear()
+        responses[:] = [
+            Response(
+                400,
+                content=b'{"ok":false,"error_code":400,'
+                b'"description":"Bad Request: wrong file identifier/HTTP URL specified"}',
+            ),
+            message("id3"),
+            message("id3"),
+        ]
+        for _ in range(2):
+            await Adapter._call_api(
+                adapter, bot, "send_photo", chat_id=1, photo=b"photo"
+            )
+        assert [bool(call.files) for call in calls] == [False, True, False]
+        assert json.loads(calls[2].content)["photo"] == "id3"  # type: ignore
+
+        # 媒体组按顺序对应返回的消息，不修改传入的 InputMedia
+        path = tmp_path / "a.jpg"
+        path.write_bytes(b"a")
+        media = [InputMediaPhoto(media=str(path)), InputMediaPhoto(media=b"b")]
+        calls.clear()
+        responses[:] = [
+            Response(
+                200,
+                content=json.dumps(
+                    {"ok": True, "result": [{"photo": [{"file_id": "id_a"}]}, {}]}
+                ),
+            ),
+            Response(200, content=b'{"ok":true,"result":[]}'),
+        ]
+        for _ in range(2):
+            await Adapter._call_api(
+                adapter, bot, "send_media_group", chat_id=1, media=media
+            )
+        assert media[0].media == str(path)
+        assert json.loads(calls[1].data["media"]) == [  # type: ignore
+            {"type": "photo", "media": "id_a"},
+            {"type": "photo", "media": "attach://upload0"},
+        ]
+        assert adapter.file_id_cache
+        assert adapter.file_id_cache.hits == 4
+
+
+@pytest.mark.asyncio
+async def test_call_api_shared_upload(app: App):
+    from nonebot.drivers import Request, Response
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.exception import Forbidden
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        adapter.adapter_config.telegram_rate_limit = False
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        calls = []
+
+        async def request(setup: Request) -> Response:
+            calls.append(setup)
+            await asyncio.sleep(0.01)
+            # 第一个上传的请求失败，由下一个请求重新上传
+            if len(calls) == 1:
+                return Response(
+                    403,
+                    content=b'{"ok":false,"error_code":403,"description":"blocked"}',
+                )
+            return Response(
+                200,
+                content=b'{"ok":true,"result":{"document":{"file_id":"id"}}}',
+            )
+
+        adapter.request = request  # type: ignore
+
+        results = await asyncio.gather(
+            *(
+                Adapter._call_api(
+                    adapter, bot, "send_document", chat_id=i, document=b"document"
+                )
+                for i in range(5)
+            ),
+            return_exceptions=True,
+        )
+        assert isinstance(results[0], Forbidden)
+        assert [bool(call.files) for call in calls] == [True, True, False, False, False]
+        assert adapter.file_id_cache
+        assert adapter.file_id_cache.shared == 3
+
+
+def test_retry_policy():
+    from nonebot.adapters.telegram.retry import RetryPolicy
+    from nonebot.adapters.telegram.model import ResponseParameters
+    from nonebot.adapters.telegram.exception import (
+        BadRequest,
+        RetryAfter,
+        NetworkError,
+    )
+
+    policy = RetryPolicy(3, 60, 1, 10)
+    flood = RetryAfter("flood", 429, ResponseParameters(retry_after=5))
+    assert policy.get_delay("sendMessage", 1, flood) == 5
+    assert policy.get_delay("sendMessage", 4, flood) is None
+    long_flood = RetryAfter("flood", 429, ResponseParameters(retry_after=120))
+    assert policy.get_delay("sendMessage", 1, long_flood) is None
+    assert policy.get_delay("sendMessage", 1, NetworkError()) is None
+    assert 0 <= policy.get_delay("editMessageText", 2, NetworkError()) <= 2  # type: ignore
+    assert policy.get_delay("getMe", 1, BadRequest("bad", 400)) is None
+    # getUpdates 由 poll 负责退避
+    assert 0 <= policy.get_delay("getMe", 1, NetworkError()) <= 1  # type: ignore
+    assert policy.get_delay("getUpdates", 1, NetworkError()) is None
+    assert policy.get_delay("getUpdates", 1, flood) is None
+
+
+def test_circuit_breaker():
+    from nonebot.adapters.telegram.health import CircuitBreaker, backoff_delay
+
+    assert backoff_delay(0, 1, 60) == 0
+    assert all(0 <= backoff_delay(10, 1, 60) <= 60 for _ in range(100))
+
+    breaker = CircuitBreaker(threshold=2, timeout=30)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert 0 < breaker.remaining <= 30
+
+    # 熔断结束后的试探请求成功则恢复
+    breaker.opened_at = breaker.opened_at - 30  # type: ignore
+    assert breaker.state == "half_open"
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_allowed_updates_from_matchers():
+    from nonebot import on_type, on_notice, on_message
+    from nonebot.adapters.telegram.adapter import _get_allowed_updates_from_matchers
+    from nonebot.adapters.telegram.event import (
+        CallbackQueryEvent,
+        PrivateMessageEvent,
+    )
+
+    created = [
+        on_message(),
+        on_type(CallbackQueryEvent),
+        on_type((PrivateMessageEvent,)),
+    ]
+    assert _get_allowed_updates_from_matchers() == [
+        "callback_query",
+        "channel_post",
+        "message",
+    ]
+
+    created.append(on_notice())
+    assert "chat_member" in _get_allowed_updates_from_matchers()
+    for matcher in created:
+        matcher.destroy()
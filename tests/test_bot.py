@@ -34,6 +34,10 @@ async def test_check_tome(app: App):
         bot.username = "test"
         bot._check_tome(event)
         assert event._tome
+        # original_message 不受 _check_tome 的修改影响
+        assert str(event.message) == ""
+        assert event.original_message[0].type == "mention"
+        assert event.original_message[0].data["text"] == "@test"
 
 
 @pytest.mark.asyncio
@@ -97,3 +101,194 @@ async def test_send_to(app: App):
                 [File.photo("test.jpg", has_spoiler=True), File.audio("test.ogg")]
             ),
         )
+
+
+@pytest.mark.asyncio
+async def test_api_methods(app: App):
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.model import MessageId
+    from nonebot.adapters.telegram.registry import API_METHODS
+
+    method = API_METHODS["copy_message"]
+    assert method.method == "copyMessage"
+    assert method.params[:3] == ("chat_id", "from_chat_id", "message_id")
+    assert method.parse_result({"message_id": 1}) == MessageId(message_id=1)
+
+    async with app.test_api() as ctx:
+        bot = Bot(
+            ctx.create_adapter(base=Adapter),
+            Bot.get_bot_id_by_token(bot_config.token),
+            config=bot_config,
+        )
+        # 绑定的调用缓存在机器人实例上
+        assert bot.copy_message is bot.copy_message
+
+        ctx.should_call_api(
+            "copy_message",
+            {
+                **{param: None for param in method.params},
+                "chat_id": 1,
+                "from_chat_id": 2,
+                "message_id": 3,
+            },
+            {"message_id": 4},
+        )
+        assert await bot.copy_message(1, 2, message_id=3) == MessageId(message_id=4)
+
+
+@pytest.mark.asyncio
+async def test_download_file(app: App, tmp_path: Path):
+    import io
+
+    import httpx
+
+    from nonebot.adapters.telegram.bot import Bot
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=b"0123456789")
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        bot = Bot(adapter, Bot.get_bot_id_by_token(bot_config.token), config=bot_config)
+        adapter.downloader._client = httpx.AsyncClient(  # type: ignore
+            transport=httpx.MockTransport(handler)
+        )
+        file = {"file_id": "id", "file_unique_id": "unique", "file_path": "a/b.jpg"}
+
+        ctx.should_call_api("get_file", {"file_id": "id"}, file)
+        chunks = [chunk async for chunk in bot.iter_file("id", chunk_size=4)]
+        assert b"".join(chunks) == b"0123456789"
+        assert all(len(chunk) <= 4 for chunk in chunks)
+        assert str(requests[0].url) == (
+            f"https://api.telegram.org/file/bot{bot_config.token}/a/b.jpg"
+        )
+
+        ctx.should_call_api("get_file", {"file_id": "id"}, file)
+        dest = tmp_path / "download" / "b.jpg"
+        await bot.download_file("id", dest)
+        assert dest.read_bytes() == b"0123456789"
+        # 临时文件已被替换
+        assert list(dest.parent.iterdir()) == [dest]
+
+        # 本地模式的 Bot API 服务器返回本地路径，直接复制文件
+        local = tmp_path / "local.jpg"
+        local.write_bytes(b"local")
+        ctx.should_call_api(
+            "get_file", {"file_id": "id"}, {**file, "file_path": str(local)}
+        )
+        buffer = io.BytesIO()
+        await bot.download_file("id", buffer)
+        assert buffer.getvalue() == b"local"
+        ctx.should_call_api(
+            "get_file", {"file_id": "id"}, {**file, "file_path": str(local)}
+        )
+        await bot.download_file("id", tmp_path / "copy.jpg")
+        assert (tmp_path / "copy.jpg").read_bytes() == b"local"
+        assert len(requests) == 2
+        await adapter.downloader.close()
+
+
+@pytest.mark.asyncio
+async def test_download_cache(app: App, tmp_path: Path):
+    import httpx
+
+    from nonebot.adapters.telegram.bot import Bot
+    from nonebot.adapters.telegram.message import Message
+    from nonebot.adapters.telegram.download import DownloadCache, FileDownloader
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=request.url.path[-1:].encode() * 4)
+
+    async with app.test_api() as ctx:
+        adapter = ctx.create_adapter(base=Adapter)
+        cache = DownloadCache(tmp_path / "cache", max_bytes=8)
+        adapter.downloader = FileDownloader(adapter, cache)  # type: ignore
+        adapter.downloader._client = httpx.AsyncClient(  # type: ignore
+            transport=httpx.MockTransport(handler)
+        )
+        bots = [
+            Bot(adapter, str(i), config=BotConfig(token=f"{i}:token")) for i in (1, 2)
+        ]
+
+        # 收到的文件消息段带有 file_unique_id
+        (segment,) = Message.parse_obj(
+            {"document": {"file_id": "id_a", "file_unique_id": "a"}}
+        )
+        assert segment.data == {"file": "id_a", "file_unique_id": "a"}
+
+        ctx.should_call_api(
+            "get_file",
+            {"file_id": "id_a"},
+            {"file_id": "id_a", "file_unique_id": "a", "file_path": "a"},
+        )
+        await bots[0].download_file("id_a", tmp_path / "a1", file_unique_id="a")
+        # 其他机器人下载同一文件时命中缓存，不再调用 get_file
+        await bots[1].download_file("id_a", tmp_path / "a2", file_unique_id="a")
+        assert (
+            (tmp_path / "a1").read_bytes() == (tmp_path / "a2").read_bytes() == b"aaaa"
+        )
+        assert len(requests) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # 没有 file_unique_id 时从 get_file 获取
+        for name in ("b", "c"):
+            ctx.should_call_api(
+                "get_file",
+                {"file_id": f"id_{name}"},
+                {"file_id": f"id_{name}", "file_unique_id": name, "file_path": name},
+            )
+            assert (
+                b"".join([chunk async for chunk in bots[0].iter_file(f"id_{name}")])
+                == name.encode() * 4
+            )
+
+        # 超出大小限制时淘汰最久未使用的文件
+        assert sorted(p.name for p in cache.directory.iterdir()) == ["b", "c"]
+        assert (cache.size, cache.evictions) == (8, 1)
+
+        # 重启后读取已有的缓存，只清理缓存自己的临时文件，不管理其他文件
+        (tmp_path / "cache" / "user.txt").write_bytes(b"user")
+        (cache.directory / ".c.part").write_bytes(b"user")
+        (cache.directory / f".c.{'0' * 32}.part").write_bytes(b"temp")
+        cache = DownloadCache(tmp_path / "cache", max_bytes=8)
+        adapter.downloader.cache = cache  # type: ignore
+        await bots[0].download_file("id_c", tmp_path / "c", file_unique_id="c")
+        assert cache.hits == 1
+        assert cache.size == 8
+        assert sorted(p.name for p in cache.directory.iterdir()) == [
+            ".c.part",
+            "b",
+            "c",
+        ]
+        assert (tmp_path / "cache" / "user.txt").exists()
+        await adapter.downloader.close()
+
+
+@pytest.mark.asyncio
+async def test_download_cache_in_use(tmp_path: Path):
+    from nonebot.adapters.telegram.download import DownloadCache
+
+    cache = DownloadCache(tmp_path, max_bytes=4)
+
+    def write(content: bytes):
+        async def download(temp: Path) -> None:
+            temp.write_bytes(content)
+
+        return download
+
+    async with cache.fetch("a", write(b"aaaa")) as a:
+        # 正在读取的文件不会被淘汰
+        async with cache.fetch("b", write(b"bbbb")) as b:
+            assert a.read_bytes() == b"aaaa"
+        assert b.exists()
+        assert cache.evictions == 0
+    async with cache.fetch("c", write(b"cccc")):
+        pass
+    assert not a.exists() and not b.exists()
+    assert (cache.size, cache.evictions) == (4, 2)
@@ -0,0 +1,35 @@
+import pytest
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_json_codec(name: str):
+    from nonebot.adapters.telegram.codec import get_json_codec
+    from nonebot.adapters.telegram.model import InlineKeyboardButton
+
+    pytest.importorskip(name)
+    codec = get_json_codec(name)
+    assert codec.name == name
+
+    data = b'{"ok":true,"result":[{"update_id":1,"text":"\\u4f60\\u597d"}]}'
+    expected = {"ok": True, "result": [{"update_id": 1, "text": "你好"}]}
+    assert codec.loads(data) == expected
+    assert codec.loads(memoryview(data)) == expected
+    assert codec.loads(data.decode()) == expected
+
+    # 模型省略值为 None 的字段
+    button = InlineKeyboardButton(text="你好", callback_data="1")
+    assert codec.dumps([[button]]) == '[[{"text":"你好","callback_data":"1"}]]'
+    assert codec.loads(codec.dumpb({"a": [button]})) == {
+        "a": [{"text": "你好", "callback_data": "1"}]
+    }
+
+
+def test_auto_json_codec():
+    from nonebot.adapters.telegram.codec import get_json_codec
+
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        assert get_json_codec("auto").name == "json"
+    else:
+        assert get_json_codec("auto").name == "orjson"
@@ -0,0 +1,115 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeBot:
+    self_id = "1234567890"
+
+    def __init__(self):
+        self.handled = []
+        self.release = {}
+
+    async def handle_event(self, event):
+        chat = getattr(event, "chat", None)
+        if chat and chat.id in self.release:
+            await self.release[chat.id].wait()
+        self.handled.append(getattr(event, "name", None) or event.id)
+
+
+def fake_event(name: str, chat_id: int):
+    return SimpleNamespace(name=name, chat=SimpleNamespace(id=chat_id))
+
+
+async def wait_idle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_backpressure():
+    from nonebot.adapters.telegram.dispatcher import Dispatcher
+
+    dispatcher = Dispatcher(workers=1, max_size=3)
+    bot = FakeBot()
+    bot.release[1] = asyncio.Event()
+
+    await dispatcher.put(bot, fake_event("a", 1))  # type: ignore
+    assert dispatcher.put_nowait(bot, fake_event("b", 1))  # type: ignore
+    assert dispatcher.put_nowait(bot, fake_event("c", 1))  # type: ignore
+    assert dispatcher.qsize == 3
+    assert dispatcher.full()
+    assert not dispatcher.put_nowait(bot, fake_event("d", 1))  # type: ignore
+
+    bot.release[1].set()
+    await wait_idle()
+    assert bot.handled == ["a", "b", "c"]
+    assert dispatcher.qsize == 0
+
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_per_chat_order():
+    from nonebot.adapters.telegram.dispatcher import Dispatcher
+
+    dispatcher = Dispatcher(workers=4, max_size=100)
+    bot = FakeBot()
+    bot.release[1] = asyncio.Event()
+
+    for name in ("a1", "a2", "a3"):
+        await dispatcher.put(bot, fake_event(name, 1))  # type: ignore
+    for name in ("b1", "b2"):
+        await dispatcher.put(bot, fake_event(name, 2))  # type: ignore
+    await wait_idle()
+
+    # 会话 1 被阻塞，不影响会话 2
+    assert bot.handled == ["b1", "b2"]
+    assert dispatcher.active_keys == 1
+
+    bot.release[1].set()
+    await wait_idle()
+    assert bot.handled == ["b1", "b2", "a1", "a2", "a3"]
+    # 空闲的会话队列已被回收
+    assert dispatcher.active_keys == 0
+
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_callback_query_order():
+    from nonebot.adapters.telegram import Event
+    from nonebot.adapters.telegram.dispatcher import Dispatcher
+
+    dispatcher = Dispatcher(workers=4, max_size=100)
+    bot = FakeBot()
+    bot.release[1] = asyncio.Event()
+
+    def callback_query(id_: str, chat_id=None):
+        query = {"id": id_, "from": {"id": 5, "is_bot": False, "first_name": "u"}}
+        query["chat_instance"] = "instance"
+        if chat_id is not None:
+            query["message"] = {
+                "message_id": 1,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "group"},
+            }
+        return Event.parse_event({"update_id": 1, "callback_query": query})
+
+    # 按钮的回调与创建按钮的消息属于同一会话
+    await dispatcher.put(bot, fake_event("message", 1))  # type: ignore
+    await dispatcher.put(bot, callback_query("q1", 1))  # type: ignore
+    await dispatcher.put(bot, callback_query("q2", 1))  # type: ignore
+    # 内联消息的回调按用户排序
+    await dispatcher.put(bot, callback_query("i1"))  # type: ignore
+    await dispatcher.put(bot, callback_query("i2"))  # type: ignore
+    assert dispatcher.get_key(bot, callback_query("i1")) == (bot.self_id, 5, None)  # type: ignore
+    await wait_idle()
+    assert bot.handled == ["i1", "i2"]
+
+    bot.release[1].set()
+    await wait_idle()
+    assert bot.handled == ["i1", "i2", "message", "q1", "q2"]
+
+    await dispatcher.stop()
@@ -49,3 +49,112 @@ async def test_event():
     update_data = test_updates[11]
     event = Event.parse_event(update_data)
     assert isinstance(event, CallbackQueryEvent)
+
+
+@pytest.mark.asyncio
+async def test_service_message_event():
+    from nonebot.adapters.telegram import Event
+    from nonebot.adapters.telegram.event import NoticeEvent, NewChatTitleEvent
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+
+    update_data = test_updates[0]
+    del update_data["message"]["text"]
+    update_data["message"]["new_chat_title"] = "Test Title"
+    event = Event.parse_event(update_data)
+    assert isinstance(event, NewChatTitleEvent)
+
+    # 未知的服务消息直接解析为 NoticeEvent
+    update_data = test_updates[1]
+    del update_data["message"]["text"]
+    update_data["message"]["unknown_service"] = {}
+    event = Event.parse_event(update_data)
+    assert type(event) is NoticeEvent
+
+
+@pytest.mark.asyncio
+async def test_lazy_reply_to_message():
+    from nonebot.adapters.telegram import Event
+    from nonebot.adapters.telegram.event import PrivateMessageEvent
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+
+    event = Event.parse_event(test_updates[3])
+    assert isinstance(event, PrivateMessageEvent)
+    # 访问前只保存原始数据
+    assert isinstance(event.__dict__["reply_to_message"], dict)
+    assert not event._is_reply_from("2222222")
+    assert isinstance(event.__dict__["reply_to_message"], dict)
+
+    reply_to_message = event.reply_to_message
+    assert isinstance(reply_to_message, PrivateMessageEvent)
+    assert reply_to_message.message_id == 1334
+    assert str(reply_to_message.message) == "Original"
+    assert event.reply_to_message is reply_to_message
+    assert event._is_reply_from("1111111")
+
+
+@pytest.mark.asyncio
+async def test_lazy_telegram_model():
+    from nonebot.adapters.telegram import Event
+    from nonebot.adapters.telegram.model import Update
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+
+    event = Event.parse_event(test_updates[3])
+    assert isinstance(event.__dict__["telegram_model"], dict)
+
+    update = event.telegram_model
+    assert isinstance(update, Update)
+    assert event.telegram_model is update
+    assert update.update_id == test_updates[3]["update_id"]
+    # 解析事件不会修改原始数据
+    assert update.message and update.message.text == "/start"
+    assert update.message.reply_to_message
+    assert update.message.reply_to_message.text == "Original"
+
+
+@pytest.mark.asyncio
+async def test_lazy_original_message():
+    from nonebot.adapters.telegram import Event
+    from nonebot.adapters.telegram.event import MessageEvent
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+
+    event = Event.parse_event(test_updates[3])
+    assert isinstance(event, MessageEvent)
+    assert isinstance(event.__dict__["original_message"], dict)
+
+    # 直接修改 message 的消息段不会影响 original_message
+    event.message[0].data["text"] = "/stop"
+    assert str(event.original_message) == "/start"
+    assert event.original_message is event.original_message
+    assert event.original_message[0] is not event.message[0]
+
+
+@pytest.mark.asyncio
+async def test_lazy_field_export():
+    from nonebot.adapters.telegram import Event
+    from nonebot.adapters.telegram.model import Update
+    from nonebot.adapters.telegram.message import Message
+    from nonebot.adapters.telegram.event import PrivateMessageEvent
+
+    with (Path(__file__).parent / "updates.json").open("r", encoding="utf8") as f:
+        test_updates = json.load(f)
+
+    event = Event.parse_event(test_updates[3])
+    # 导出前解析延迟解析的字段，被排除的字段不解析
+    data = event.dict(exclude={"telegram_model"})
+    assert "telegram_model" not in data
+    assert isinstance(event.__dict__["telegram_model"], dict)
+    assert isinstance(event.__dict__["reply_to_message"], PrivateMessageEvent)
+    assert isinstance(event.__dict__["original_message"], Message)
+    assert data["reply_to_message"]["message_id"] == 1334
+
+    data = json.loads(event.json())
+    assert isinstance(event.__dict__["telegram_model"], Update)
+    assert data["telegram_model"]["update_id"] == test_updates[3]["update_id"]
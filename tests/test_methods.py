@@ -0,0 +1,44 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_methods_in_sync():
+    """methods.py 需要在修改 api.py 后重新生成"""
+    spec = importlib.util.spec_from_file_location(
+        "generate_api_methods", ROOT / "scripts" / "generate_api_methods.py"
+    )
+    assert spec and spec.loader
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    assert generator.Generator().generate() == generator.TARGET.read_text(
+        encoding="utf-8"
+    ), "methods.py is out of date, run `python scripts/generate_api_methods.py`"
+
+
+@pytest.mark.asyncio
+async def test_encode_media_group():
+    from nonebot.adapters.telegram.methods import METHODS
+    from nonebot.adapters.telegram.model import InputMediaPhoto, InputMediaVideo
+
+    _, _, encode, _ = METHODS["send_media_group"]
+    assert encode
+    data = {
+        "chat_id": 1,
+        "media": [
+            InputMediaPhoto(media="file_id"),
+            InputMediaVideo(media="video", thumbnail=b"thumbnail"),
+        ],
+    }
+
+    async def upload(file):
+        return file if file == "file_id" else f"attach://{len(file)}"
+
+    await encode(data, upload)
+    assert [media.media for media in data["media"]] == ["file_id", "attach://5"]
+    assert data["media"][1].thumbnail == "attach://9"
+    assert METHODS["get_me"][2] is None
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter():
+    from nonebot.adapters.telegram.ratelimit import RateLimiter
+
+    limiter = RateLimiter((100, 1), (1, 0.1), (2, 0.1))
+    order = []
+
+    async def send(chat_id, i):
+        await limiter.acquire(chat_id)
+        order.append((chat_id, i))
+
+    await asyncio.gather(
+        *(send(1, i) for i in range(3)),
+        *(send(-1, i) for i in range(3)),
+        send("2", 0),
+    )
+    # 同一聊天按调用顺序发送，其他聊天不需要等待
+    assert [i for chat_id, i in order if chat_id == 1] == [0, 1, 2]
+    assert order.index(("2", 0)) < order.index((1, 1))
+    # 私聊每 0.1 秒一条，群组可以连续发送两条
+    assert limiter.stats.requests == 7
+    assert limiter.stats.delayed == 3
+    assert 0.15 < limiter.stats.max_wait < 0.3
+    assert limiter.stats.waiting == 0
+    assert set(limiter.chat_buckets) == {1, -1, 2}
+
+
+def test_token_bucket():
+    from nonebot.adapters.telegram.ratelimit import TokenBucket
+
+    bucket = TokenBucket(20, 60)
+    waits = [bucket.reserve() for _ in range(21)]
+    assert waits[:20] == [0] * 20
+    assert 2.9 < waits[20] <= 3
+
+
+def test_is_limited():
+    from nonebot.adapters.telegram.ratelimit import is_limited
+
+    assert is_limited("sendMessage")
+    assert is_limited("forwardMessage")
+    assert is_limited("copyMessages")
+    # 发送“正在输入”不占用额度，不会延迟随后的回复
+    assert not is_limited("sendChatAction")
+    assert not is_limited("getUpdates")
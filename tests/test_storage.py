@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+
+
+def test_offset_tracker():
+    from nonebot.adapters.telegram.offset import OffsetTracker
+
+    tracker = OffsetTracker()
+    for update_id in (10, 11, 12):
+        tracker.begin(update_id)
+    assert tracker.offset == 10
+
+    # 后面的更新先处理完成，offset 不能越过未完成的更新
+    tracker.done(12)
+    assert tracker.offset == 10
+    tracker.done(10)
+    assert tracker.offset == 11
+    tracker.done(11)
+    assert tracker.offset == 13
+    assert tracker.dirty
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("store", ["file", "sqlite"])
+async def test_offset_store(tmp_path: Path, store: str):
+    from nonebot.adapters.telegram.offset import get_offset_store
+
+    path = str(tmp_path / "offset")
+    offset_store = get_offset_store(store, path)
+    assert await offset_store.load("123") is None
+    await offset_store.save("123", 42)
+    await offset_store.save("456", 7)
+    await offset_store.close()
+
+    # 重新打开后读取到上次保存的 offset
+    offset_store = get_offset_store(store, path)
+    assert await offset_store.load("123") == 42
+    assert await offset_store.load("456") == 7
+    await offset_store.close()
+
+
+@pytest.mark.asyncio
+async def test_dedup_sqlite_shared(tmp_path: Path):
+    from nonebot.adapters.telegram.dedup import SQLiteDedupBackend
+
+    # 两个 backend 模拟共享同一文件的两个进程
+    first = SQLiteDedupBackend(tmp_path / "dedup.db", max_size=100, ttl=60)
+    second = SQLiteDedupBackend(tmp_path / "dedup.db", max_size=100, ttl=60)
+    assert await first.add("123", 1)
+    assert not await second.add("123", 1)
+    assert await second.add("456", 1)
+    await second.discard("123", 1)
+    assert await first.add("123", 1)
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_dedup_memory_eviction():
+    from nonebot.adapters.telegram.dedup import MemoryDedupBackend
+
+    backend = MemoryDedupBackend(max_size=2, ttl=60)
+    assert await backend.add("123", 1)
+    assert await backend.add("123", 2)
+    assert await backend.add("123", 3)
+    assert len(backend) == 2
+    # 最久未出现的更新已被淘汰
+    assert await backend.add("123", 1)
+    assert not await backend.add("123", 3)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+async def test_file_id_backend(tmp_path: Path, backend: str):
+    from nonebot.adapters.telegram.fileid import get_file_id_backend
+
+    path = str(tmp_path / "file_id.db")
+    file_ids = get_file_id_backend(backend, path, max_size=2, ttl=60)
+    await file_ids.set("a", "id_a")
+    await file_ids.set("b", "id_b")
+    assert await file_ids.get("a") == "id_a"
+    # b 最久未使用，被淘汰
+    await file_ids.set("c", "id_c")
+    if backend == "memory":
+        assert await file_ids.get("b") is None
+    assert await file_ids.get("c") == "id_c"
+    await file_ids.discard("c")
+    assert await file_ids.get("c") is None
+    await file_ids.close()
+
+    if backend == "sqlite":
+        # 重新打开后仍然有效
+        file_ids = get_file_id_backend(backend, path, max_size=2, ttl=60)
+        assert await file_ids.get("a") == "id_a"
+        await file_ids.close()